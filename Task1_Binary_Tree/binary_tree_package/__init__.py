@@ -3,7 +3,6 @@ Binary Tree Package with YAML Integration
 A comprehensive package for creating, manipulating, and persisting binary trees.
 """
 
-import yaml
 from typing import Optional, Any, List
 
 
@@ -209,6 +208,37 @@ def print_tree_range(root: Optional[Node], min_value: Any, max_value: Any) -> No
     print_tree_range(root.right, min_value, max_value)
 
 
+def get_tree_range(root: Optional[Node], min_value: Any, max_value: Any) -> List[Any]:
+    """
+    Collect the values of nodes within a specified value range.
+    
+    Uses an iterative in-order traversal, so values are returned in the same
+    order print_tree_range prints them and deep trees do not hit the recursion limit.
+    
+    Args:
+        root: The root node of the tree
+        min_value: Minimum value to include
+        max_value: Maximum value to include
+        
+    Returns:
+        List of values in range, in in-order sequence
+    """
+    values = []
+    stack = []
+    current = root
+    
+    while stack or current is not None:
+        while current is not None:
+            stack.append(current)
+            current = current.left
+        current = stack.pop()
+        if min_value <= current.value <= max_value:
+            values.append(current.value)
+        current = current.right
+    
+    return values
+
+
 def edit_node_value(root: Optional[Node], old_value: Any, new_value: Any) -> bool:
     """
     Edit the value of a node in the binary tree.
@@ -245,6 +275,7 @@ def build_tree_from_yaml(yaml_file: str) -> Optional[Node]:
     Returns:
         The root node of the constructed tree, or None if file cannot be read
     """
+    import yaml
     try:
         with open(yaml_file, 'r') as file:
             data = yaml.safe_load(file)
@@ -308,6 +339,7 @@ def write_tree_to_yaml(root: Optional[Node], yaml_file: str) -> bool:
     Returns:
         True if successful, False otherwise
     """
+    import yaml
     try:
         tree_dict = _tree_to_dict(root)
         
@@ -354,6 +386,7 @@ __all__ = [
     'delete_tree',
     'print_tree',
     'print_tree_range',
+    'get_tree_range',
     'edit_node_value',
     'build_tree_from_yaml',
     'write_tree_to_yaml'
@@ -0,0 +1,9 @@
+"""
+Allows running the command line interface with ``python -m binary_tree_package``.
+"""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
@@ -0,0 +1,235 @@
+"""
+Cached Subtree Aggregates for General Trees
+Computes registered aggregates (count, sum, min, max, height, ...) for every
+subtree in one post-order pass, and keeps them up to date by recomputing only
+the ancestors of a changed node.
+"""
+
+from typing import Optional, Any, List, Dict, Callable, Sequence
+
+from .general_tree import GeneralNode, add_child_direct, find_node
+
+
+class Aggregate:
+    """
+    A subtree aggregate computed bottom-up.
+    
+    Attributes:
+        name: Name used to look the aggregate up
+        compute: Function (node value, list of child results) -> result
+    """
+    
+    def __init__(self, name: str, compute: Callable[[Any, List[Any]], Any]):
+        """
+        Initialize a new aggregate.
+        
+        Args:
+            name: Name used to look the aggregate up
+            compute: Function (node value, list of child results) -> result
+        """
+        self.name = name
+        self.compute = compute
+    
+    def __repr__(self):
+        return f"Aggregate({self.name})"
+
+
+COUNT = Aggregate('count', lambda value, children: 1 + sum(children))
+SUM = Aggregate('sum', lambda value, children: value + sum(children))
+MIN = Aggregate('min', lambda value, children: min([value] + children))
+MAX = Aggregate('max', lambda value, children: max([value] + children))
+HEIGHT = Aggregate('height', lambda value, children: 1 + max(children, default=0))
+
+DEFAULT_AGGREGATES = (COUNT, SUM, MIN, MAX, HEIGHT)
+
+
+class SubtreeAggregates:
+    """
+    Cached aggregates for every subtree of a general tree.
+    
+    Results are stored per node, keyed by node identity. Modify the tree
+    through this object, or call refresh() after changing it directly, so
+    that the cached results of the affected ancestors are updated.
+    
+    Attributes:
+        root: The root node of the tree
+        aggregates: The registered aggregates
+    """
+    
+    def __init__(self, root: Optional[GeneralNode],
+                 aggregates: Sequence[Aggregate] = DEFAULT_AGGREGATES):
+        """
+        Compute all aggregates for every subtree in one post-order pass.
+        
+        Args:
+            root: The root node of the tree
+            aggregates: Aggregates to maintain (e.g., only COUNT and HEIGHT
+                        for trees with non-numeric values)
+        """
+        self.root = root
+        self.aggregates = list(aggregates)
+        self._results: Dict[int, Dict[str, Any]] = {}
+        self._parent: Dict[int, GeneralNode] = {}
+        self._compute_subtree(root)
+    
+    def _compute_node(self, node: GeneralNode) -> None:
+        """Helper function to compute a node's results from its children's cached results."""
+        child_results = [self._results[id(child)] for child in node.children]
+        self._results[id(node)] = {
+            aggregate.name: aggregate.compute(node.value, [r[aggregate.name] for r in child_results])
+            for aggregate in self.aggregates
+        }
+    
+    def _compute_subtree(self, root: Optional[GeneralNode]) -> None:
+        """Helper function to (re)compute every node of a subtree, children first."""
+        if root is None:
+            return
+        
+        stack = [(root, False)]
+        while stack:
+            node, children_done = stack.pop()
+            if children_done:
+                self._compute_node(node)
+                continue
+            
+            stack.append((node, True))
+            for child in node.children:
+                self._parent[id(child)] = node
+                stack.append((child, False))
+    
+    def _update_ancestors(self, node: GeneralNode) -> None:
+        """Helper function to recompute the results of every ancestor of a node."""
+        parent = self._parent.get(id(node))
+        while parent is not None:
+            self._compute_node(parent)
+            parent = self._parent.get(id(parent))
+    
+    def get(self, node: GeneralNode, name: str) -> Any:
+        """
+        Get a cached aggregate for the subtree rooted at a node.
+        
+        Args:
+            node: A node of this tree
+            name: Name of the aggregate (e.g., "count")
+            
+        Returns:
+            The aggregate value
+            
+        Raises:
+            ValueError: If the node is not part of this tree
+        """
+        return self._results_for(node)[name]
+    
+    def report(self, node: Optional[GeneralNode] = None) -> Dict[str, Any]:
+        """
+        Get all cached aggregates for the subtree rooted at a node.
+        
+        Args:
+            node: A node of this tree (the root if None)
+            
+        Returns:
+            Dictionary mapping aggregate names to values (empty for an empty
+            tree)
+            
+        Raises:
+            ValueError: If the node is not part of this tree
+        """
+        if node is None:
+            if self.root is None:
+                return {}
+            node = self.root
+        return dict(self._results_for(node))
+    
+    def _results_for(self, node: GeneralNode) -> Dict[str, Any]:
+        """Helper function to get the cached results of a node of this tree."""
+        try:
+            return self._results[id(node)]
+        except KeyError:
+            raise ValueError(f"{node!r} is not part of the aggregated tree") from None
+    
+    def refresh(self, node: GeneralNode) -> None:
+        """
+        Update the cache after the subtree rooted at a node was changed directly.
+        
+        The subtree is recomputed, followed by the node's ancestors only.
+        
+        Args:
+            node: The node whose value or descendants changed
+        """
+        self._compute_subtree(node)
+        self._update_ancestors(node)
+    
+    def add_child_direct(self, node: GeneralNode, value: Any) -> GeneralNode:
+        """
+        Add a child directly to a node and update the ancestors' aggregates.
+        
+        Args:
+            node: The parent node
+            value: The value for the new child
+            
+        Returns:
+            The newly created child node
+        """
+        child = add_child_direct(node, value)
+        self._parent[id(child)] = node
+        self._compute_node(child)
+        self._compute_node(node)
+        self._update_ancestors(node)
+        return child
+    
+    def add_child_by_path(self, path: List[int], value: Any) -> bool:
+        """
+        Add a child node using a path of child indices and update the aggregates.
+        
+        Args:
+            path: A list of integers indicating which child to follow at each level
+            value: The value for the new node
+            
+        Returns:
+            True if node was added successfully, False otherwise
+        """
+        if self.root is None:
+            return False
+        
+        current = self.root
+        for i, child_index in enumerate(path):
+            if child_index >= len(current.children):
+                print(f"Cannot add node: invalid child index {child_index} at level {i}")
+                return False
+            current = current.children[child_index]
+        
+        self.add_child_direct(current, value)
+        return True
+    
+    def edit_general_node_value(self, old_value: Any, new_value: Any) -> bool:
+        """
+        Edit the value of a node and update the aggregates of its ancestors.
+        
+        Args:
+            old_value: The current value to find
+            new_value: The new value to set
+            
+        Returns:
+            True if the value was found and updated, False otherwise
+        """
+        node = find_node(self.root, old_value)
+        if node is None:
+            return False
+        
+        node.value = new_value
+        self._compute_node(node)
+        self._update_ancestors(node)
+        return True
+
+
+# Export all public functions
+__all__ = [
+    'Aggregate',
+    'COUNT',
+    'SUM',
+    'MIN',
+    'MAX',
+    'HEIGHT',
+    'DEFAULT_AGGREGATES',
+    'SubtreeAggregates'
+]
@@ -0,0 +1,195 @@
+"""
+Binary Tree Balancing
+Height / balance-factor reporting and in-place Day-Stout-Warren rebalancing.
+
+Heights count nodes on the longest root-to-leaf path: an empty tree has
+height 0 and a single node has height 1.
+"""
+
+from collections import deque
+from typing import Optional, Any, Dict, Tuple
+
+from . import Node
+
+
+def _size_and_height(root: Optional[Node]) -> Tuple[int, int]:
+    """
+    Helper function to count nodes and levels with a level-order walk.
+    
+    Args:
+        root: The root node of the tree
+        
+    Returns:
+        Tuple of (number of nodes, height)
+    """
+    if root is None:
+        return 0, 0
+    
+    size = 0
+    height = 0
+    level = deque([root])
+    while level:
+        height += 1
+        for _ in range(len(level)):
+            node = level.popleft()
+            size += 1
+            if node.left is not None:
+                level.append(node.left)
+            if node.right is not None:
+                level.append(node.right)
+    
+    return size, height
+
+
+def tree_height(root: Optional[Node]) -> int:
+    """
+    Get the height of a binary tree without recursion.
+    
+    Args:
+        root: The root node of the tree
+        
+    Returns:
+        Number of nodes on the longest root-to-leaf path (0 for an empty tree)
+    """
+    return _size_and_height(root)[1]
+
+
+def balance_factor(root: Optional[Node]) -> int:
+    """
+    Get the balance factor of a node.
+    
+    Args:
+        root: The node to inspect
+        
+    Returns:
+        Height of the left subtree minus height of the right subtree
+    """
+    if root is None:
+        return 0
+    return tree_height(root.left) - tree_height(root.right)
+
+
+def minimal_height(size: int) -> int:
+    """
+    Get the smallest possible height of a binary tree with the given number of nodes.
+    
+    Args:
+        size: Number of nodes
+        
+    Returns:
+        ceil(log2(size + 1))
+    """
+    return size.bit_length()
+
+
+def balance_report(root: Optional[Node]) -> Dict[str, Any]:
+    """
+    Report how far a binary tree is from minimal height, in O(n) time.
+    
+    Args:
+        root: The root node of the tree
+        
+    Returns:
+        Dictionary with "size", "height", "minimal_height", "balance_factor"
+        and "skew" (height divided by minimal height, 1.0 when optimal)
+    """
+    size, height = _size_and_height(root)
+    best = minimal_height(size)
+    
+    return {
+        'size': size,
+        'height': height,
+        'minimal_height': best,
+        'balance_factor': balance_factor(root),
+        'skew': height / best if best else 1.0,
+    }
+
+
+def _tree_to_vine(pseudo_root: Node) -> int:
+    """
+    Helper function to turn the tree under pseudo_root.right into a right-leaning vine.
+    
+    Args:
+        pseudo_root: Temporary node whose right child is the tree root
+        
+    Returns:
+        The number of nodes in the tree
+    """
+    size = 0
+    tail = pseudo_root
+    rest = tail.right
+    
+    while rest is not None:
+        if rest.left is None:
+            tail = rest
+            rest = rest.right
+            size += 1
+        else:
+            # Rotate right around rest
+            temp = rest.left
+            rest.left = temp.right
+            temp.right = rest
+            rest = temp
+            tail.right = temp
+    
+    return size
+
+
+def _compress(pseudo_root: Node, count: int) -> None:
+    """
+    Helper function to perform count left rotations along the vine.
+    
+    Args:
+        pseudo_root: Temporary node whose right child is the vine
+        count: Number of rotations
+    """
+    scanner = pseudo_root
+    for _ in range(count):
+        child = scanner.right
+        scanner.right = child.right
+        scanner = scanner.right
+        child.right = scanner.left
+        scanner.left = child
+
+
+def rebalance(root: Optional[Node]) -> Optional[Node]:
+    """
+    Rebalance a binary tree to minimal height in place (Day-Stout-Warren).
+    
+    Runs in O(n) time with O(1) extra space and keeps the in-order sequence
+    of values unchanged. Existing nodes are relinked, not copied.
+    
+    Args:
+        root: The root node of the tree
+        
+    Returns:
+        The new root of the rebalanced tree
+    """
+    if root is None:
+        return None
+    
+    pseudo_root = Node(None)
+    pseudo_root.right = root
+    
+    size = _tree_to_vine(pseudo_root)
+    
+    # Leaves in the bottom level that is not completely filled
+    leaves = size + 1 - (1 << ((size + 1).bit_length() - 1))
+    _compress(pseudo_root, leaves)
+    
+    remaining = size - leaves
+    while remaining > 1:
+        remaining //= 2
+        _compress(pseudo_root, remaining)
+    
+    return pseudo_root.right
+
+
+# Export all public functions
+__all__ = [
+    'tree_height',
+    'balance_factor',
+    'minimal_height',
+    'balance_report',
+    'rebalance'
+]
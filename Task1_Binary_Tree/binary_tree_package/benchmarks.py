@@ -0,0 +1,592 @@
+"""
+Benchmarks for the Binary Tree Package
+Timing helpers comparing the package's tree operations on synthetic trees.
+
+Run with: python -m binary_tree_package.benchmarks [size]
+"""
+
+import copy
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+from . import Node, add_node_by_path, build_tree_from_yaml, create_binary_tree, write_tree_to_yaml
+from .balance import balance_report, rebalance
+from .builders import balanced_tree_from_sorted, general_tree_from_parent_table
+from .clone import clone_tree
+from .general_tree import (
+    GeneralNode,
+    add_child_by_path,
+    build_general_tree_from_yaml,
+    find_node,
+    find_node_bfs,
+    find_nodes,
+    write_general_tree_to_yaml,
+)
+from .indexed_tree import IndexedGeneralTree
+from .lca_index import AncestryIndex
+from .conversion import general_to_binary, binary_to_general
+from .concurrent_tree import ReadWriteLock, ConcurrentTree
+from .hashcons import hash_cons, sharing_report
+from .serialization import available_formats, write_tree, read_tree, read_general_tree
+from .streaming import iter_general_tree_records
+
+
+def _time_call(func: Callable[[], Any], repeat: int) -> float:
+    """
+    Helper function to time a call, keeping the best of several runs.
+    
+    Args:
+        func: Zero-argument function to time
+        repeat: Number of runs
+        
+    Returns:
+        The fastest run time in seconds
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def make_binary_tree(size: int) -> Node:
+    """
+    Build a complete binary tree with values 0..size-1 in level order.
+    
+    Args:
+        size: Number of nodes (at least 1)
+        
+    Returns:
+        The root node of the tree
+    """
+    root = Node(0)
+    queue = deque([root])
+    value = 1
+    while value < size:
+        node = queue.popleft()
+        node.left = Node(value)
+        queue.append(node.left)
+        value += 1
+        if value < size:
+            node.right = Node(value)
+            queue.append(node.right)
+            value += 1
+    return root
+
+
+def make_general_tree(size: int, fanout: int = 4) -> GeneralNode:
+    """
+    Build a complete general tree with values 0..size-1 in level order.
+    
+    Args:
+        size: Number of nodes (at least 1)
+        fanout: Number of children per internal node
+        
+    Returns:
+        The root node of the tree
+    """
+    root = GeneralNode(0)
+    queue = deque([root])
+    value = 1
+    while value < size:
+        node = queue.popleft()
+        for _ in range(min(fanout, size - value)):
+            child = GeneralNode(value)
+            node.add_child(child)
+            queue.append(child)
+            value += 1
+    return root
+
+
+def bench_serialization(size: int = 10000, repeat: int = 3) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """
+    Compare every serialization backend with the original YAML functions.
+    
+    Args:
+        size: Number of nodes in the synthetic trees
+        repeat: Number of runs per measurement (the best is kept)
+        
+    Returns:
+        Nested dictionary: tree kind -> backend -> {"write", "read", "bytes"}
+    """
+    results: Dict[str, Dict[str, Dict[str, float]]] = {}
+    extensions = {'yaml': '.yaml', 'json': '.json', 'msgpack': '.msgpack'}
+    
+    cases = [
+        ('binary', make_binary_tree(size), write_tree_to_yaml, build_tree_from_yaml, read_tree),
+        ('general', make_general_tree(size), write_general_tree_to_yaml,
+         build_general_tree_from_yaml, read_general_tree),
+    ]
+    
+    with tempfile.TemporaryDirectory() as directory:
+        for kind, root, legacy_write, legacy_read, reader in cases:
+            kind_results = {}
+            
+            path = os.path.join(directory, f"{kind}_legacy.yaml")
+            kind_results['yaml (original)'] = {
+                'write': _time_call(lambda: legacy_write(root, path), repeat),
+                'read': _time_call(lambda: legacy_read(path), repeat),
+                'bytes': os.path.getsize(path),
+            }
+            
+            for fmt in available_formats():
+                path = os.path.join(directory, f"{kind}{extensions.get(fmt, '.' + fmt)}")
+                kind_results[fmt] = {
+                    'write': _time_call(lambda: write_tree(root, path, fmt), repeat),
+                    'read': _time_call(lambda: reader(path, fmt), repeat),
+                    'bytes': os.path.getsize(path),
+                }
+            
+            results[kind] = kind_results
+    
+    return results
+
+
+def bench_bulk_build(size: int = 10000, repeat: int = 3) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """
+    Compare the bulk builders with building the same trees by repeated insertion.
+    
+    Args:
+        size: Number of nodes in the synthetic trees
+        repeat: Number of runs per measurement (the best is kept)
+        
+    Returns:
+        Nested dictionary: tree kind -> implementation -> {"time"}
+    """
+    records = list(iter_general_tree_records(make_general_tree(size)))
+    ids = [r['id'] for r in records]
+    parent_ids = [r['parent_id'] for r in records]
+    values = [r['value'] for r in records]
+    
+    # Child-index path of every node, for the add_child_by_path baseline
+    paths = {0: []}
+    child_counts = {}
+    for r in records[1:]:
+        index = child_counts.get(r['parent_id'], 0)
+        child_counts[r['parent_id']] = index + 1
+        paths[r['id']] = paths[r['parent_id']] + [index]
+    
+    def insert_general() -> None:
+        root = GeneralNode(values[0])
+        for r in records[1:]:
+            add_child_by_path(root, paths[r['parent_id']], r['value'])
+    
+    sorted_values = list(range(size))
+    # Level-order (path, value) pairs of the balanced tree, for the add_node_by_path baseline
+    insertions = []
+    queue = deque([(balanced_tree_from_sorted(sorted_values), "")])
+    while queue:
+        node, path = queue.popleft()
+        insertions.append((path, node.value))
+        if node.left is not None:
+            queue.append((node.left, path + "L"))
+        if node.right is not None:
+            queue.append((node.right, path + "R"))
+    
+    def insert_binary() -> None:
+        root = create_binary_tree(insertions[0][1])
+        for path, value in insertions[1:]:
+            add_node_by_path(root, path, value)
+    
+    return {
+        'general tree': {
+            'add_child_by_path': {'time': _time_call(insert_general, repeat)},
+            'parent table': {'time': _time_call(
+                lambda: general_tree_from_parent_table(ids, parent_ids, values), repeat)},
+        },
+        'balanced binary tree': {
+            'add_node_by_path': {'time': _time_call(insert_binary, repeat)},
+            'from sorted': {'time': _time_call(lambda: balanced_tree_from_sorted(sorted_values), repeat)},
+        },
+    }
+
+
+def bench_rebalance(size: int = 10000, repeat: int = 3) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """
+    Measure balance_report and rebalance on a degenerate (linked-list) tree.
+    
+    Args:
+        size: Number of nodes in the synthetic tree
+        repeat: Number of runs per measurement (the best is kept)
+        
+    Returns:
+        Nested dictionary: operation -> tree shape -> {"time", "height"}
+    """
+    def make_chain() -> Node:
+        root = Node(0)
+        node = root
+        for value in range(1, size):
+            node.right = Node(value)
+            node = node.right
+        return root
+    
+    chain = make_chain()
+    balanced = rebalance(make_chain())
+    
+    rebalance_time = float('inf')
+    for _ in range(repeat):
+        root = make_chain()
+        start = time.perf_counter()
+        root = rebalance(root)
+        rebalance_time = min(rebalance_time, time.perf_counter() - start)
+    
+    return {
+        'balance_report': {
+            'chain': {'time': _time_call(lambda: balance_report(chain), repeat),
+                      'height': balance_report(chain)['height']},
+            'balanced': {'time': _time_call(lambda: balance_report(balanced), repeat),
+                         'height': balance_report(balanced)['height']},
+        },
+        'rebalance': {
+            'chain': {'time': rebalance_time, 'height': balance_report(root)['height']},
+        },
+    }
+
+
+def bench_conversion(size: int = 10000, repeat: int = 3) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """
+    Compare the GeneralNode <-> Node conversions with a round trip through YAML.
+    
+    Args:
+        size: Number of nodes in the synthetic tree
+        repeat: Number of runs per measurement (the best is kept)
+        
+    Returns:
+        Nested dictionary: operation -> implementation -> {"time"}
+    """
+    root = make_general_tree(size)
+    binary = general_to_binary(root)
+    
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "general.yaml")
+        
+        def yaml_round_trip() -> None:
+            write_general_tree_to_yaml(root, path)
+            build_general_tree_from_yaml(path)
+        
+        yaml_time = _time_call(yaml_round_trip, repeat)
+    
+    return {
+        'round trip': {
+            'via YAML': {'time': yaml_time},
+            'general_to_binary + back': {'time': _time_call(
+                lambda: binary_to_general(general_to_binary(root)), repeat)},
+        },
+        'one way': {
+            'general_to_binary': {'time': _time_call(lambda: general_to_binary(root), repeat)},
+            'binary_to_general': {'time': _time_call(lambda: binary_to_general(binary), repeat)},
+        },
+    }
+
+
+def bench_ancestry(size: int = 10000, queries: int = 1000, repeat: int = 3) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """
+    Measure AncestryIndex build time and LCA / ancestor query time.
+    
+    Args:
+        size: Number of nodes in the synthetic tree
+        queries: Number of node pairs queried
+        repeat: Number of runs per measurement (the best is kept)
+        
+    Returns:
+        Nested dictionary: operation -> implementation -> {"time"}
+    """
+    root = make_general_tree(size)
+    index = AncestryIndex(root)
+    rng = random.Random(0)
+    pairs = [(index.find_node(rng.randrange(size)), index.find_node(rng.randrange(size)))
+             for _ in range(queries)]
+    
+    def build() -> None:
+        index.invalidate()
+        index.find_node(0)
+    
+    return {
+        'build': {
+            'AncestryIndex': {'time': _time_call(build, repeat)},
+        },
+        f'{queries} queries': {
+            'lca': {'time': _time_call(lambda: [index.lca(a, b) for a, b in pairs], repeat)},
+            'is_ancestor': {'time': _time_call(lambda: [index.is_ancestor(a, b) for a, b in pairs], repeat)},
+        },
+    }
+
+
+def bench_indexed(size: int = 10000, lookups: int = 200, repeat: int = 3) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """
+    Compare IndexedGeneralTree with the search-based general tree functions.
+    
+    Args:
+        size: Number of nodes in the synthetic tree
+        lookups: Number of find / insert operations per measurement
+        repeat: Number of runs per measurement (the best is kept)
+        
+    Returns:
+        Nested dictionary: operation -> implementation -> {"time"}
+    """
+    root = make_general_tree(size)
+    plain_root = make_general_tree(size)
+    indexed = IndexedGeneralTree(make_general_tree(size))
+    rng = random.Random(0)
+    targets = [rng.randrange(size) for _ in range(lookups)]
+    # The deepest first-child chain, so every insertion walks the full depth
+    parent_path = []
+    node = root
+    while node.children:
+        parent_path.append(0)
+        node = node.children[0]
+    
+    return {
+        'find': {
+            'find_node': {'time': _time_call(lambda: [find_node(root, v) for v in targets], repeat)},
+            'indexed': {'time': _time_call(lambda: [indexed.find_node(v) for v in targets], repeat)},
+        },
+        'insert under same parent': {
+            'add_child_by_path': {'time': _time_call(
+                lambda: [add_child_by_path(plain_root, parent_path, -i) for i in range(lookups)], 1)},
+            'indexed': {'time': _time_call(
+                lambda: [indexed.add_child_by_path(parent_path, -i) for i in range(lookups)], 1)},
+        },
+        'build index': {
+            'indexed': {'time': _time_call(lambda: IndexedGeneralTree(root), repeat)},
+        },
+    }
+
+
+def bench_batch_find(size: int = 10000, lookups: int = 100, repeat: int = 3) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """
+    Compare repeated find_node calls with a single find_nodes traversal.
+    
+    Args:
+        size: Number of nodes in the synthetic tree
+        lookups: Number of values to locate
+        repeat: Number of runs per measurement (the best is kept)
+        
+    Returns:
+        Nested dictionary: operation -> implementation -> {"time"}
+    """
+    root = make_general_tree(size)
+    rng = random.Random(0)
+    targets = [rng.randrange(size) for _ in range(lookups)]
+    
+    return {
+        f'locate {lookups} values': {
+            'find_node loop': {'time': _time_call(lambda: [find_node(root, v) for v in targets], repeat)},
+            'find_nodes': {'time': _time_call(lambda: find_nodes(root, targets), repeat)},
+        },
+        'shallow value (depth 2)': {
+            'find_node': {'time': _time_call(lambda: find_node(root, 20), repeat)},
+            'find_node_bfs': {'time': _time_call(lambda: find_node_bfs(root, 20, max_depth=2), repeat)},
+        },
+    }
+
+
+class _MutexLock(ReadWriteLock):
+    """Baseline lock that serialises readers as well as writers."""
+    
+    def acquire_read(self) -> None:
+        self.acquire_write()
+    
+    def release_read(self) -> None:
+        self.release_write()
+
+
+def _run_mixed_workload(tree: ConcurrentTree, size: int, threads: int,
+                        operations: int, read_ratio: float) -> Tuple[float, int, int]:
+    """
+    Helper function to run a mixed read/write workload on a shared tree.
+    
+    Args:
+        tree: The shared tree (values 0..size-1)
+        size: Number of nodes in the tree
+        threads: Number of worker threads
+        operations: Number of operations per thread
+        read_ratio: Fraction of operations that are range queries
+        
+    Returns:
+        Tuple of (elapsed seconds, read count, write count)
+    """
+    counts = [[0, 0] for _ in range(threads)]
+    
+    def worker(index: int) -> None:
+        rng = random.Random(index)
+        # Each thread toggles its own value, so writers never conflict logically
+        value, other = index, -(index + 1)
+        for _ in range(operations):
+            if rng.random() < read_ratio:
+                tree.get_tree_range(size // 4, size // 2)
+                counts[index][0] += 1
+            else:
+                tree.edit_node_value(value, other)
+                value, other = other, value
+                counts[index][1] += 1
+    
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    start = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    
+    return elapsed, sum(c[0] for c in counts), sum(c[1] for c in counts)
+
+
+def bench_concurrent(size: int = 10000, threads: int = 8, operations: int = 50,
+                     read_ratios: Tuple[float, ...] = (0.99, 0.9, 0.5)) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """
+    Measure ConcurrentTree throughput for different read/write ratios.
+    
+    The reader-writer lock is compared with a plain mutex that serialises
+    readers too.
+    
+    Args:
+        size: Number of nodes in the shared tree
+        threads: Number of worker threads
+        operations: Number of operations per thread
+        read_ratios: Fractions of operations that are range queries
+        
+    Returns:
+        Nested dictionary: read ratio -> lock kind -> {"ops_per_sec", "reads", "writes"}
+    """
+    results: Dict[str, Dict[str, Dict[str, float]]] = {}
+    
+    for ratio in read_ratios:
+        ratio_results = {}
+        for label, lock in (('rwlock', ReadWriteLock()), ('mutex', _MutexLock())):
+            tree = ConcurrentTree(make_binary_tree(size), lock=lock)
+            elapsed, reads, writes = _run_mixed_workload(tree, size, threads, operations, ratio)
+            ratio_results[label] = {
+                'ops_per_sec': int((reads + writes) / elapsed),
+                'reads': reads,
+                'writes': writes,
+            }
+        results[f"{int(ratio * 100)}% reads"] = ratio_results
+    
+    return results
+
+
+def bench_hashcons(size: int = 10000, template_size: int = 50,
+                   repeat: int = 3) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """
+    Measure hash-consing on a tree made of repeated copies of one template subtree.
+    
+    Args:
+        size: Approximate number of nodes in the synthetic tree
+        template_size: Number of nodes in the repeated template
+        repeat: Number of runs per measurement (the best is kept)
+        
+    Returns:
+        Nested dictionary: measurement -> representation -> metrics
+    """
+    root = GeneralNode('case')
+    for i in range(max(1, size // template_size)):
+        # Each copy gets its own label, so only the templates below it are shared
+        copy = GeneralNode(f"patch{i}")
+        copy.add_child(make_general_tree(template_size))
+        root.add_child(copy)
+    
+    shared = hash_cons(root)
+    report = sharing_report(shared, available_formats())
+    
+    results = {
+        'hash_cons': {'time': {'time': _time_call(lambda: hash_cons(root), repeat)}},
+        'nodes': {
+            'plain': {'count': report['nodes']},
+            'shared': {'count': report['unique_nodes']},
+        },
+        'memory': {
+            'plain': {'bytes': report['tree_bytes']},
+            'shared': {'bytes': report['shared_bytes']},
+        },
+    }
+    for fmt in available_formats():
+        results[f'{fmt} file'] = {
+            'plain': {'bytes': report[f'{fmt}_bytes']},
+            'shared': {'bytes': report[f'shared_{fmt}_bytes']},
+        }
+    
+    return results
+
+
+def bench_clone(size: int = 10000, repeat: int = 3) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """
+    Compare clone_tree with copy.deepcopy.
+    
+    Args:
+        size: Number of nodes in the synthetic trees
+        repeat: Number of runs per measurement (the best is kept)
+        
+    Returns:
+        Nested dictionary: tree kind -> implementation -> {"time"}
+    """
+    results = {}
+    for kind, root in (('binary', make_binary_tree(size)), ('general', make_general_tree(size))):
+        results[kind] = {
+            'copy.deepcopy': {'time': _time_call(lambda: copy.deepcopy(root), repeat)},
+            'clone_tree': {'time': _time_call(lambda: clone_tree(root), repeat)},
+            'clone_tree (values)': {'time': _time_call(lambda: clone_tree(root, copy_values=True), repeat)},
+        }
+    return results
+
+
+def print_results(title: str, results: Dict[str, Dict[str, Dict[str, float]]]) -> None:
+    """
+    Print benchmark results as a table.
+    
+    Args:
+        title: Heading printed above the table
+        results: Nested dictionary: group -> label -> metric -> value
+    """
+    print("=" * 60)
+    print(title)
+    print("=" * 60)
+    for group, rows in results.items():
+        print(f"[{group}]")
+        for label, metrics in rows.items():
+            cells = []
+            for metric, value in metrics.items():
+                if isinstance(value, float):
+                    cells.append(f"{metric}={value * 1000:.2f}ms")
+                else:
+                    cells.append(f"{metric}={value}")
+            print(f"  {label:<20} " + "  ".join(cells))
+    print()
+
+
+BENCHMARKS: Dict[str, Tuple[str, Callable[..., Any]]] = {
+    'serialization': ("Serialization Backends", bench_serialization),
+    'bulk_build': ("Bulk Construction", bench_bulk_build),
+    'rebalance': ("Rebalancing", bench_rebalance),
+    'conversion': ("General <-> Binary Conversion", bench_conversion),
+    'indexed': ("Indexed General Tree", bench_indexed),
+    'ancestry': ("Ancestry Index", bench_ancestry),
+    'batch_find': ("Batch and Bounded-Depth Search", bench_batch_find),
+    'concurrent': ("Concurrent Tree Throughput", bench_concurrent),
+    'hashcons': ("Hash-Consed Subtree Sharing", bench_hashcons),
+    'clone': ("Tree Cloning", bench_clone),
+}
+
+
+def run_benchmarks(size: int = 10000, names: Optional[Sequence[str]] = None) -> None:
+    """
+    Run the built-in benchmarks and print their results.
+    
+    Args:
+        size: Number of nodes in the synthetic trees
+        names: Keys of BENCHMARKS to run, in order (all of them if None)
+    """
+    for name in (BENCHMARKS if names is None else names):
+        title, bench = BENCHMARKS[name]
+        print_results(f"{title} (size={size})", bench(size))
+
+
+if __name__ == "__main__":
+    run_benchmarks(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -0,0 +1,155 @@
+"""
+Bulk Tree Builders
+Linear-time construction of general trees from parent-pointer tables and of
+height-balanced binary trees from sorted sequences.
+"""
+
+import csv
+from typing import Optional, Any, Dict, Sequence
+
+from . import Node
+from .general_tree import GeneralNode
+
+
+def general_tree_from_parent_table(ids: Sequence[Any], parent_ids: Sequence[Any],
+                                   values: Sequence[Any]) -> Optional[GeneralNode]:
+    """
+    Build a general tree from a parent-pointer (edge list) table in O(n).
+    
+    Rows may appear in any order; children keep the order of their rows.
+    Exactly one row must have a parent id of None (or an empty string), the root,
+    and every other row must be reachable from it (no parent cycles).
+    
+    Args:
+        ids: Unique id of each node
+        parent_ids: Id of each node's parent (None or "" for the root)
+        values: Value of each node
+        
+    Returns:
+        The root node of the constructed tree, or None if the table is invalid
+    """
+    if not len(ids) == len(parent_ids) == len(values):
+        print("Error: ids, parent_ids and values must have the same length")
+        return None
+    
+    nodes: Dict[Any, GeneralNode] = {}
+    for node_id, value in zip(ids, values):
+        if node_id in nodes:
+            print(f"Error: duplicate node id {node_id!r}")
+            return None
+        nodes[node_id] = GeneralNode(value)
+    
+    root = None
+    for node_id, parent_id in zip(ids, parent_ids):
+        node = nodes[node_id]
+        if parent_id is None or parent_id == '':
+            if root is not None:
+                print(f"Error: more than one root (node id {node_id!r})")
+                return None
+            root = node
+            continue
+        
+        parent = nodes.get(parent_id)
+        if parent is None:
+            print(f"Error: node id {node_id!r} has unknown parent {parent_id!r}")
+            return None
+        parent.children.append(node)
+    
+    if root is None:
+        print("Error: table has no root row")
+        return None
+    
+    # Rows in a parent cycle are linked to each other but never to the root
+    reached = 0
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        reached += 1
+        stack.extend(node.children)
+    
+    if reached != len(nodes):
+        print(f"Error: {len(nodes) - reached} row(s) are not reachable from the root "
+              f"(parent cycle)")
+        return None
+    
+    return root
+
+
+def general_tree_from_csv(csv_file: str, id_column: str = 'id', parent_column: str = 'parent_id',
+                          value_column: str = 'value') -> Optional[GeneralNode]:
+    """
+    Build a general tree from a CSV edge list with a header row.
+    
+    All columns are read as strings; the root row has an empty parent column.
+    
+    Args:
+        csv_file: Path to the CSV file
+        id_column: Name of the node id column
+        parent_column: Name of the parent id column
+        value_column: Name of the value column
+        
+    Returns:
+        The root node of the constructed tree, or None if file cannot be read
+    """
+    ids, parent_ids, values = [], [], []
+    
+    try:
+        with open(csv_file, 'r', newline='') as file:
+            for row in csv.DictReader(file):
+                ids.append(row[id_column])
+                parent_ids.append(row[parent_column])
+                values.append(row[value_column])
+    except FileNotFoundError:
+        print(f"Error: File '{csv_file}' not found")
+        return None
+    except (KeyError, csv.Error) as e:
+        print(f"Error parsing CSV file: {e}")
+        return None
+    
+    return general_tree_from_parent_table(ids, parent_ids, values)
+
+
+def balanced_tree_from_sorted(values: Sequence[Any]) -> Optional[Node]:
+    """
+    Build a height-balanced binary tree from a sorted sequence in O(n).
+    
+    The middle element of each range becomes the subtree root, so an in-order
+    traversal returns the values in their original order.
+    
+    Args:
+        values: Values in sorted (in-order) sequence
+        
+    Returns:
+        The root node of the tree, or None for an empty sequence
+    """
+    if not values:
+        return None
+    
+    mid = (len(values) - 1) // 2
+    root = Node(values[mid])
+    # Each entry: (node, first index of its range, last index of its range)
+    stack = [(root, 0, len(values) - 1)]
+    
+    while stack:
+        node, low, high = stack.pop()
+        mid = (low + high) // 2
+        
+        if low <= mid - 1:
+            left_mid = (low + mid - 1) // 2
+            node.left = Node(values[left_mid])
+            stack.append((node.left, low, mid - 1))
+        
+        if mid + 1 <= high:
+            right_mid = (mid + 1 + high) // 2
+            node.right = Node(values[right_mid])
+            stack.append((node.right, mid + 1, high))
+    
+    return root
+
+
+# Export all public functions
+__all__ = [
+    'general_tree_from_parent_table',
+    'general_tree_from_csv',
+    'balanced_tree_from_sorted'
+]
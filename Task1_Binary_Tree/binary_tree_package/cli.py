@@ -0,0 +1,484 @@
+"""
+Command Line Interface
+The ``binary-tree`` console script with convert, query, stats and bench subcommands.
+
+Only argparse and json are imported at startup. PyYAML, the serialization
+backends and the benchmarks are imported inside the subcommands that use them,
+so ``binary-tree --help`` and NDJSON/JSON conversions start quickly.
+
+Paths may be "-" for stdin/stdout. Binary tree paths are strings of 'L'/'R'
+characters; general tree paths are comma-separated child indices (e.g., "0,2").
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import Optional, Any, List, Sequence, Tuple
+
+FORMATS = ['yaml', 'json', 'msgpack', 'ndjson']
+
+_NDJSON_EXTENSIONS = ('.ndjson', '.jsonl')
+
+
+def _parse_value(text: str) -> Any:
+    """
+    Helper function to turn a command line argument into a tree value.
+    
+    Args:
+        text: The argument (e.g., "5", "2.5", "true" or "apple")
+        
+    Returns:
+        The JSON value if the argument is valid JSON, otherwise the string itself
+    """
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+def _resolve_format(file_path: str, fmt: Optional[str]) -> Optional[str]:
+    """
+    Helper function to pick the format for a path.
+    
+    Args:
+        file_path: Path to the file ("-" for a standard stream)
+        fmt: Format given on the command line, if any
+        
+    Returns:
+        The format name, or None to let the serialization module detect it
+    """
+    if fmt is not None:
+        return fmt
+    if os.path.splitext(file_path)[1].lower() in _NDJSON_EXTENSIONS:
+        return 'ndjson'
+    return None
+
+
+def _is_binary_dict(data: Any) -> bool:
+    """Helper function to check whether a loaded root dictionary uses the binary schema."""
+    return isinstance(data, dict) and ('left' in data or 'right' in data)
+
+
+def _load_data(file_path: str, fmt: Optional[str]) -> Optional[Any]:
+    """
+    Helper function to load the nested tree dictionary from any supported format.
+    
+    Args:
+        file_path: Path to the input file ("-" for stdin)
+        fmt: Format name, or None to detect it
+        
+    Returns:
+        The nested dictionary, or None if the file cannot be read
+    """
+    if fmt == 'ndjson':
+        from .streaming import _open_text, _records_to_dict, read_records
+        try:
+            file = _open_text(file_path, 'r')
+            try:
+                return _records_to_dict(read_records(file))
+            finally:
+                if file is not sys.stdin:
+                    file.close()
+        except FileNotFoundError:
+            print(f"Error: File '{file_path}' not found", file=sys.stderr)
+            return None
+        except OSError as e:
+            print(f"Error reading NDJSON file: {e}", file=sys.stderr)
+            return None
+        except (ValueError, KeyError) as e:
+            print(f"Error parsing NDJSON file: {e}", file=sys.stderr)
+            return None
+    
+    from .serialization import _load_dict
+    return _load_dict(file_path, fmt)
+
+
+def _dump_data(data: Any, file_path: str, fmt: Optional[str]) -> bool:
+    """
+    Helper function to write a nested tree dictionary in any supported format.
+    
+    Args:
+        data: The nested dictionary
+        file_path: Path to the output file ("-" for stdout)
+        fmt: Format name, or None to detect it from the extension
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    if fmt == 'ndjson':
+        from .streaming import _iter_dict_records, _open_text, write_records
+        if _is_binary_dict(data):
+            print("Error: NDJSON stores general trees only", file=sys.stderr)
+            return False
+        try:
+            output = _open_text(file_path, 'w')
+            try:
+                write_records(_iter_dict_records(data), output)
+            finally:
+                if output is not sys.stdout:
+                    output.close()
+        except OSError as e:
+            print(f"Error writing to NDJSON file: {e}", file=sys.stderr)
+            return False
+        return True
+    
+    from .serialization import _dump_dict
+    return _dump_dict(data, file_path, fmt)
+
+
+def _load_tree(file_path: str, fmt: Optional[str], kind: Optional[str]) -> Tuple[Any, str]:
+    """
+    Helper function to build a binary or general tree from a file.
+    
+    Args:
+        file_path: Path to the input file ("-" for stdin)
+        fmt: Format name, or None to detect it
+        kind: "binary" or "general", or None to detect it from the data
+        
+    Returns:
+        Tuple of (root node or None, kind)
+    """
+    fmt = _resolve_format(file_path, fmt)
+    data = _load_data(file_path, fmt)
+    
+    if kind is None:
+        kind = 'binary' if _is_binary_dict(data) else 'general'
+    if data is None:
+        return None, kind
+    
+    if kind == 'binary':
+        from . import _build_tree_recursive
+        return _build_tree_recursive(data), kind
+    
+    from .general_tree import _build_general_tree_recursive
+    return _build_general_tree_recursive(data), kind
+
+
+def _format_path(path: List[Any], kind: str) -> str:
+    """Helper function to format a path the way the query subcommand accepts it."""
+    if kind == 'binary':
+        return ''.join(path)
+    return ','.join(str(index) for index in path)
+
+
+def _find_path(root: Any, value: Any, kind: str) -> Optional[List[Any]]:
+    """
+    Helper function to find the path to the first node with a value, in pre-order.
+    
+    Args:
+        root: The root node of the tree
+        value: The value to search for
+        kind: "binary" or "general"
+        
+    Returns:
+        List of directions ('L'/'R') or child indices, or None if not found
+    """
+    if root is None:
+        return None
+    
+    stack = [(root, [])]
+    while stack:
+        node, path = stack.pop()
+        if node.value == value:
+            return path
+        
+        if kind == 'binary':
+            if node.right is not None:
+                stack.append((node.right, path + ['R']))
+            if node.left is not None:
+                stack.append((node.left, path + ['L']))
+        else:
+            for index in range(len(node.children) - 1, -1, -1):
+                stack.append((node.children[index], path + [index]))
+    
+    return None
+
+
+def _follow_path(root: Any, path: str, kind: str) -> Optional[Any]:
+    """
+    Helper function to get the node at a path.
+    
+    Args:
+        root: The root node of the tree
+        path: 'L'/'R' string or comma-separated child indices ("" for the root)
+        kind: "binary" or "general"
+        
+    Returns:
+        The node at the path, or None if the path is invalid
+    """
+    current = root
+    
+    if kind == 'binary':
+        for direction in path:
+            if direction == 'L':
+                current = current.left if current is not None else None
+            elif direction == 'R':
+                current = current.right if current is not None else None
+            else:
+                print(f"Invalid direction '{direction}' in path", file=sys.stderr)
+                return None
+        return current
+    
+    for i, part in enumerate(path.split(',') if path else []):
+        try:
+            child_index = int(part)
+        except ValueError:
+            print(f"Invalid child index '{part}' in path", file=sys.stderr)
+            return None
+        if not 0 <= child_index < len(current.children):
+            print(f"Invalid child index {child_index} at level {i}", file=sys.stderr)
+            return None
+        current = current.children[child_index]
+    
+    return current
+
+
+def _general_range(root: Any, min_value: Any, max_value: Any) -> List[Any]:
+    """Helper function to collect general tree values within a range, in pre-order."""
+    values = []
+    stack = [root] if root is not None else []
+    while stack:
+        node = stack.pop()
+        try:
+            if min_value <= node.value <= max_value:
+                values.append(node.value)
+        except TypeError:
+            # Values that cannot be compared with the bounds are not in range
+            pass
+        stack.extend(reversed(node.children))
+    return values
+
+
+def cmd_convert(args: argparse.Namespace) -> int:
+    """
+    Convert a tree file between YAML, JSON, MessagePack and NDJSON.
+    
+    NDJSON to NDJSON is streamed one record at a time; other conversions load
+    the nested dictionaries only, without building tree nodes.
+    
+    Args:
+        args: Parsed arguments (input, output, from_format, to_format)
+        
+    Returns:
+        Process exit code
+    """
+    source_format = _resolve_format(args.input, args.from_format)
+    target_format = _resolve_format(args.output, args.to_format)
+    
+    if args.output == '-' and target_format is None:
+        print("Error: --to is required when writing to stdout", file=sys.stderr)
+        return 2
+    
+    if source_format == 'ndjson' and target_format == 'ndjson':
+        from .streaming import _open_text, read_records, write_records
+        try:
+            source = _open_text(args.input, 'r')
+        except FileNotFoundError:
+            print(f"Error: File '{args.input}' not found", file=sys.stderr)
+            return 1
+        except OSError as e:
+            print(f"Error reading NDJSON file: {e}", file=sys.stderr)
+            return 1
+        
+        streams = [source]
+        try:
+            output = _open_text(args.output, 'w')
+            streams.append(output)
+            write_records(read_records(source), output)
+        except OSError as e:
+            print(f"Error writing to NDJSON file: {e}", file=sys.stderr)
+            return 1
+        except ValueError as e:
+            print(f"Error parsing NDJSON file: {e}", file=sys.stderr)
+            return 1
+        finally:
+            for stream in streams:
+                if stream not in (sys.stdin, sys.stdout):
+                    stream.close()
+        return 0
+    
+    data = _load_data(args.input, source_format)
+    if data is None:
+        return 1
+    
+    return 0 if _dump_data(data, args.output, target_format) else 1
+
+
+def cmd_query(args: argparse.Namespace) -> int:
+    """
+    Run a range, find or path query on a loaded tree.
+    
+    Args:
+        args: Parsed arguments (input, format, kind, and one of range/find/path)
+        
+    Returns:
+        Process exit code (1 if nothing was found)
+    """
+    root, kind = _load_tree(args.input, args.format, args.kind)
+    if root is None:
+        print("Error: No tree loaded", file=sys.stderr)
+        return 1
+    
+    if args.range is not None:
+        min_value, max_value = (_parse_value(bound) for bound in args.range)
+        if kind == 'binary':
+            from . import get_tree_range
+            values = get_tree_range(root, min_value, max_value)
+        else:
+            values = _general_range(root, min_value, max_value)
+        for value in values:
+            print(value)
+        return 0
+    
+    if args.find is not None:
+        path = _find_path(root, _parse_value(args.find), kind)
+        if path is None:
+            print(f"Value {args.find} not found", file=sys.stderr)
+            return 1
+        print(_format_path(path, kind))
+        return 0
+    
+    node = _follow_path(root, args.path, kind)
+    if node is None:
+        print(f"No node at path '{args.path}'", file=sys.stderr)
+        return 1
+    print(node.value)
+    return 0
+
+
+def cmd_stats(args: argparse.Namespace) -> int:
+    """
+    Print the size, height and memory footprint of a loaded tree.
+    
+    Args:
+        args: Parsed arguments (input, format, kind, json)
+        
+    Returns:
+        Process exit code
+    """
+    root, kind = _load_tree(args.input, args.format, args.kind)
+    if root is None:
+        print("Error: No tree loaded", file=sys.stderr)
+        return 1
+    
+    from .memory import memory_report
+    
+    if kind == 'binary':
+        from .balance import balance_report
+        stats = {'kind': kind}
+        stats.update(balance_report(root))
+    else:
+        from .aggregates import COUNT, HEIGHT, SubtreeAggregates
+        report = SubtreeAggregates(root, (COUNT, HEIGHT)).report()
+        stats = {'kind': kind, 'size': report['count'], 'height': report['height']}
+    
+    memory = memory_report(root)
+    stats['memory_bytes'] = memory['total_bytes']
+    stats['bytes_per_node'] = memory['bytes_per_node']
+    
+    if args.json:
+        print(json.dumps(stats))
+    else:
+        for key, value in stats.items():
+            print(f"{key}: {value:.2f}" if isinstance(value, float) else f"{key}: {value}")
+    return 0
+
+
+def cmd_bench(args: argparse.Namespace) -> int:
+    """
+    Run the built-in benchmarks.
+    
+    Args:
+        args: Parsed arguments (size, only)
+        
+    Returns:
+        Process exit code
+    """
+    from .benchmarks import BENCHMARKS, run_benchmarks
+    
+    unknown = [name for name in args.only or [] if name not in BENCHMARKS]
+    if unknown:
+        print(f"Error: Unknown benchmark(s) {', '.join(unknown)}; "
+              f"choose from {', '.join(BENCHMARKS)}", file=sys.stderr)
+        return 2
+    
+    run_benchmarks(args.size, args.only)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Build the argument parser for the binary-tree command.
+    
+    Returns:
+        The configured parser
+    """
+    parser = argparse.ArgumentParser(
+        prog='binary-tree',
+        description="Convert, query, inspect and benchmark binary and general trees.",
+    )
+    subparsers = parser.add_subparsers(dest='command', metavar='command')
+    subparsers.required = True
+    
+    convert = subparsers.add_parser('convert', help="convert a tree file to another format")
+    convert.add_argument('input', help='input file, or "-" for stdin')
+    convert.add_argument('output', help='output file, or "-" for stdout')
+    convert.add_argument('--from', dest='from_format', choices=FORMATS,
+                         help="input format (detected from the extension or contents by default)")
+    convert.add_argument('--to', dest='to_format', choices=FORMATS,
+                         help="output format (detected from the extension by default)")
+    convert.set_defaults(func=cmd_convert)
+    
+    query = subparsers.add_parser('query', help="look up values in a tree file")
+    query.add_argument('input', help='input file, or "-" for stdin')
+    query.add_argument('--format', choices=FORMATS, help="input format")
+    query.add_argument('--kind', choices=['binary', 'general'],
+                       help="tree kind (detected from the data by default)")
+    lookup = query.add_mutually_exclusive_group(required=True)
+    lookup.add_argument('--range', nargs=2, metavar=('MIN', 'MAX'),
+                        help="print values between MIN and MAX (inclusive)")
+    lookup.add_argument('--find', metavar='VALUE',
+                        help="print the path to the first node with VALUE")
+    lookup.add_argument('--path', metavar='PATH',
+                        help='print the value at PATH ("LR" or "0,2"; "" for the root)')
+    query.set_defaults(func=cmd_query)
+    
+    stats = subparsers.add_parser('stats', help="print size, height and memory use of a tree file")
+    stats.add_argument('input', help='input file, or "-" for stdin')
+    stats.add_argument('--format', choices=FORMATS, help="input format")
+    stats.add_argument('--kind', choices=['binary', 'general'],
+                       help="tree kind (detected from the data by default)")
+    stats.add_argument('--json', action='store_true', help="print the statistics as JSON")
+    stats.set_defaults(func=cmd_stats)
+    
+    bench = subparsers.add_parser('bench', help="run the built-in benchmarks")
+    bench.add_argument('--size', type=int, default=10000,
+                       help="number of nodes in the synthetic trees (default: 10000)")
+    bench.add_argument('--only', action='append', metavar='NAME',
+                       help="run only this benchmark (repeatable)")
+    bench.set_defaults(func=cmd_bench)
+    
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Entry point of the binary-tree console script.
+    
+    Args:
+        argv: Command line arguments (sys.argv[1:] if None)
+        
+    Returns:
+        Process exit code
+    """
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+# Export all public functions
+__all__ = [
+    'FORMATS',
+    'build_parser',
+    'main'
+]
@@ -0,0 +1,254 @@
+"""
+Tree Cloning and Subtree Extraction
+Fast iterative copies of Node, GeneralNode and CompactNode trees, and
+extraction / grafting of subtrees using the existing path addressing.
+
+Binary trees are addressed with 'L'/'R' path strings (as in add_node_by_path)
+and general trees with lists of child indices (as in add_child_by_path).
+"""
+
+import copy
+from typing import Optional, List, Union
+
+from . import Node
+from .compact_tree import CompactNode
+from .general_tree import GeneralNode
+
+TreeRoot = Union[Node, GeneralNode, CompactNode, None]
+
+
+def clone_tree(root: TreeRoot, copy_values: bool = False) -> TreeRoot:
+    """
+    Copy a Node, GeneralNode or CompactNode tree without recursion.
+    
+    By default the new nodes reference the same values, which is safe for
+    immutable values (numbers, strings, tuples) and avoids the memo dictionary
+    copy.deepcopy maintains. Shared subtrees of a hash-consed tree are copied
+    once per occurrence.
+    
+    Args:
+        root: The root node of the tree
+        copy_values: Deep-copy each value as well (for mutable values)
+        
+    Returns:
+        The root node of the copy
+    """
+    if root is None:
+        return None
+    
+    if isinstance(root, GeneralNode):
+        return _clone_general(root, copy_values)
+    if isinstance(root, CompactNode):
+        return _clone_compact(root, copy_values)
+    return _clone_binary(root, copy_values)
+
+
+def _clone_binary(root: Node, copy_values: bool) -> Node:
+    """Helper function to copy a binary tree."""
+    copy_value = copy.deepcopy if copy_values else None
+    new_root = Node(copy_value(root.value) if copy_value else root.value)
+    stack = [(root, new_root)]
+    pop = stack.pop
+    push = stack.append
+    
+    while stack:
+        node, new_node = pop()
+        left = node.left
+        if left is not None:
+            new_left = new_node.left = Node(copy_value(left.value) if copy_value else left.value)
+            push((left, new_left))
+        right = node.right
+        if right is not None:
+            new_right = new_node.right = Node(copy_value(right.value) if copy_value else right.value)
+            push((right, new_right))
+    
+    return new_root
+
+
+def _clone_general(root: GeneralNode, copy_values: bool) -> GeneralNode:
+    """Helper function to copy a general tree."""
+    copy_value = copy.deepcopy if copy_values else None
+    new_root = GeneralNode(copy_value(root.value) if copy_value else root.value)
+    stack = [(root, new_root)]
+    pop = stack.pop
+    push = stack.append
+    
+    while stack:
+        node, new_node = pop()
+        if not node.children:
+            continue
+        new_children = new_node.children
+        for child in node.children:
+            new_child = GeneralNode(copy_value(child.value) if copy_value else child.value)
+            new_children.append(new_child)
+            if child.children:
+                push((child, new_child))
+    
+    return new_root
+
+
+def _clone_compact(root: CompactNode, copy_values: bool) -> CompactNode:
+    """Helper function to copy a compact tree (the root's siblings are not copied)."""
+    copy_value = copy.deepcopy if copy_values else None
+    new_root = CompactNode(copy_value(root.value) if copy_value else root.value)
+    stack = [(root, new_root)]
+    
+    while stack:
+        node, new_node = stack.pop()
+        previous = None
+        child = node.first_child
+        while child is not None:
+            new_child = CompactNode(copy_value(child.value) if copy_value else child.value)
+            if previous is None:
+                new_node.first_child = new_child
+            else:
+                previous.next_sibling = new_child
+            previous = new_child
+            if child.first_child is not None:
+                stack.append((child, new_child))
+            child = child.next_sibling
+    
+    return new_root
+
+
+def _binary_node_at(root: Optional[Node], path: str) -> Optional[Node]:
+    """
+    Helper function to follow an 'L'/'R' path from the root.
+    
+    Args:
+        root: The root node of the tree
+        path: A string of 'L' and 'R' characters ("" for the root)
+        
+    Returns:
+        The node at the path, or None if the path is invalid
+    """
+    current = root
+    for i, direction in enumerate(path):
+        if current is None:
+            print(f"Invalid path: no node at position {i}")
+            return None
+        if direction == 'L':
+            current = current.left
+        elif direction == 'R':
+            current = current.right
+        else:
+            print(f"Invalid direction '{direction}' in path")
+            return None
+    
+    if current is None:
+        print(f"Invalid path: no node at '{path}'")
+    return current
+
+
+def _general_node_at(root: Optional[GeneralNode], path: List[int]) -> Optional[GeneralNode]:
+    """
+    Helper function to follow a path of child indices from the root.
+    
+    Args:
+        root: The root node of the tree
+        path: A list of child indices ([] for the root)
+        
+    Returns:
+        The node at the path, or None if the path is invalid
+    """
+    if root is None:
+        return None
+    
+    current = root
+    for i, child_index in enumerate(path):
+        if not 0 <= child_index < len(current.children):
+            print(f"Invalid child index {child_index} at level {i}")
+            return None
+        current = current.children[child_index]
+    
+    return current
+
+
+def extract_subtree(root: Union[Node, GeneralNode, None], path: Union[str, List[int]],
+                    copy_values: bool = False) -> Union[Node, GeneralNode, None]:
+    """
+    Copy the subtree at a path; the original tree is not changed.
+    
+    Args:
+        root: The root node of a binary or general tree
+        path: 'L'/'R' string for a Node tree, list of child indices for a
+              GeneralNode tree (empty for the whole tree)
+        copy_values: Deep-copy each value as well (for mutable values)
+        
+    Returns:
+        The root node of the copied subtree, or None if the path is invalid
+    """
+    if isinstance(root, GeneralNode):
+        node = _general_node_at(root, path)
+    else:
+        node = _binary_node_at(root, path)
+    
+    if node is None:
+        return None
+    
+    return clone_tree(node, copy_values)
+
+
+def graft_subtree(root: Union[Node, GeneralNode, None], path: Union[str, List[int]],
+                  subtree: Union[Node, GeneralNode]) -> bool:
+    """
+    Attach a subtree at a path, addressed like add_node_by_path / add_child_by_path.
+    
+    For a Node tree, the last direction of the path is the position of the
+    subtree (an existing subtree there is replaced). For a GeneralNode tree,
+    the path leads to the parent and the subtree is appended as its last child.
+    The subtree is linked, not copied; pass clone_tree(subtree) to keep it
+    independent.
+    
+    Args:
+        root: The root node of a binary or general tree
+        path: 'L'/'R' string or list of child indices
+        subtree: Root node of the subtree to attach (same node type as root)
+        
+    Returns:
+        True if the subtree was attached, False otherwise
+    """
+    if root is None or subtree is None:
+        return False
+    
+    if type(subtree) is not type(root):
+        print(f"Cannot graft a {type(subtree).__name__} into a {type(root).__name__} tree")
+        return False
+    
+    if isinstance(root, GeneralNode):
+        parent = _general_node_at(root, path)
+        if parent is None:
+            return False
+        parent.add_child(subtree)
+        return True
+    
+    if not path:
+        print("Cannot graft at the root: path is empty")
+        return False
+    
+    parent = _binary_node_at(root, path[:-1])
+    if parent is None:
+        return False
+    
+    direction = path[-1]
+    if direction == 'L':
+        if parent.left is not None:
+            print(f"Warning: Replacing existing left subtree with value {parent.left.value}")
+        parent.left = subtree
+        return True
+    elif direction == 'R':
+        if parent.right is not None:
+            print(f"Warning: Replacing existing right subtree with value {parent.right.value}")
+        parent.right = subtree
+        return True
+    else:
+        print(f"Invalid final direction '{direction}'")
+        return False
+
+
+# Export all public functions
+__all__ = [
+    'clone_tree',
+    'extract_subtree',
+    'graft_subtree'
+]
@@ -0,0 +1,345 @@
+"""
+Compact General Tree Representation
+First-child/next-sibling nodes with __slots__, for wide trees with many leaves.
+
+A GeneralNode carries an instance __dict__ and its own children list, even when
+it is a leaf. A CompactNode stores exactly four references and nothing else.
+"""
+
+from typing import Optional, Any, Iterator
+
+from .general_tree import GeneralNode
+
+
+class CompactNode:
+    """
+    A memory-compact node for general (n-ary) trees.
+    
+    Attributes:
+        value: The value stored in the node
+        first_child: Reference to the first child node
+        next_sibling: Reference to the next sibling node
+        last_child: Last child added through add_child, so appends do not walk
+                    the sibling chain (a hint; add_child walks on from it)
+    """
+    
+    __slots__ = ('value', 'first_child', 'next_sibling', 'last_child')
+    
+    def __init__(self, value: Any):
+        """
+        Initialize a new compact node.
+        
+        Args:
+            value: The value to store in the node
+        """
+        self.value = value
+        self.first_child: Optional['CompactNode'] = None
+        self.next_sibling: Optional['CompactNode'] = None
+        self.last_child: Optional['CompactNode'] = None
+    
+    def children(self) -> Iterator['CompactNode']:
+        """Iterate over the direct children of this node, in order."""
+        child = self.first_child
+        while child is not None:
+            yield child
+            child = child.next_sibling
+    
+    def add_child(self, child: 'CompactNode') -> None:
+        """Add a child node after the existing children, in amortised O(1)."""
+        if self.first_child is None:
+            self.first_child = child
+            self.last_child = child
+            return
+        
+        # Children linked directly through first_child / next_sibling are
+        # walked once, later appends start from the cached tail
+        last = self.last_child or self.first_child
+        while last.next_sibling is not None:
+            last = last.next_sibling
+        last.next_sibling = child
+        self.last_child = child
+    
+    def __repr__(self):
+        return f"CompactNode({self.value})"
+
+
+def add_compact_child(node: CompactNode, value: Any) -> CompactNode:
+    """
+    Add a child directly to a compact node and return the child.
+    
+    Args:
+        node: The parent node
+        value: The value for the new child
+        
+    Returns:
+        The newly created child node
+    """
+    child = CompactNode(value)
+    node.add_child(child)
+    return child
+
+
+def compact_from_general(root: Optional[GeneralNode]) -> Optional[CompactNode]:
+    """
+    Convert a general tree to the compact representation.
+    
+    Args:
+        root: The root node of the general tree
+        
+    Returns:
+        The root node of the equivalent compact tree
+    """
+    if root is None:
+        return None
+    
+    compact_root = CompactNode(root.value)
+    stack = [(root, compact_root)]
+    
+    while stack:
+        node, compact = stack.pop()
+        previous = None
+        for child in node.children:
+            compact_child = CompactNode(child.value)
+            if previous is None:
+                compact.first_child = compact_child
+            else:
+                previous.next_sibling = compact_child
+            previous = compact_child
+            stack.append((child, compact_child))
+    
+    return compact_root
+
+
+def compact_to_general(root: Optional[CompactNode]) -> Optional[GeneralNode]:
+    """
+    Convert a compact tree back to a general tree.
+    
+    Args:
+        root: The root node of the compact tree
+        
+    Returns:
+        The root node of the equivalent general tree
+    """
+    if root is None:
+        return None
+    
+    general_root = GeneralNode(root.value)
+    stack = [(root, general_root)]
+    
+    while stack:
+        compact, node = stack.pop()
+        child = compact.first_child
+        while child is not None:
+            general_child = GeneralNode(child.value)
+            node.add_child(general_child)
+            stack.append((child, general_child))
+            child = child.next_sibling
+    
+    return general_root
+
+
+def iter_compact_tree(root: Optional[CompactNode]) -> Iterator[CompactNode]:
+    """
+    Iterate over all nodes of a compact tree in pre-order, without recursion.
+    
+    Args:
+        root: The root node of the tree
+        
+    Yields:
+        Each node, parents before children and siblings in order
+    """
+    if root is None:
+        return
+    
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        yield node
+        if node.next_sibling is not None and node is not root:
+            stack.append(node.next_sibling)
+        if node.first_child is not None:
+            stack.append(node.first_child)
+
+
+def find_compact_node(root: Optional[CompactNode], value: Any) -> Optional[CompactNode]:
+    """
+    Find a node with the specified value.
+    
+    Nodes are visited in the same order as find_node on the equivalent general tree.
+    
+    Args:
+        root: The root node of the tree
+        value: The value to search for
+        
+    Returns:
+        The node if found, None otherwise
+    """
+    for node in iter_compact_tree(root):
+        if node.value == value:
+            return node
+    return None
+
+
+def print_compact_tree(root: Optional[CompactNode]) -> None:
+    """
+    Print the compact tree in the same visual format as print_general_tree.
+    
+    Args:
+        root: The root node of the tree
+    """
+    if root is None:
+        return
+    
+    print(f"Root: {root.value}")
+    if root.first_child is None:
+        return
+    stack = [(root.first_child, "")]
+    
+    while stack:
+        node, prefix = stack.pop()
+        is_last_child = node.next_sibling is None
+        connector = "└── " if is_last_child else "├── "
+        extension = "    " if is_last_child else "│   "
+        print(f"{prefix}{connector}{node.value}")
+        
+        if node.next_sibling is not None:
+            stack.append((node.next_sibling, prefix))
+        if node.first_child is not None:
+            stack.append((node.first_child, prefix + extension))
+
+
+def _compact_tree_to_dict(root: Optional[CompactNode]) -> Optional[dict]:
+    """
+    Helper function to convert a compact tree to the general tree dictionary format.
+    
+    Args:
+        root: The root node to convert
+        
+    Returns:
+        Dictionary representation of the tree, identical to _general_tree_to_dict
+    """
+    if root is None:
+        return None
+    
+    root_dict = {'value': root.value}
+    stack = [(root, root_dict)]
+    
+    while stack:
+        node, node_dict = stack.pop()
+        if node.first_child is None:
+            continue
+        
+        children = []
+        node_dict['children'] = children
+        for child in node.children():
+            child_dict = {'value': child.value}
+            children.append(child_dict)
+            stack.append((child, child_dict))
+    
+    return root_dict
+
+
+def _build_compact_tree(data: Any) -> Optional[CompactNode]:
+    """
+    Helper function to build a compact tree from the general tree dictionary format.
+    
+    Entries are validated the same way as in build_general_tree_from_yaml.
+    
+    Args:
+        data: Dictionary containing node data
+        
+    Returns:
+        The constructed root node
+    """
+    if not isinstance(data, dict) or data.get('value') is None:
+        return None
+    
+    root = CompactNode(data['value'])
+    stack = [(data, root)]
+    
+    while stack:
+        node_data, node = stack.pop()
+        children_data = node_data.get('children', [])
+        if not isinstance(children_data, list):
+            continue
+        
+        previous = None
+        for child_data in children_data:
+            if not isinstance(child_data, dict) or child_data.get('value') is None:
+                continue
+            child = CompactNode(child_data['value'])
+            if previous is None:
+                node.first_child = child
+            else:
+                previous.next_sibling = child
+            previous = child
+            stack.append((child_data, child))
+    
+    return root
+
+
+def build_compact_tree_from_yaml(yaml_file: str) -> Optional[CompactNode]:
+    """
+    Build a compact tree from a general tree YAML file.
+    
+    Args:
+        yaml_file: Path to the YAML file
+        
+    Returns:
+        The root node of the constructed tree, or None if file cannot be read
+    """
+    import yaml
+    try:
+        with open(yaml_file, 'r') as file:
+            data = yaml.safe_load(file)
+        
+        if data is None:
+            return None
+        
+        return _build_compact_tree(data)
+    
+    except FileNotFoundError:
+        print(f"Error: File '{yaml_file}' not found")
+        return None
+    except yaml.YAMLError as e:
+        print(f"Error parsing YAML file: {e}")
+        return None
+
+
+def write_compact_tree_to_yaml(root: Optional[CompactNode], yaml_file: str) -> bool:
+    """
+    Write a compact tree to a YAML file using the general tree schema.
+    
+    Args:
+        root: The root node of the tree
+        yaml_file: Path to the output YAML file
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    import yaml
+    try:
+        tree_dict = _compact_tree_to_dict(root)
+        
+        with open(yaml_file, 'w') as file:
+            yaml.dump(tree_dict, file, default_flow_style=False, sort_keys=False)
+        
+        return True
+    
+    except Exception as e:
+        print(f"Error writing to YAML file: {e}")
+        return False
+
+
+# Export all public functions
+__all__ = [
+    'CompactNode',
+    'add_compact_child',
+    'compact_from_general',
+    'compact_to_general',
+    'iter_compact_tree',
+    'find_compact_node',
+    'print_compact_tree',
+    'build_compact_tree_from_yaml',
+    'write_compact_tree_to_yaml'
+]
@@ -0,0 +1,233 @@
+"""
+Thread-Safe Binary Tree Wrapper
+A reader-writer lock and a tree wrapper that lets readers run in parallel
+while writers are serialised.
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import Optional, Any, List, Iterator
+
+from . import (
+    Node,
+    add_node_by_path,
+    delete_node,
+    edit_node_value,
+    get_tree_range,
+    print_tree_range,
+    write_tree_to_yaml,
+)
+
+
+class ReadWriteLock:
+    """
+    A writer-preferring reader-writer lock.
+    
+    Any number of readers may hold the lock at the same time. A writer holds it
+    exclusively. Once a writer is waiting, new readers queue behind it so a
+    steady stream of readers cannot starve writers. The lock is not reentrant.
+    """
+    
+    def __init__(self):
+        """Initialize a new unlocked reader-writer lock."""
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._waiting_writers = 0
+    
+    def acquire_read(self) -> None:
+        """Acquire the lock for reading, blocking while a writer holds or waits for it."""
+        with self._condition:
+            while self._writer or self._waiting_writers:
+                self._condition.wait()
+            self._readers += 1
+    
+    def release_read(self) -> None:
+        """Release a read lock."""
+        with self._condition:
+            self._readers -= 1
+            if self._readers == 0:
+                self._condition.notify_all()
+    
+    def acquire_write(self) -> None:
+        """Acquire the lock for writing, blocking until all readers and writers are done."""
+        with self._condition:
+            self._waiting_writers += 1
+            while self._writer or self._readers:
+                self._condition.wait()
+            self._waiting_writers -= 1
+            self._writer = True
+    
+    def release_write(self) -> None:
+        """Release the write lock."""
+        with self._condition:
+            self._writer = False
+            self._condition.notify_all()
+    
+    @contextmanager
+    def read_locked(self) -> Iterator[None]:
+        """Context manager holding the lock for reading."""
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+    
+    @contextmanager
+    def write_locked(self) -> Iterator[None]:
+        """Context manager holding the lock for writing."""
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
+class ConcurrentTree:
+    """
+    A binary tree shared between threads.
+    
+    Every read method runs under a shared read lock and every mutating method
+    under the exclusive write lock, so readers never observe a half-applied
+    mutation. Several mutations can be grouped atomically with write().
+    
+    Attributes:
+        version: Number of completed write operations
+    """
+    
+    def __init__(self, root: Optional[Node] = None, lock: Optional[ReadWriteLock] = None):
+        """
+        Initialize a new concurrent tree.
+        
+        Args:
+            root: The root node of the tree to share (the wrapper takes ownership)
+            lock: Lock guarding the tree (a new ReadWriteLock by default)
+        """
+        self._root = root
+        self._lock = lock if lock is not None else ReadWriteLock()
+        self.version = 0
+    
+    @contextmanager
+    def read(self) -> Iterator[Optional[Node]]:
+        """
+        Context manager giving read access to the root node.
+        
+        The tree must not be modified inside the block.
+        
+        Yields:
+            The root node of the tree
+        """
+        with self._lock.read_locked():
+            yield self._root
+    
+    @contextmanager
+    def write(self) -> Iterator['_WriteHandle']:
+        """
+        Context manager giving exclusive access for a group of mutations.
+        
+        Inside the block use the yielded object's `root` attribute with the
+        plain package functions; assign to it to replace the root.
+        
+        Yields:
+            A handle whose `root` attribute is the root node of the tree
+        """
+        with self._lock.write_locked():
+            handle = _WriteHandle(self._root)
+            try:
+                yield handle
+            finally:
+                self._root = handle.root
+                self.version += 1
+    
+    def get_tree_range(self, min_value: Any, max_value: Any) -> List[Any]:
+        """
+        Collect the values of nodes within a specified value range.
+        
+        Args:
+            min_value: Minimum value to include
+            max_value: Maximum value to include
+            
+        Returns:
+            List of values in range, in in-order sequence
+        """
+        with self._lock.read_locked():
+            return get_tree_range(self._root, min_value, max_value)
+    
+    def print_tree_range(self, min_value: Any, max_value: Any) -> None:
+        """
+        Print nodes in the tree within a specified value range.
+        
+        Args:
+            min_value: Minimum value to print
+            max_value: Maximum value to print
+        """
+        with self._lock.read_locked():
+            print_tree_range(self._root, min_value, max_value)
+    
+    def write_to_yaml(self, yaml_file: str) -> bool:
+        """
+        Write a consistent snapshot of the tree to a YAML file.
+        
+        Args:
+            yaml_file: Path to the output YAML file
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        with self._lock.read_locked():
+            return write_tree_to_yaml(self._root, yaml_file)
+    
+    def add_node_by_path(self, path: str, value: Any) -> bool:
+        """
+        Add a node to the tree using a path string.
+        
+        Args:
+            path: A string of 'L' and 'R' characters indicating the path
+            value: The value for the new node
+            
+        Returns:
+            True if node was added successfully, False otherwise
+        """
+        with self.write() as handle:
+            return add_node_by_path(handle.root, path, value)
+    
+    def delete_node(self, value: Any) -> None:
+        """
+        Delete a node with the specified value from the tree.
+        
+        Args:
+            value: The value to delete
+        """
+        with self.write() as handle:
+            handle.root = delete_node(handle.root, value)
+    
+    def edit_node_value(self, old_value: Any, new_value: Any) -> bool:
+        """
+        Edit the value of a node in the tree.
+        
+        Args:
+            old_value: The current value to find
+            new_value: The new value to set
+            
+        Returns:
+            True if the value was found and updated, False otherwise
+        """
+        with self.write() as handle:
+            return edit_node_value(handle.root, old_value, new_value)
+    
+    def __repr__(self):
+        return f"ConcurrentTree(version={self.version})"
+
+
+class _WriteHandle:
+    """Mutable holder for the root node while the write lock is held."""
+    
+    def __init__(self, root: Optional[Node]):
+        self.root = root
+
+
+# Export all public functions
+__all__ = [
+    'ReadWriteLock',
+    'ConcurrentTree'
+]
@@ -0,0 +1,129 @@
+"""
+General Tree <-> Binary Tree Conversion
+Left-child/right-sibling encoding of GeneralNode trees as binary Node trees.
+
+In the encoding a node's left child is its first child and its right child is
+its next sibling. The binary tree tooling (print_tree_range, YAML writer,
+L/R path addressing) then works on n-ary data, and the round trip is exact.
+"""
+
+from typing import Optional, List
+
+from . import Node
+from .general_tree import GeneralNode
+
+
+def general_to_binary(root: Optional[GeneralNode]) -> Optional[Node]:
+    """
+    Convert a general tree to its left-child/right-sibling binary tree in O(n).
+    
+    Args:
+        root: The root node of the general tree
+        
+    Returns:
+        The root node of the binary tree (its right child is always None)
+    """
+    if root is None:
+        return None
+    
+    binary_root = Node(root.value)
+    stack = [(root, binary_root)]
+    
+    while stack:
+        node, binary = stack.pop()
+        previous = None
+        for child in node.children:
+            binary_child = Node(child.value)
+            if previous is None:
+                binary.left = binary_child
+            else:
+                previous.right = binary_child
+            previous = binary_child
+            stack.append((child, binary_child))
+    
+    return binary_root
+
+
+def binary_to_general(root: Optional[Node]) -> Optional[GeneralNode]:
+    """
+    Convert a left-child/right-sibling binary tree back to a general tree in O(n).
+    
+    Args:
+        root: The root node of the binary tree; it must not have a right child,
+              since the root of a general tree has no siblings
+              
+    Returns:
+        The root node of the general tree, or None if the tree is not a valid encoding
+    """
+    if root is None:
+        return None
+    
+    if root.right is not None:
+        print("Cannot convert: root has a right child (a sibling of the root)")
+        return None
+    
+    general_root = GeneralNode(root.value)
+    stack = [(root, general_root)]
+    
+    while stack:
+        binary, node = stack.pop()
+        child = binary.left
+        while child is not None:
+            general_child = GeneralNode(child.value)
+            node.add_child(general_child)
+            stack.append((child, general_child))
+            child = child.right
+    
+    return general_root
+
+
+def general_path_to_lr(path: List[int]) -> str:
+    """
+    Translate a general tree child-index path into a binary L/R path.
+    
+    Child index i becomes "L" followed by i times "R". For example [0, 2]
+    (first child, then its third child) becomes "LLRR".
+    
+    Args:
+        path: A list of child indices
+        
+    Returns:
+        The equivalent path string for the left-child/right-sibling tree
+    """
+    return ''.join('L' + 'R' * index for index in path)
+
+
+def lr_path_to_general(path: str) -> Optional[List[int]]:
+    """
+    Translate a binary L/R path into a general tree child-index path.
+    
+    Args:
+        path: A string of 'L' and 'R' characters starting with 'L'
+        
+    Returns:
+        The equivalent list of child indices, or None if the path is invalid
+    """
+    indices: List[int] = []
+    
+    for i, direction in enumerate(path):
+        if direction == 'L':
+            indices.append(0)
+        elif direction == 'R':
+            if not indices:
+                print(f"Invalid path: 'R' at position {i} moves to a sibling of the root")
+                return None
+            indices[-1] += 1
+        else:
+            print(f"Invalid direction '{direction}' in path")
+            return None
+    
+    return indices
+
+
+# Export all public functions
+__all__ = [
+    'general_to_binary',
+    'binary_to_general',
+    'general_path_to_lr',
+    'lr_path_to_general'
+]
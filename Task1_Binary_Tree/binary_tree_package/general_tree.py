@@ -3,8 +3,8 @@ Bonus Feature: General Tree Implementation (N-ary Tree)
 A Node class that can create trees with any number of children per node.
 """
 
-import yaml
-from typing import Optional, Any, List
+from collections import deque
+from typing import Optional, Any, List, Dict, Iterable
 
 
 class GeneralNode:
@@ -203,6 +203,69 @@ def find_node(root: Optional[GeneralNode], value: Any) -> Optional[GeneralNode]:
     return None
 
 
+def find_nodes(root: Optional[GeneralNode], values: Iterable[Any]) -> Dict[Any, GeneralNode]:
+    """
+    Find nodes for several values in a single traversal.
+    
+    The tree is walked once in the same order as find_node, and the walk
+    stops as soon as every value has been found.
+    
+    Args:
+        root: The root node of the tree
+        values: The (hashable) values to search for
+        
+    Returns:
+        Dictionary mapping each found value to its first matching node;
+        values that are not in the tree are left out
+    """
+    remaining = set(values)
+    found: Dict[Any, GeneralNode] = {}
+    
+    if root is None or not remaining:
+        return found
+    
+    stack = [root]
+    while stack and remaining:
+        node = stack.pop()
+        if node.value in remaining:
+            remaining.discard(node.value)
+            found[node.value] = node
+        stack.extend(reversed(node.children))
+    
+    return found
+
+
+def find_node_bfs(root: Optional[GeneralNode], value: Any,
+                  max_depth: Optional[int] = None) -> Optional[GeneralNode]:
+    """
+    Find a node with the specified value using breadth-first search.
+    
+    Shallow matches are found without descending into deep branches, and
+    max_depth bounds the search entirely.
+    
+    Args:
+        root: The root node of the tree
+        value: The value to search for
+        max_depth: Deepest level to search (the root is level 0), or None for no limit
+        
+    Returns:
+        The shallowest matching node if found, None otherwise
+    """
+    if root is None:
+        return None
+    
+    queue = deque([(root, 0)])
+    while queue:
+        node, depth = queue.popleft()
+        if node.value == value:
+            return node
+        if max_depth is None or depth < max_depth:
+            for child in node.children:
+                queue.append((child, depth + 1))
+    
+    return None
+
+
 def build_general_tree_from_yaml(yaml_file: str) -> Optional[GeneralNode]:
     """
     Build a general tree from a YAML file.
@@ -213,6 +276,7 @@ def build_general_tree_from_yaml(yaml_file: str) -> Optional[GeneralNode]:
     Returns:
         The root node of the constructed tree, or None if file cannot be read
     """
+    import yaml
     try:
         with open(yaml_file, 'r') as file:
             data = yaml.safe_load(file)
@@ -275,6 +339,7 @@ def write_general_tree_to_yaml(root: Optional[GeneralNode], yaml_file: str) -> b
     Returns:
         True if successful, False otherwise
     """
+    import yaml
     try:
         tree_dict = _general_tree_to_dict(root)
         
@@ -319,6 +384,8 @@ __all__ = [
     'print_general_tree',
     'edit_general_node_value',
     'find_node',
+    'find_nodes',
+    'find_node_bfs',
     'build_general_tree_from_yaml',
     'write_general_tree_to_yaml'
 ]
@@ -0,0 +1,408 @@
+"""
+Hash-Consed General Trees
+Opt-in sharing of identical subtrees: structurally equal subtrees (same values,
+same children in the same order) become one GeneralNode object, turning the
+tree into a DAG that uses memory and file space once per distinct subtree.
+
+Shared subtrees must be treated as immutable, since changing one copy changes
+every copy. Call unshare() to get an independent tree before mutating it.
+
+YAML files store shared subtrees with anchors/aliases and stay readable by
+build_general_tree_from_yaml. Other formats (JSON, MessagePack) store a
+shared-subtree table: {"nodes": [{"value": ..., "children": [indices]}, ...],
+"root": index}, listed children first.
+"""
+
+from typing import Optional, Any, List, Dict, Sequence, Tuple
+
+from .general_tree import GeneralNode, _general_tree_to_dict
+from .memory import memory_report
+from .serialization import _BACKENDS, _dump_dict, _load_dict, detect_format
+
+
+def _subtree_key(value: Any, children: List[GeneralNode]) -> Optional[Tuple[Any, ...]]:
+    """
+    Helper function to build the hash-consing key of a node with canonical children.
+    
+    Args:
+        value: The node value
+        children: The node's children, already hash-consed
+        
+    Returns:
+        A hashable key, or None if the value is unhashable (the subtree is then not shared)
+    """
+    try:
+        hash(value)
+    except TypeError:
+        return None
+    # The type keeps 1, 1.0 and True apart, which compare equal
+    return (type(value), value, tuple(id(child) for child in children))
+
+
+def hash_cons(root: Optional[GeneralNode]) -> Optional[GeneralNode]:
+    """
+    Build a copy of a general tree in which identical subtrees are shared.
+    
+    Runs in O(n) without recursion. The input tree is not modified.
+    
+    Args:
+        root: The root node of the tree
+        
+    Returns:
+        The root node of the shared (DAG) copy
+    """
+    if root is None:
+        return None
+    
+    table: Dict[Tuple[Any, ...], GeneralNode] = {}
+    canonical: Dict[int, GeneralNode] = {}
+    stack = [(root, False)]
+    
+    while stack:
+        node, children_done = stack.pop()
+        if id(node) in canonical:
+            continue
+        
+        if not children_done:
+            stack.append((node, True))
+            for child in node.children:
+                if id(child) not in canonical:
+                    stack.append((child, False))
+            continue
+        
+        children = [canonical[id(child)] for child in node.children]
+        key = _subtree_key(node.value, children)
+        shared = table.get(key) if key is not None else None
+        if shared is None:
+            shared = GeneralNode(node.value)
+            shared.children = children
+            if key is not None:
+                table[key] = shared
+        canonical[id(node)] = shared
+    
+    return canonical[id(root)]
+
+
+def unshare(root: Optional[GeneralNode]) -> Optional[GeneralNode]:
+    """
+    Expand a shared tree into an independent tree with one node per occurrence.
+    
+    Args:
+        root: The root node of a hash-consed tree
+        
+    Returns:
+        The root node of the expanded copy, safe to modify
+    """
+    if root is None:
+        return None
+    
+    new_root = GeneralNode(root.value)
+    stack = [(root, new_root)]
+    while stack:
+        node, copy = stack.pop()
+        for child in node.children:
+            child_copy = GeneralNode(child.value)
+            copy.add_child(child_copy)
+            stack.append((child, child_copy))
+    
+    return new_root
+
+
+def _post_order_unique(root: GeneralNode) -> List[GeneralNode]:
+    """Helper function to list every distinct node of a DAG once, children first."""
+    order: List[GeneralNode] = []
+    seen = set()
+    stack = [(root, False)]
+    
+    while stack:
+        node, children_done = stack.pop()
+        if children_done:
+            order.append(node)
+            continue
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        
+        stack.append((node, True))
+        for child in reversed(node.children):
+            if id(child) not in seen:
+                stack.append((child, False))
+    
+    return order
+
+
+def count_nodes(root: Optional[GeneralNode]) -> Tuple[int, int]:
+    """
+    Count the logical and the distinct nodes of a (possibly shared) tree.
+    
+    Args:
+        root: The root node of the tree
+        
+    Returns:
+        Tuple of (number of nodes of the expanded tree, number of distinct node objects)
+    """
+    if root is None:
+        return 0, 0
+    
+    sizes: Dict[int, int] = {}
+    order = _post_order_unique(root)
+    for node in order:
+        sizes[id(node)] = 1 + sum(sizes[id(child)] for child in node.children)
+    
+    return sizes[id(root)], len(order)
+
+
+def _shared_tree_to_dict(root: Optional[GeneralNode]) -> Optional[dict]:
+    """
+    Helper function to convert a shared tree to nested dictionaries, one per distinct node.
+    
+    Shared nodes map to the same dictionary object, which YAML writes as an
+    anchor followed by aliases.
+    
+    Args:
+        root: The root node of the tree
+        
+    Returns:
+        Nested dictionary in the general tree schema
+    """
+    if root is None:
+        return None
+    
+    dicts: Dict[int, dict] = {}
+    for node in _post_order_unique(root):
+        node_dict = {'value': node.value}
+        if node.children:
+            node_dict['children'] = [dicts[id(child)] for child in node.children]
+        dicts[id(node)] = node_dict
+    
+    return dicts[id(root)]
+
+
+def _shared_tree_to_table(root: Optional[GeneralNode]) -> Optional[dict]:
+    """
+    Helper function to convert a shared tree to the shared-subtree table.
+    
+    Args:
+        root: The root node of the tree
+        
+    Returns:
+        Dictionary with "nodes" (children listed before their parents) and "root"
+    """
+    if root is None:
+        return None
+    
+    index: Dict[int, int] = {}
+    nodes = []
+    for node in _post_order_unique(root):
+        entry = {'value': node.value}
+        if node.children:
+            entry['children'] = [index[id(child)] for child in node.children]
+        index[id(node)] = len(nodes)
+        nodes.append(entry)
+    
+    return {'nodes': nodes, 'root': index[id(root)]}
+
+
+def _build_shared_tree(data: Any) -> Optional[GeneralNode]:
+    """
+    Helper function to build a shared tree from loaded data.
+    
+    Accepts both the shared-subtree table and nested dictionaries; dictionaries
+    loaded from YAML aliases are the same object and become the same node.
+    
+    Args:
+        data: The loaded data
+        
+    Returns:
+        The root node of the shared tree, or None if the data is invalid
+    """
+    if isinstance(data, dict) and 'nodes' in data and 'value' not in data:
+        return _build_from_table(data)
+    
+    if not isinstance(data, dict) or data.get('value') is None:
+        return None
+    
+    nodes: Dict[int, GeneralNode] = {}
+    stack = [(data, False)]
+    while stack:
+        node_dict, children_done = stack.pop()
+        if id(node_dict) in nodes:
+            continue
+        
+        children_data = node_dict.get('children', [])
+        if not isinstance(children_data, list):
+            children_data = []
+        children_data = [
+            child for child in children_data
+            if isinstance(child, dict) and child.get('value') is not None
+        ]
+        
+        if not children_done:
+            stack.append((node_dict, True))
+            for child_dict in children_data:
+                if id(child_dict) not in nodes:
+                    stack.append((child_dict, False))
+            continue
+        
+        node = GeneralNode(node_dict['value'])
+        node.children = [nodes[id(child_dict)] for child_dict in children_data]
+        nodes[id(node_dict)] = node
+    
+    return nodes[id(data)]
+
+
+def _build_from_table(data: dict) -> Optional[GeneralNode]:
+    """
+    Helper function to build a shared tree from the shared-subtree table.
+    
+    Args:
+        data: Dictionary with "nodes" and "root"
+        
+    Returns:
+        The root node, or None if the table is invalid
+    """
+    nodes: List[GeneralNode] = []
+    
+    try:
+        for i, entry in enumerate(data['nodes']):
+            node = GeneralNode(entry['value'])
+            for child_index in entry.get('children', []):
+                if not 0 <= child_index < i:
+                    print(f"Invalid table: node {i} refers to node {child_index}")
+                    return None
+                node.add_child(nodes[child_index])
+            nodes.append(node)
+        
+        return nodes[data['root']]
+    
+    except (KeyError, IndexError, TypeError) as e:
+        print(f"Invalid shared-subtree table: {e}")
+        return None
+
+
+def _encode_shared(root: Optional[GeneralNode], fmt: str) -> Optional[dict]:
+    """Helper function to pick the shared representation for a format."""
+    if fmt == 'yaml':
+        return _shared_tree_to_dict(root)
+    return _shared_tree_to_table(root)
+
+
+def write_shared_tree(root: Optional[GeneralNode], file_path: str,
+                      fmt: Optional[str] = None) -> bool:
+    """
+    Write a hash-consed tree, storing each distinct subtree once.
+    
+    Args:
+        root: The root node of a tree returned by hash_cons
+        file_path: Path to the output file ("-" for stdout, fmt is then required)
+        fmt: Format name; detected from the extension if None
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    if fmt is None:
+        fmt = detect_format(file_path)
+    if fmt is None:
+        print(f"Error: Cannot detect format of '{file_path}'")
+        return False
+    
+    return _dump_dict(_encode_shared(root, fmt), file_path, fmt)
+
+
+def read_shared_tree(file_path: str, fmt: Optional[str] = None) -> Optional[GeneralNode]:
+    """
+    Build a hash-consed tree from a file written by write_shared_tree.
+    
+    Subtrees stored once in the file are shared in memory. Plain nested
+    general tree files are accepted as well.
+    
+    Args:
+        file_path: Path to the input file ("-" for stdin)
+        fmt: Format name; detected from the extension or contents if None
+        
+    Returns:
+        The root node of the shared tree, or None if file cannot be read
+    """
+    data = _load_dict(file_path, fmt)
+    if data is None:
+        return None
+    
+    return _build_shared_tree(data)
+
+
+def build_shared_general_tree_from_yaml(yaml_file: str) -> Optional[GeneralNode]:
+    """
+    Build a general tree from a YAML file, keeping anchored subtrees shared.
+    
+    Args:
+        yaml_file: Path to the YAML file
+        
+    Returns:
+        The root node of the shared tree, or None if file cannot be read
+    """
+    return read_shared_tree(yaml_file, 'yaml')
+
+
+def write_shared_general_tree_to_yaml(root: Optional[GeneralNode], yaml_file: str) -> bool:
+    """
+    Write a hash-consed general tree to YAML using anchors and aliases.
+    
+    Args:
+        root: The root node of a tree returned by hash_cons
+        yaml_file: Path to the output YAML file
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    return write_shared_tree(root, yaml_file, 'yaml')
+
+
+def _encoded_size(data: Any, fmt: str) -> int:
+    """Helper function to get the serialized size of data in bytes."""
+    payload = _BACKENDS[fmt].dumps(data)
+    return len(payload.encode('utf-8')) if isinstance(payload, str) else len(payload)
+
+
+def sharing_report(root: Optional[GeneralNode],
+                   formats: Sequence[str] = ('yaml', 'json')) -> Dict[str, Any]:
+    """
+    Report the memory and file-size savings of a hash-consed tree.
+    
+    Args:
+        root: The root node of a tree returned by hash_cons
+        formats: Registered formats to measure file sizes for
+        
+    Returns:
+        Dictionary with "nodes", "unique_nodes", "tree_bytes" (memory of the
+        expanded tree), "shared_bytes" (memory of the shared tree), and
+        "<fmt>_bytes" / "shared_<fmt>_bytes" for each format
+    """
+    nodes, unique_nodes = count_nodes(root)
+    report = {
+        'nodes': nodes,
+        'unique_nodes': unique_nodes,
+        'tree_bytes': memory_report(unshare(root))['total_bytes'],
+        'shared_bytes': memory_report(root)['total_bytes'],
+    }
+    
+    expanded = _general_tree_to_dict(root)
+    for fmt in formats:
+        if fmt not in _BACKENDS:
+            continue
+        report[f'{fmt}_bytes'] = _encoded_size(expanded, fmt)
+        report[f'shared_{fmt}_bytes'] = _encoded_size(_encode_shared(root, fmt), fmt)
+    
+    return report
+
+
+# Export all public functions
+__all__ = [
+    'hash_cons',
+    'unshare',
+    'count_nodes',
+    'write_shared_tree',
+    'read_shared_tree',
+    'build_shared_general_tree_from_yaml',
+    'write_shared_general_tree_to_yaml',
+    'sharing_report'
+]
@@ -0,0 +1,265 @@
+"""
+Indexed General Tree
+A general tree wrapper keeping a value -> node index and parent links, so
+lookups, path queries and repeated insertions do not search the tree.
+"""
+
+from typing import Optional, Any, List, Dict, Set, Tuple
+
+from .general_tree import GeneralNode
+
+
+class IndexedGeneralTree:
+    """
+    A general tree with value and parent indexes.
+    
+    The tree must be modified through this wrapper for the indexes to stay
+    valid. Node values must be hashable.
+    
+    Attributes:
+        root: The root node of the tree
+    """
+    
+    def __init__(self, root: Optional[GeneralNode] = None):
+        """
+        Initialize the indexes for an existing general tree in one pass.
+        
+        Args:
+            root: The root node of the tree to index
+        """
+        self.root = root
+        self._by_value: Dict[Any, List[GeneralNode]] = {}
+        self._parent: Dict[int, Tuple[GeneralNode, int]] = {}
+        self._path_cache: Dict[Tuple[int, ...], GeneralNode] = {}
+        # Values whose node list may be out of pre-order after insertions
+        self._unsorted: Set[Any] = set()
+        
+        if root is None:
+            return
+        
+        # Nodes are indexed when popped (pre-order), so the first indexed
+        # node per value is the one find_node returns
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            self._by_value.setdefault(node.value, []).append(node)
+            for index, child in enumerate(node.children):
+                self._parent[id(child)] = (node, index)
+            stack.extend(reversed(node.children))
+    
+    def _index_value(self, node: GeneralNode) -> None:
+        """
+        Helper function to add a node to the value index in O(1).
+        
+        The node is appended; if the value already has nodes, the list is
+        sorted back into pre-order by _nodes_for on the next lookup.
+        """
+        nodes = self._by_value.setdefault(node.value, [])
+        nodes.append(node)
+        if len(nodes) > 1:
+            self._unsorted.add(node.value)
+    
+    def _nodes_for(self, value: Any) -> List[GeneralNode]:
+        """Helper function to get the nodes with a value, in pre-order (find_node order)."""
+        nodes = self._by_value.get(value)
+        if nodes is None:
+            return []
+        if value in self._unsorted:
+            nodes.sort(key=self._preorder_key_function())
+            self._unsorted.discard(value)
+        return nodes
+    
+    def _preorder_key_function(self):
+        """
+        Helper function to build a sort key giving each node its child-index path.
+        
+        Paths compare in pre-order. Parent paths are cached, so siblings walk
+        to the root only once.
+        """
+        parent_paths: Dict[int, Tuple[int, ...]] = {}
+        
+        def key(node: GeneralNode) -> Tuple[int, ...]:
+            link = self._parent.get(id(node))
+            if link is None:
+                return ()
+            parent, index = link
+            path = parent_paths.get(id(parent))
+            if path is None:
+                path = parent_paths[id(parent)] = tuple(self.path_of(parent))
+            return path + (index,)
+        
+        return key
+    
+    def _unindex_value(self, node: GeneralNode) -> None:
+        """Helper function to remove a node from the value index."""
+        nodes = self._by_value[node.value]
+        nodes.remove(node)
+        if not nodes:
+            del self._by_value[node.value]
+            self._unsorted.discard(node.value)
+    
+    def __len__(self) -> int:
+        return len(self._parent) + (1 if self.root is not None else 0)
+    
+    def __contains__(self, value: Any) -> bool:
+        return value in self._by_value
+    
+    def find_node(self, value: Any) -> Optional[GeneralNode]:
+        """
+        Find a node with the specified value in O(1).
+        
+        The first lookup after a duplicate of the value was added sorts its
+        matches once.
+        
+        Args:
+            value: The value to search for
+            
+        Returns:
+            The same node as general_tree.find_node (the first match in
+            pre-order), None if there is none
+        """
+        nodes = self._nodes_for(value)
+        return nodes[0] if nodes else None
+    
+    def find_all(self, value: Any) -> List[GeneralNode]:
+        """
+        Find every node with the specified value.
+        
+        Args:
+            value: The value to search for
+            
+        Returns:
+            List of matching nodes, in pre-order
+        """
+        return list(self._nodes_for(value))
+    
+    def parent_of(self, node: GeneralNode) -> Optional[GeneralNode]:
+        """
+        Get the parent of a node in O(1).
+        
+        Args:
+            node: A node of this tree
+            
+        Returns:
+            The parent node, or None for the root
+        """
+        link = self._parent.get(id(node))
+        return link[0] if link is not None else None
+    
+    def path_of(self, node: GeneralNode) -> Optional[List[int]]:
+        """
+        Get the child-index path from the root to a node without searching.
+        
+        Args:
+            node: A node of this tree
+            
+        Returns:
+            List of child indices usable with add_child_by_path, or None if the
+            node is not part of this tree
+        """
+        path = []
+        current = node
+        while current is not self.root:
+            link = self._parent.get(id(current))
+            if link is None:
+                return None
+            current, index = link
+            path.append(index)
+        
+        path.reverse()
+        return path
+    
+    def get_node_by_path(self, path: List[int]) -> Optional[GeneralNode]:
+        """
+        Get the node at a child-index path.
+        
+        Resolved paths are cached, so repeated lookups of the same path skip
+        the walk from the root.
+        
+        Args:
+            path: A list of child indices (an empty list is the root)
+            
+        Returns:
+            The node at that path, or None if the path is invalid
+        """
+        key = tuple(path)
+        node = self._path_cache.get(key)
+        if node is not None:
+            return node
+        
+        current = self.root
+        if current is None:
+            return None
+        
+        for child_index in path:
+            if not 0 <= child_index < len(current.children):
+                return None
+            current = current.children[child_index]
+        
+        self._path_cache[key] = current
+        return current
+    
+    def add_child_direct(self, node: GeneralNode, value: Any) -> GeneralNode:
+        """
+        Add a child directly to a node of this tree and return the child.
+        
+        Args:
+            node: The parent node
+            value: The value for the new child
+            
+        Returns:
+            The newly created child node
+        """
+        child = GeneralNode(value)
+        self._parent[id(child)] = (node, len(node.children))
+        node.add_child(child)
+        self._index_value(child)
+        return child
+    
+    def add_child_by_path(self, path: List[int], value: Any) -> bool:
+        """
+        Add a child node using a path of child indices.
+        
+        Args:
+            path: A list of integers indicating which child to follow at each level
+            value: The value for the new node
+            
+        Returns:
+            True if node was added successfully, False otherwise
+        """
+        parent = self.get_node_by_path(path)
+        if parent is None:
+            print(f"Cannot add node: invalid path {list(path)}")
+            return False
+        
+        self.add_child_direct(parent, value)
+        return True
+    
+    def edit_general_node_value(self, old_value: Any, new_value: Any) -> bool:
+        """
+        Edit the value of the node find_node returns for old_value.
+        
+        Args:
+            old_value: The current value to find
+            new_value: The new value to set
+            
+        Returns:
+            True if the value was found and updated, False otherwise
+        """
+        node = self.find_node(old_value)
+        if node is None:
+            return False
+        
+        self._unindex_value(node)
+        node.value = new_value
+        self._index_value(node)
+        return True
+    
+    def __repr__(self):
+        return f"IndexedGeneralTree({self.root}, size={len(self)})"
+
+
+# Export all public functions
+__all__ = [
+    'IndexedGeneralTree'
+]
@@ -0,0 +1,261 @@
+"""
+Ancestry Index for General Trees
+Euler tour + sparse table for O(1) lowest-common-ancestor queries, and DFS
+entry/exit times for O(1) ancestor checks.
+
+Building the index takes O(n log n) time and memory. After the tree is
+modified the index is rebuilt lazily, on the next query.
+"""
+
+from typing import Optional, Any, List, Dict
+
+from .general_tree import GeneralNode, add_child_by_path, add_child_direct, find_node
+
+
+class AncestryIndex:
+    """
+    Precomputed ancestry queries on a general tree.
+    
+    Modify the tree through this object, or call invalidate() after changing
+    it directly, so that the next query rebuilds the index.
+    
+    Attributes:
+        root: The root node of the tree
+    """
+    
+    def __init__(self, root: Optional[GeneralNode]):
+        """
+        Initialize a new ancestry index; it is built on the first query.
+        
+        Args:
+            root: The root node of the tree
+        """
+        self.root = root
+        self._dirty = True
+        self._index: Dict[int, int] = {}
+        self._by_value: Dict[Any, GeneralNode] = {}
+        self._nodes: List[GeneralNode] = []
+        self._depth: List[int] = []
+        self._entry: List[int] = []
+        self._exit: List[int] = []
+        self._first: List[int] = []
+        self._sparse: List[List[int]] = []
+    
+    def invalidate(self) -> None:
+        """Mark the index as stale so the next query rebuilds it."""
+        self._dirty = True
+    
+    def _build(self) -> None:
+        """Helper function to compute the Euler tour, entry/exit times and sparse table."""
+        self._index = {}
+        self._by_value = {}
+        self._nodes = []
+        self._depth = []
+        self._entry = []
+        self._exit = []
+        self._first = []
+        self._sparse = []
+        self._dirty = False
+        
+        if self.root is None:
+            return
+        
+        euler: List[int] = []
+        timer = 0
+        self._add_node(self.root, 0)
+        # Each entry: (node, position of the next child to visit)
+        stack = [(self.root, 0)]
+        
+        while stack:
+            node, position = stack[-1]
+            i = self._index[id(node)]
+            euler.append(i)
+            
+            if position == 0:
+                self._first[i] = len(euler) - 1
+                self._entry[i] = timer
+                timer += 1
+            
+            if position < len(node.children):
+                stack[-1] = (node, position + 1)
+                child = node.children[position]
+                self._add_node(child, self._depth[i] + 1)
+                stack.append((child, 0))
+            else:
+                self._exit[i] = timer
+                timer += 1
+                stack.pop()
+        
+        # sparse[k][j] is the shallowest node in euler[j : j + 2**k]
+        depth = self._depth
+        level = euler
+        self._sparse = [level]
+        span = 1
+        while 2 * span <= len(euler):
+            level = [
+                a if depth[a] <= depth[b] else b
+                for a, b in zip(level, level[span:])
+            ]
+            self._sparse.append(level)
+            span *= 2
+    
+    def _add_node(self, node: GeneralNode, depth: int) -> None:
+        """Helper function to assign an integer index to a node."""
+        self._index[id(node)] = len(self._nodes)
+        self._by_value.setdefault(node.value, node)
+        self._nodes.append(node)
+        self._depth.append(depth)
+        self._entry.append(0)
+        self._exit.append(0)
+        self._first.append(0)
+    
+    def _ensure_built(self) -> None:
+        """Helper function to rebuild the index if the tree has changed."""
+        if self._dirty:
+            self._build()
+    
+    def _node_index(self, node: GeneralNode) -> int:
+        """Helper function to get a node's integer index, rebuilding if needed."""
+        self._ensure_built()
+        try:
+            return self._index[id(node)]
+        except KeyError:
+            raise ValueError(f"{node!r} is not part of the indexed tree") from None
+    
+    def find_node(self, value: Any) -> Optional[GeneralNode]:
+        """
+        Find a node with the specified (hashable) value in O(1).
+        
+        Args:
+            value: The value to search for
+            
+        Returns:
+            The same node find_node would return, or None if not found
+        """
+        self._ensure_built()
+        return self._by_value.get(value)
+    
+    def depth(self, node: GeneralNode) -> int:
+        """
+        Get the depth of a node in O(1).
+        
+        Args:
+            node: A node of the tree
+            
+        Returns:
+            Number of edges from the root (the root has depth 0)
+        """
+        i = self._node_index(node)
+        return self._depth[i]
+    
+    def is_ancestor(self, ancestor: GeneralNode, node: GeneralNode) -> bool:
+        """
+        Check whether one node is an ancestor of another in O(1).
+        
+        A node counts as its own ancestor.
+        
+        Args:
+            ancestor: The candidate ancestor
+            node: The candidate descendant
+            
+        Returns:
+            True if ancestor lies on the path from the root to node
+        """
+        a = self._node_index(ancestor)
+        b = self._node_index(node)
+        return self._entry[a] <= self._entry[b] and self._exit[b] <= self._exit[a]
+    
+    def lca(self, first: GeneralNode, second: GeneralNode) -> GeneralNode:
+        """
+        Find the lowest common ancestor of two nodes in O(1).
+        
+        Args:
+            first: A node of the tree
+            second: Another node of the tree
+            
+        Returns:
+            The deepest node that is an ancestor of both
+        """
+        a = self._node_index(first)
+        b = self._node_index(second)
+        low, high = self._first[a], self._first[b]
+        if low > high:
+            low, high = high, low
+        
+        k = (high - low + 1).bit_length() - 1
+        a = self._sparse[k][low]
+        b = self._sparse[k][high - (1 << k) + 1]
+        return self._nodes[a if self._depth[a] <= self._depth[b] else b]
+    
+    def distance(self, first: GeneralNode, second: GeneralNode) -> int:
+        """
+        Get the number of edges on the path between two nodes.
+        
+        Args:
+            first: A node of the tree
+            second: Another node of the tree
+            
+        Returns:
+            The path length in edges
+        """
+        common = self.lca(first, second)
+        return self.depth(first) + self.depth(second) - 2 * self.depth(common)
+    
+    def add_child_direct(self, node: GeneralNode, value: Any) -> GeneralNode:
+        """
+        Add a child directly to a node; the index is rebuilt on the next query.
+        
+        Args:
+            node: The parent node
+            value: The value for the new child
+            
+        Returns:
+            The newly created child node
+        """
+        self.invalidate()
+        return add_child_direct(node, value)
+    
+    def add_child_by_path(self, path: List[int], value: Any) -> bool:
+        """
+        Add a child node using a path of child indices; the index is rebuilt on the next query.
+        
+        Args:
+            path: A list of integers indicating which child to follow at each level
+            value: The value for the new node
+            
+        Returns:
+            True if node was added successfully, False otherwise
+        """
+        added = add_child_by_path(self.root, path, value)
+        if added:
+            self.invalidate()
+        return added
+    
+    def edit_general_node_value(self, old_value: Any, new_value: Any) -> bool:
+        """
+        Edit the value of a node; the value lookup is rebuilt on the next query.
+        
+        Args:
+            old_value: The current value to find
+            new_value: The new value to set
+            
+        Returns:
+            True if the value was found and updated, False otherwise
+        """
+        node = find_node(self.root, old_value)
+        if node is None:
+            return False
+        
+        node.value = new_value
+        self.invalidate()
+        return True
+    
+    def __repr__(self):
+        state = "stale" if self._dirty else f"{len(self._nodes)} nodes"
+        return f"AncestryIndex({self.root}, {state})"
+
+
+# Export all public functions
+__all__ = [
+    'AncestryIndex'
+]
@@ -0,0 +1,200 @@
+"""
+Memory Footprint Reporting
+Estimates how much memory a loaded tree uses, and measures peak allocation
+while a tree is built from a file.
+
+Works for Node, GeneralNode and CompactNode trees, so the representations
+can be compared on the same data.
+"""
+
+import sys
+import tracemalloc
+from typing import Any, Callable, Dict, Iterator, Tuple, Union
+
+from . import Node, build_tree_from_yaml
+from .compact_tree import CompactNode, compact_from_general
+from .conversion import general_to_binary
+from .general_tree import GeneralNode, build_general_tree_from_yaml
+
+TreeRoot = Union[Node, GeneralNode, CompactNode, None]
+
+_dict_bytes_cache: Dict[type, int] = {}
+
+
+def _instance_dict_bytes(cls: type) -> int:
+    """
+    Helper function to get the size of an instance __dict__ for a node class.
+    
+    A probe instance is measured once per class, so the nodes being reported
+    on never have their __dict__ materialized.
+    
+    Args:
+        cls: The node class
+        
+    Returns:
+        Size in bytes of the instance dictionary, 0 for classes with __slots__
+    """
+    if cls not in _dict_bytes_cache:
+        if cls.__dictoffset__ == 0:
+            _dict_bytes_cache[cls] = 0
+        else:
+            _dict_bytes_cache[cls] = sys.getsizeof(cls(None).__dict__)
+    return _dict_bytes_cache[cls]
+
+
+def _iter_nodes(root: TreeRoot) -> Iterator[Any]:
+    """
+    Helper function to iterate over the nodes of any supported tree without recursion.
+    
+    Nodes shared between several parents (hash-consed trees) are yielded once.
+    
+    Args:
+        root: The root node of the tree
+        
+    Yields:
+        Each distinct node of the tree
+    """
+    if root is None:
+        return
+    
+    seen = set()
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        yield node
+        if isinstance(node, GeneralNode):
+            stack.extend(node.children)
+        elif isinstance(node, CompactNode):
+            if node.first_child is not None:
+                stack.append(node.first_child)
+            if node.next_sibling is not None and node is not root:
+                stack.append(node.next_sibling)
+        else:
+            if node.left is not None:
+                stack.append(node.left)
+            if node.right is not None:
+                stack.append(node.right)
+
+
+def memory_report(root: TreeRoot) -> Dict[str, Any]:
+    """
+    Estimate the memory used by a tree.
+    
+    Sizes are shallow sys.getsizeof figures. Values shared between nodes
+    (such as small integers or interned strings) and nodes shared between
+    parents are counted once.
+    
+    Args:
+        root: The root node of a Node, GeneralNode or CompactNode tree
+        
+    Returns:
+        Dictionary with "nodes", "node_bytes" (node objects and their instance
+        dictionaries), "value_bytes", "container_bytes" (children lists),
+        "total_bytes" and "bytes_per_node"
+    """
+    nodes = 0
+    node_bytes = 0
+    value_bytes = 0
+    container_bytes = 0
+    seen_values = set()
+    
+    for node in _iter_nodes(root):
+        nodes += 1
+        node_bytes += sys.getsizeof(node) + _instance_dict_bytes(type(node))
+        
+        if id(node.value) not in seen_values:
+            seen_values.add(id(node.value))
+            value_bytes += sys.getsizeof(node.value)
+        
+        if isinstance(node, GeneralNode):
+            container_bytes += sys.getsizeof(node.children)
+    
+    total = node_bytes + value_bytes + container_bytes
+    return {
+        'nodes': nodes,
+        'node_bytes': node_bytes,
+        'value_bytes': value_bytes,
+        'container_bytes': container_bytes,
+        'total_bytes': total,
+        'bytes_per_node': total / nodes if nodes else 0.0,
+    }
+
+
+def compare_representations(root: GeneralNode) -> Dict[str, Dict[str, Any]]:
+    """
+    Report the memory used by the same general tree in each available representation.
+    
+    Args:
+        root: The root node of a general tree
+        
+    Returns:
+        Dictionary mapping representation name to its memory_report
+    """
+    return {
+        'GeneralNode': memory_report(root),
+        'CompactNode': memory_report(compact_from_general(root)),
+        'Node (left-child/right-sibling)': memory_report(general_to_binary(root)),
+    }
+
+
+def measure_peak_allocation(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Tuple[Any, int]:
+    """
+    Call a function and measure its peak memory allocation with tracemalloc.
+    
+    Args:
+        func: The function to call
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+        
+    Returns:
+        Tuple of (func's return value, peak allocated bytes during the call)
+    """
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+    elif hasattr(tracemalloc, 'reset_peak'):
+        # Python 3.9+: forget peaks from before this call
+        tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    
+    try:
+        result = func(*args, **kwargs)
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        if not already_tracing:
+            tracemalloc.stop()
+    
+    return result, peak
+
+
+def yaml_build_peak(yaml_file: str, general: bool = False) -> Dict[str, Any]:
+    """
+    Measure the peak allocation of building a tree from a YAML file.
+    
+    Args:
+        yaml_file: Path to the YAML file
+        general: Build a general tree instead of a binary tree
+        
+    Returns:
+        Dictionary with "peak_bytes" (during parsing and construction) and
+        "tree_bytes" (memory_report total of the resulting tree)
+    """
+    builder = build_general_tree_from_yaml if general else build_tree_from_yaml
+    root, peak = measure_peak_allocation(builder, yaml_file)
+    
+    return {
+        'peak_bytes': peak,
+        'tree_bytes': memory_report(root)['total_bytes'],
+    }
+
+
+# Export all public functions
+__all__ = [
+    'memory_report',
+    'compare_representations',
+    'measure_peak_allocation',
+    'yaml_build_peak'
+]
@@ -0,0 +1,352 @@
+"""
+Serialization Backends for Binary and General Trees
+Pluggable YAML / JSON / MessagePack persistence sharing the value/left/right/children schema.
+"""
+
+import json
+import os
+import sys
+from typing import Optional, Any, List, Dict, Callable, Union
+
+from . import Node, _tree_to_dict, _build_tree_recursive
+from .general_tree import GeneralNode, _general_tree_to_dict, _build_general_tree_recursive
+from .compact_tree import CompactNode, _compact_tree_to_dict, _build_compact_tree
+
+try:
+    import msgpack
+except ImportError:
+    # MessagePack is optional, the backend is only registered when installed
+    msgpack = None
+
+# Extensions of formats whose backend may not be installed
+_OPTIONAL_EXTENSIONS = {'.msgpack': 'msgpack', '.mpk': 'msgpack'}
+
+
+class SerializationBackend:
+    """
+    A serialization backend converting tree dictionaries to and from file contents.
+    
+    Attributes:
+        name: Short format name (e.g., "json")
+        extensions: File extensions handled by this backend
+        dumps: Function converting a tree dictionary to str or bytes
+        loads: Function converting file bytes back to a tree dictionary
+        binary: Whether dumps produces bytes instead of text
+    """
+    
+    def __init__(self, name: str, extensions: List[str],
+                 dumps: Callable[[Any], Union[str, bytes]],
+                 loads: Callable[[bytes], Any],
+                 binary: bool = False):
+        """
+        Initialize a new serialization backend.
+        
+        Args:
+            name: Short format name
+            extensions: File extensions (with leading dot) handled by this backend
+            dumps: Function converting a tree dictionary to str or bytes
+            loads: Function converting file bytes back to a tree dictionary
+            binary: Whether dumps produces bytes instead of text
+        """
+        self.name = name
+        self.extensions = [ext.lower() for ext in extensions]
+        self.dumps = dumps
+        self.loads = loads
+        self.binary = binary
+    
+    def __repr__(self):
+        return f"SerializationBackend({self.name})"
+
+
+_BACKENDS: Dict[str, SerializationBackend] = {}
+
+
+def register_backend(backend: SerializationBackend) -> None:
+    """
+    Register a serialization backend, replacing any backend with the same name.
+    
+    Args:
+        backend: The backend to register
+    """
+    _BACKENDS[backend.name] = backend
+
+
+def available_formats() -> List[str]:
+    """
+    List the names of all registered serialization formats.
+    
+    Returns:
+        List of format names (e.g., ["yaml", "json", "msgpack"])
+    """
+    return list(_BACKENDS)
+
+
+def _yaml_dumps(data: Any) -> str:
+    """Helper function to dump a tree dictionary to YAML, using libyaml if available."""
+    import yaml
+    dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+    return yaml.dump(data, Dumper=dumper, default_flow_style=False, sort_keys=False)
+
+
+def _yaml_loads(raw: bytes) -> Any:
+    """Helper function to load a tree dictionary from YAML, using libyaml if available."""
+    import yaml
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    return yaml.load(raw, Loader=loader)
+
+
+def _json_dumps(data: Any) -> str:
+    """Helper function to dump a tree dictionary to compact JSON."""
+    return json.dumps(data, separators=(',', ':'))
+
+
+def _json_loads(raw: bytes) -> Any:
+    """Helper function to load a tree dictionary from JSON."""
+    return json.loads(raw)
+
+
+register_backend(SerializationBackend('yaml', ['.yaml', '.yml'], _yaml_dumps, _yaml_loads))
+register_backend(SerializationBackend('json', ['.json'], _json_dumps, _json_loads))
+
+if msgpack is not None:
+    register_backend(SerializationBackend(
+        'msgpack', list(_OPTIONAL_EXTENSIONS),
+        lambda data: msgpack.packb(data, use_bin_type=True),
+        lambda raw: msgpack.unpackb(raw, raw=False),
+        binary=True,
+    ))
+
+
+def _sniff_format(head: bytes) -> str:
+    """
+    Helper function to guess the format from the first bytes of a file.
+    
+    Args:
+        head: The first bytes of the file
+        
+    Returns:
+        The guessed format name
+    """
+    if head:
+        first = head[0]
+        # MessagePack maps (fixmap, map16, map32) and nil
+        if 0x80 <= first <= 0x8f or first in (0xc0, 0xde, 0xdf):
+            return 'msgpack'
+    
+    stripped = head.lstrip()
+    if stripped[:1] in (b'{', b'[') or stripped.startswith(b'null'):
+        return 'json'
+    
+    # YAML is a superset of JSON, so it is the safest fallback
+    return 'yaml'
+
+
+def detect_format(file_path: str) -> Optional[str]:
+    """
+    Detect the serialization format of a file.
+    
+    The file extension is checked first. If it is unknown and the file exists,
+    its leading bytes are inspected instead.
+    
+    Args:
+        file_path: Path to the file
+        
+    Returns:
+        The format name, or None if the format cannot be determined
+    """
+    extension = os.path.splitext(file_path)[1].lower()
+    for backend in _BACKENDS.values():
+        if extension in backend.extensions:
+            return backend.name
+    if extension in _OPTIONAL_EXTENSIONS:
+        return _OPTIONAL_EXTENSIONS[extension]
+    
+    try:
+        with open(file_path, 'rb') as file:
+            head = file.read(16)
+    except OSError:
+        return None
+    
+    return _sniff_format(head)
+
+
+def _get_backend(file_path: str, fmt: Optional[str],
+                 head: Optional[bytes] = None) -> Optional[SerializationBackend]:
+    """Helper function to resolve the backend for a file, printing an error if unavailable."""
+    if fmt is not None:
+        name = fmt
+    elif file_path == '-':
+        # Standard streams have no extension, so sniff the data already read
+        name = _sniff_format(head) if head is not None else None
+    else:
+        name = detect_format(file_path)
+    if name is None:
+        print(f"Error: Cannot detect format of '{file_path}'", file=sys.stderr)
+        return None
+    
+    backend = _BACKENDS.get(name)
+    if backend is None:
+        print(f"Error: Format '{name}' is not available (install the {name} package)",
+              file=sys.stderr)
+        return None
+    
+    return backend
+
+
+def _load_dict(file_path: str, fmt: Optional[str]) -> Optional[Any]:
+    """
+    Helper function to load the raw tree dictionary from a file.
+    
+    Args:
+        file_path: Path to the input file ("-" for stdin)
+        fmt: Format name, or None to detect it
+        
+    Returns:
+        The loaded data, or None if the file cannot be read
+    """
+    try:
+        if file_path == '-':
+            raw = sys.stdin.buffer.read()
+        else:
+            with open(file_path, 'rb') as file:
+                raw = file.read()
+    except FileNotFoundError:
+        print(f"Error: File '{file_path}' not found", file=sys.stderr)
+        return None
+    
+    backend = _get_backend(file_path, fmt, raw[:16])
+    if backend is None:
+        return None
+    
+    try:
+        return backend.loads(raw)
+    except Exception as e:
+        print(f"Error parsing {backend.name} file: {e}", file=sys.stderr)
+        return None
+
+
+def _dump_dict(data: Any, file_path: str, fmt: Optional[str]) -> bool:
+    """
+    Helper function to write a tree dictionary to a file.
+    
+    Args:
+        data: Dictionary representation of the tree
+        file_path: Path to the output file ("-" for stdout, fmt is then required)
+        fmt: Format name, or None to detect it from the extension
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    backend = _get_backend(file_path, fmt)
+    if backend is None:
+        return False
+    
+    try:
+        payload = backend.dumps(data)
+        if file_path == '-':
+            if backend.binary:
+                sys.stdout.buffer.write(payload)
+            else:
+                sys.stdout.write(payload)
+            sys.stdout.flush()
+        elif backend.binary:
+            with open(file_path, 'wb') as file:
+                file.write(payload)
+        else:
+            with open(file_path, 'w', encoding='utf-8') as file:
+                file.write(payload)
+        return True
+    
+    except Exception as e:
+        print(f"Error writing {backend.name} file: {e}", file=sys.stderr)
+        return False
+
+
+def write_tree(root: Union[Node, GeneralNode, CompactNode, None], file_path: str,
+               fmt: Optional[str] = None) -> bool:
+    """
+    Write a binary or general tree to a file in any registered format.
+    
+    Args:
+        root: The root node of the tree (Node, GeneralNode or CompactNode)
+        file_path: Path to the output file ("-" for stdout, fmt is then required)
+        fmt: Format name (e.g., "json"); detected from the extension if None
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    if isinstance(root, GeneralNode):
+        data = _general_tree_to_dict(root)
+    elif isinstance(root, CompactNode):
+        data = _compact_tree_to_dict(root)
+    else:
+        data = _tree_to_dict(root)
+    
+    return _dump_dict(data, file_path, fmt)
+
+
+def read_tree(file_path: str, fmt: Optional[str] = None) -> Optional[Node]:
+    """
+    Build a binary tree from a file in any registered format.
+    
+    Args:
+        file_path: Path to the input file ("-" for stdin)
+        fmt: Format name; detected from the extension or contents if None
+        
+    Returns:
+        The root node of the constructed tree, or None if file cannot be read
+    """
+    data = _load_dict(file_path, fmt)
+    if data is None:
+        return None
+    
+    return _build_tree_recursive(data)
+
+
+def read_general_tree(file_path: str, fmt: Optional[str] = None) -> Optional[GeneralNode]:
+    """
+    Build a general tree from a file in any registered format.
+    
+    Args:
+        file_path: Path to the input file ("-" for stdin)
+        fmt: Format name; detected from the extension or contents if None
+        
+    Returns:
+        The root node of the constructed tree, or None if file cannot be read
+    """
+    data = _load_dict(file_path, fmt)
+    if data is None:
+        return None
+    
+    return _build_general_tree_recursive(data)
+
+
+def read_compact_tree(file_path: str, fmt: Optional[str] = None) -> Optional[CompactNode]:
+    """
+    Build a compact general tree from a file in any registered format.
+    
+    Args:
+        file_path: Path to the input file ("-" for stdin)
+        fmt: Format name; detected from the extension or contents if None
+        
+    Returns:
+        The root node of the constructed tree, or None if file cannot be read
+    """
+    data = _load_dict(file_path, fmt)
+    if data is None:
+        return None
+    
+    return _build_compact_tree(data)
+
+
+# Export all public functions
+__all__ = [
+    'SerializationBackend',
+    'register_backend',
+    'available_formats',
+    'detect_format',
+    'write_tree',
+    'read_tree',
+    'read_general_tree',
+    'read_compact_tree'
+]
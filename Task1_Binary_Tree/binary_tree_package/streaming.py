@@ -0,0 +1,327 @@
+"""
+Streaming Format for General Trees
+Flat NDJSON (newline-delimited JSON) edge list with one record per node, in level order.
+
+Each line is {"id": int, "parent_id": int or null, "value": ...}. Parents always
+come before their children, so a file can be read, split or appended to one
+line at a time. Memory use is limited to the id -> node map.
+"""
+
+import json
+import sys
+from collections import deque
+from typing import Optional, Any, Dict, Iterable, Iterator, TextIO
+
+from .general_tree import GeneralNode
+
+
+def iter_general_tree_records(root: Optional[GeneralNode]) -> Iterator[Dict[str, Any]]:
+    """
+    Generate one record per node of a general tree, in level order.
+    
+    Args:
+        root: The root node of the tree
+        
+    Yields:
+        Records with "id", "parent_id" and "value" keys; the root has parent_id None
+    """
+    if root is None:
+        return
+    
+    next_id = 1
+    queue = deque([(root, 0)])
+    yield {'id': 0, 'parent_id': None, 'value': root.value}
+    
+    while queue:
+        node, node_id = queue.popleft()
+        for child in node.children:
+            yield {'id': next_id, 'parent_id': node_id, 'value': child.value}
+            queue.append((child, next_id))
+            next_id += 1
+
+
+def _iter_dict_records(data: Any) -> Iterator[Dict[str, Any]]:
+    """
+    Helper function to generate level-order records from the nested YAML schema.
+    
+    Entries are validated the same way as in build_general_tree_from_yaml.
+    
+    Args:
+        data: Dictionary containing node data
+        
+    Yields:
+        Records with "id", "parent_id" and "value" keys
+    """
+    if not isinstance(data, dict) or data.get('value') is None:
+        return
+    
+    next_id = 1
+    queue = deque([(data, 0)])
+    yield {'id': 0, 'parent_id': None, 'value': data['value']}
+    
+    while queue:
+        node_data, node_id = queue.popleft()
+        children_data = node_data.get('children', [])
+        if not isinstance(children_data, list):
+            continue
+        for child_data in children_data:
+            if not isinstance(child_data, dict) or child_data.get('value') is None:
+                continue
+            yield {'id': next_id, 'parent_id': node_id, 'value': child_data['value']}
+            queue.append((child_data, next_id))
+            next_id += 1
+
+
+def write_records(records: Iterable[Dict[str, Any]], stream: TextIO) -> int:
+    """
+    Write records to a text stream, one JSON object per line.
+    
+    Args:
+        records: Records to write (any iterable, consumed lazily)
+        stream: Writable text stream
+        
+    Returns:
+        The number of records written
+    """
+    count = 0
+    for record in records:
+        stream.write(json.dumps(record, separators=(',', ':')))
+        stream.write('\n')
+        count += 1
+    return count
+
+
+def read_records(stream: TextIO) -> Iterator[Dict[str, Any]]:
+    """
+    Read records from a text stream, one JSON object per line.
+    
+    Blank lines are skipped.
+    
+    Args:
+        stream: Readable text stream
+        
+    Yields:
+        Each decoded record
+    """
+    for line in stream:
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
+
+def build_general_tree_from_records(records: Iterable[Dict[str, Any]]) -> Optional[GeneralNode]:
+    """
+    Build a general tree from records with parents listed before children.
+    
+    Records whose parent is unknown are reported and skipped.
+    
+    Args:
+        records: Records with "id", "parent_id" and "value" keys
+        
+    Returns:
+        The root node of the constructed tree, or None if there is no root record
+    """
+    nodes: Dict[Any, GeneralNode] = {}
+    root = None
+    
+    for record in records:
+        node = GeneralNode(record['value'])
+        parent_id = record.get('parent_id')
+        
+        if parent_id is None:
+            if root is not None:
+                print(f"Skipping record {record['id']}: tree already has a root",
+                      file=sys.stderr)
+                continue
+            root = node
+        else:
+            parent = nodes.get(parent_id)
+            if parent is None:
+                print(f"Skipping record {record['id']}: unknown parent {parent_id}",
+                      file=sys.stderr)
+                continue
+            parent.add_child(node)
+        
+        nodes[record['id']] = node
+    
+    return root
+
+
+def _open_text(file_path: str, mode: str) -> TextIO:
+    """Helper function to open a file, mapping "-" to stdin or stdout."""
+    if file_path == '-':
+        return sys.stdin if 'r' in mode else sys.stdout
+    return open(file_path, mode, encoding='utf-8')
+
+
+def write_general_tree_to_ndjson(root: Optional[GeneralNode], ndjson_file: str) -> bool:
+    """
+    Write a general tree to an NDJSON file.
+    
+    Args:
+        root: The root node of the tree
+        ndjson_file: Path to the output file ("-" for stdout)
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    try:
+        file = _open_text(ndjson_file, 'w')
+        try:
+            write_records(iter_general_tree_records(root), file)
+        finally:
+            if file is not sys.stdout:
+                file.close()
+        return True
+    
+    except Exception as e:
+        print(f"Error writing to NDJSON file: {e}", file=sys.stderr)
+        return False
+
+
+def build_general_tree_from_ndjson(ndjson_file: str) -> Optional[GeneralNode]:
+    """
+    Build a general tree from an NDJSON file.
+    
+    Args:
+        ndjson_file: Path to the input file ("-" for stdin)
+        
+    Returns:
+        The root node of the constructed tree, or None if file cannot be read
+    """
+    try:
+        file = _open_text(ndjson_file, 'r')
+        try:
+            return build_general_tree_from_records(read_records(file))
+        finally:
+            if file is not sys.stdin:
+                file.close()
+    
+    except FileNotFoundError:
+        print(f"Error: File '{ndjson_file}' not found", file=sys.stderr)
+        return None
+    except (ValueError, KeyError) as e:
+        print(f"Error parsing NDJSON file: {e}", file=sys.stderr)
+        return None
+
+
+def _records_to_dict(records: Iterable[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Helper function to build the nested general tree dictionary schema from records.
+    
+    Args:
+        records: Records with parents listed before children
+        
+    Returns:
+        The nested root dictionary, or None if there is no root record
+    """
+    dicts: Dict[Any, dict] = {}
+    root_dict = None
+    
+    for record in records:
+        node_dict = {'value': record['value']}
+        parent_id = record.get('parent_id')
+        if parent_id is None:
+            if root_dict is not None:
+                print(f"Skipping record {record['id']}: tree already has a root",
+                      file=sys.stderr)
+                continue
+            root_dict = node_dict
+        else:
+            parent_dict = dicts.get(parent_id)
+            if parent_dict is None:
+                print(f"Skipping record {record['id']}: unknown parent {parent_id}",
+                      file=sys.stderr)
+                continue
+            parent_dict.setdefault('children', []).append(node_dict)
+        dicts[record['id']] = node_dict
+    
+    return root_dict
+
+
+def yaml_to_ndjson(yaml_file: str, ndjson_file: str) -> bool:
+    """
+    Convert a nested general tree YAML file to NDJSON without building GeneralNodes.
+    
+    Args:
+        yaml_file: Path to the input YAML file
+        ndjson_file: Path to the output file ("-" for stdout)
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    import yaml
+    try:
+        with open(yaml_file, 'r') as file:
+            data = yaml.safe_load(file)
+    except FileNotFoundError:
+        print(f"Error: File '{yaml_file}' not found", file=sys.stderr)
+        return False
+    except yaml.YAMLError as e:
+        print(f"Error parsing YAML file: {e}", file=sys.stderr)
+        return False
+    
+    try:
+        output = _open_text(ndjson_file, 'w')
+        try:
+            write_records(_iter_dict_records(data), output)
+        finally:
+            if output is not sys.stdout:
+                output.close()
+        return True
+    
+    except Exception as e:
+        print(f"Error writing to NDJSON file: {e}", file=sys.stderr)
+        return False
+
+
+def ndjson_to_yaml(ndjson_file: str, yaml_file: str) -> bool:
+    """
+    Convert an NDJSON file to the nested general tree YAML schema.
+    
+    The nested dictionaries are built directly from the records, without
+    creating GeneralNodes.
+    
+    Args:
+        ndjson_file: Path to the input file ("-" for stdin)
+        yaml_file: Path to the output YAML file
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    import yaml
+    try:
+        file = _open_text(ndjson_file, 'r')
+        try:
+            root_dict = _records_to_dict(read_records(file))
+        finally:
+            if file is not sys.stdin:
+                file.close()
+    except FileNotFoundError:
+        print(f"Error: File '{ndjson_file}' not found", file=sys.stderr)
+        return False
+    except (ValueError, KeyError) as e:
+        print(f"Error parsing NDJSON file: {e}", file=sys.stderr)
+        return False
+    
+    try:
+        with open(yaml_file, 'w') as file:
+            yaml.dump(root_dict, file, default_flow_style=False, sort_keys=False)
+        return True
+    
+    except Exception as e:
+        print(f"Error writing to YAML file: {e}", file=sys.stderr)
+        return False
+
+
+# Export all public functions
+__all__ = [
+    'iter_general_tree_records',
+    'write_records',
+    'read_records',
+    'build_general_tree_from_records',
+    'write_general_tree_to_ndjson',
+    'build_general_tree_from_ndjson',
+    'yaml_to_ndjson',
+    'ndjson_to_yaml'
+]
@@ -22,4 +22,12 @@ setup(
     install_requires=[
         'PyYAML>=5.1',
     ],
+    extras_require={
+        'msgpack': ['msgpack>=1.0'],
+    },
+    entry_points={
+        'console_scripts': [
+            'binary-tree=binary_tree_package.cli:main',
+        ],
+    },
 )
@@ -0,0 +1,128 @@
+"""
+Tests for cached subtree aggregates
+Checks the cached results against values recomputed from scratch after every
+kind of edit.
+"""
+
+import random
+
+from binary_tree_package.general_tree import GeneralNode, add_child_direct
+from binary_tree_package.aggregates import *
+
+
+def subtree_nodes(root):
+    """Collect the nodes of a subtree in pre-order."""
+    nodes = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        nodes.append(node)
+        stack.extend(reversed(node.children))
+    return nodes
+
+
+def brute_force_report(root):
+    """Compute the default aggregates of a subtree without any caching."""
+    values = [node.value for node in subtree_nodes(root)]
+    height = 0
+    stack = [(root, 1)]
+    while stack:
+        node, depth = stack.pop()
+        height = max(height, depth)
+        stack.extend((child, depth + 1) for child in node.children)
+    return {'count': len(values), 'sum': sum(values), 'min': min(values),
+            'max': max(values), 'height': height}
+
+
+def check_all(aggregates):
+    """Compare the cached report of every subtree with a fresh computation."""
+    for node in subtree_nodes(aggregates.root):
+        assert aggregates.report(node) == brute_force_report(node)
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("TEST 1: Initial Aggregates")
+    print("=" * 60)
+    
+    root = GeneralNode(10)
+    a = add_child_direct(root, 5)
+    add_child_direct(root, 20)
+    add_child_direct(a, -3)
+    add_child_direct(a, 7)
+    
+    aggregates = SubtreeAggregates(root)
+    assert aggregates.report() == {'count': 5, 'sum': 39, 'min': -3, 'max': 20, 'height': 3}
+    assert aggregates.get(a, 'sum') == 9
+    check_all(aggregates)
+    print(f"Root report: {aggregates.report()}")
+    print()
+    
+    print("=" * 60)
+    print("TEST 2: Aggregates After Edits")
+    print("=" * 60)
+    
+    aggregates.add_child_direct(a.children[0], 100)
+    check_all(aggregates)
+    assert aggregates.report()['height'] == 4
+    
+    assert aggregates.add_child_by_path([1], -50)
+    check_all(aggregates)
+    assert aggregates.report()['min'] == -50
+    assert not aggregates.add_child_by_path([9], 1)
+    
+    assert aggregates.edit_general_node_value(100, 1)
+    check_all(aggregates)
+    assert aggregates.report()['max'] == 20
+    assert not aggregates.edit_general_node_value(12345, 0)
+    
+    # Direct changes are picked up by refresh()
+    a.children.pop()
+    add_child_direct(a, 40)
+    add_child_direct(a.children[-1], 41)
+    aggregates.refresh(a)
+    check_all(aggregates)
+    assert aggregates.report()['max'] == 41
+    print("Cached results match a full recomputation after every edit")
+    print()
+    
+    print("=" * 60)
+    print("TEST 3: Random Edits")
+    print("=" * 60)
+    
+    rng = random.Random(11)
+    big = SubtreeAggregates(GeneralNode(0))
+    nodes = [big.root]
+    for step in range(300):
+        if step % 3 == 2:
+            node = rng.choice(nodes)
+            node.value = rng.randint(-1000, 1000)
+            big.refresh(node)
+        else:
+            nodes.append(big.add_child_direct(rng.choice(nodes), rng.randint(-1000, 1000)))
+    check_all(big)
+    print(f"{len(nodes)} nodes after 300 random edits, all subtrees correct")
+    print()
+    
+    print("=" * 60)
+    print("TEST 4: Custom Aggregates, Empty Trees and Foreign Nodes")
+    print("=" * 60)
+    
+    words = GeneralNode("root")
+    add_child_direct(add_child_direct(words, "ab"), "cde")
+    leaves = Aggregate('leaves', lambda value, children: sum(children) if children else 1)
+    word_aggregates = SubtreeAggregates(words, (COUNT, HEIGHT, leaves))
+    assert word_aggregates.report() == {'count': 3, 'height': 3, 'leaves': 1}
+    
+    assert SubtreeAggregates(None).report() == {}
+    
+    try:
+        aggregates.get(GeneralNode(10), 'sum')
+        assert False, "foreign node should raise ValueError"
+    except ValueError as e:
+        print(f"Foreign node rejected: {e}")
+    print()
+    
+    print("=" * 60)
+    print("AGGREGATE TESTS COMPLETED SUCCESSFULLY!")
+    print("=" * 60)
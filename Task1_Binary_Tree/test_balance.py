@@ -0,0 +1,135 @@
+"""
+Tests for binary tree balancing
+Checks that the Day-Stout-Warren rebalance keeps the in-order sequence and
+reaches minimal height for skewed, random and already balanced trees.
+"""
+
+import random
+
+from binary_tree_package import Node
+from binary_tree_package.builders import balanced_tree_from_sorted
+from binary_tree_package.balance import *
+
+
+def in_order_nodes(root):
+    """Collect nodes in in-order without recursion."""
+    nodes = []
+    stack = []
+    current = root
+    while stack or current is not None:
+        while current is not None:
+            stack.append(current)
+            current = current.left
+        current = stack.pop()
+        nodes.append(current)
+        current = current.right
+    return nodes
+
+
+def right_chain(values):
+    """Build a tree where every node is the right child of the previous one."""
+    root = Node(values[0])
+    current = root
+    for value in values[1:]:
+        current.right = Node(value)
+        current = current.right
+    return root
+
+
+def left_chain(values):
+    """Build a tree where every node is the left child of the next one."""
+    root = Node(values[-1])
+    current = root
+    for value in reversed(values[:-1]):
+        current.left = Node(value)
+        current = current.left
+    return root
+
+
+def random_bst(values):
+    """Insert values into a plain (unbalanced) binary search tree."""
+    root = None
+    for value in values:
+        if root is None:
+            root = Node(value)
+            continue
+        current = root
+        while True:
+            side = 'left' if value < current.value else 'right'
+            child = getattr(current, side)
+            if child is None:
+                setattr(current, side, Node(value))
+                break
+            current = child
+    return root
+
+
+def check_rebalance(root):
+    """Rebalance a tree and check the in-order nodes and the height."""
+    before = in_order_nodes(root)
+    balanced = rebalance(root)
+    after = in_order_nodes(balanced)
+    # The same node objects, in the same order
+    assert len(after) == len(before)
+    assert all(a is b for a, b in zip(after, before))
+    assert tree_height(balanced) == minimal_height(len(before))
+    return balanced
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("TEST 1: Minimal Height")
+    print("=" * 60)
+    
+    assert [minimal_height(size) for size in range(8)] == [0, 1, 2, 2, 3, 3, 3, 3]
+    assert minimal_height(1023) == 10
+    assert minimal_height(1024) == 11
+    assert tree_height(None) == 0
+    assert balance_report(None)['skew'] == 1.0
+    print("minimal_height matches ceil(log2(size + 1))")
+    print()
+    
+    print("=" * 60)
+    print("TEST 2: Rebalancing Degenerate Chains")
+    print("=" * 60)
+    
+    assert rebalance(None) is None
+    for size in range(1, 130):
+        values = list(range(size))
+        check_rebalance(right_chain(values))
+        check_rebalance(left_chain(values))
+    
+    chain = right_chain(list(range(1000)))
+    report = balance_report(chain)
+    assert report['height'] == 1000 and report['balance_factor'] == -999
+    chain = check_rebalance(chain)
+    report = balance_report(chain)
+    assert report['height'] == report['minimal_height'] == 10
+    assert abs(report['balance_factor']) <= 1
+    print("Chains of 1 to 129 nodes reach minimal height")
+    print(f"1000-node chain: height {report['height']}, skew {report['skew']}")
+    print()
+    
+    print("=" * 60)
+    print("TEST 3: Random and Balanced Trees")
+    print("=" * 60)
+    
+    rng = random.Random(7)
+    for _ in range(50):
+        values = rng.sample(range(10000), rng.randint(1, 300))
+        check_rebalance(random_bst(values))
+    
+    balanced = balanced_tree_from_sorted(list(range(100)))
+    check_rebalance(balanced)
+    
+    # Duplicate values keep their relative in-order position too
+    duplicates = right_chain([1, 1, 2, 2, 2, 3])
+    values_before = [node.value for node in in_order_nodes(duplicates)]
+    duplicates = check_rebalance(duplicates)
+    assert [node.value for node in in_order_nodes(duplicates)] == values_before
+    print("Random search trees keep their in-order sequence")
+    print()
+    
+    print("=" * 60)
+    print("BALANCE TESTS COMPLETED SUCCESSFULLY!")
+    print("=" * 60)
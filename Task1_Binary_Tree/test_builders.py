@@ -0,0 +1,52 @@
+"""
+Tests for the bulk tree builders
+Checks parent-table validation (including cycles) and balanced tree building.
+"""
+
+from binary_tree_package import get_tree_range
+from binary_tree_package.builders import *
+from binary_tree_package.balance import tree_height
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("TEST 1: Parent Table in Any Row Order")
+    print("=" * 60)
+    
+    root = general_tree_from_parent_table([3, 1, 2, 4], [1, None, 1, 2], ["c", "a", "b", "d"])
+    assert root.value == "a"
+    assert [child.value for child in root.children] == ["c", "b"]
+    assert [child.value for child in root.children[1].children] == ["d"]
+    print("Children keep the order of their rows")
+    print()
+    
+    print("=" * 60)
+    print("TEST 2: Invalid Tables Are Rejected")
+    print("=" * 60)
+    
+    invalid = [
+        ([1, 2, 3], [None, 3, 2], "abc"),      # 2 <-> 3 cycle
+        ([1, 2], [None, 2], "ab"),             # node is its own parent
+        ([1, 2], [None, None], "ab"),          # two roots
+        ([1, 2], [2, 1], "ab"),                # no root
+        ([1, 1], [None, 1], "ab"),             # duplicate id
+        ([1, 2], [None, 9], "ab"),             # unknown parent
+    ]
+    for ids, parent_ids, values in invalid:
+        assert general_tree_from_parent_table(ids, parent_ids, values) is None
+    print()
+    
+    print("=" * 60)
+    print("TEST 3: Balanced Tree From Sorted Values")
+    print("=" * 60)
+    
+    values = list(range(1000))
+    balanced = balanced_tree_from_sorted(values)
+    assert get_tree_range(balanced, 0, 999) == values
+    assert tree_height(balanced) == 10
+    assert balanced_tree_from_sorted([]) is None
+    print(f"1000 values, height {tree_height(balanced)}")
+    print()
+    
+    print("=" * 60)
+    print("BUILDER TESTS COMPLETED SUCCESSFULLY!")
+    print("=" * 60)
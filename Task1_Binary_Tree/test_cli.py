@@ -0,0 +1,126 @@
+"""
+Tests for the binary-tree command line interface
+Runs convert, query and stats through main() and as a subprocess, and checks
+exit codes and that diagnostics never reach stdout.
+"""
+
+import contextlib
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+import yaml
+
+from binary_tree_package.cli import main
+
+
+def run_main(argv):
+    """Run the CLI in-process and return (exit code, stdout, stderr)."""
+    out, err = io.StringIO(), io.StringIO()
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+        code = main(argv)
+    return code, out.getvalue(), err.getvalue()
+
+
+def run_process(argv, stdin=""):
+    """Run the CLI as python -m binary_tree_package and return the completed process."""
+    return subprocess.run([sys.executable, '-m', 'binary_tree_package'] + argv,
+                          input=stdin, capture_output=True, text=True)
+
+
+if __name__ == "__main__":
+    workdir = tempfile.mkdtemp()
+    
+    print("=" * 60)
+    print("TEST 1: Convert Between Formats")
+    print("=" * 60)
+    
+    json_file = os.path.join(workdir, "tree.json")
+    ndjson_file = os.path.join(workdir, "tree.ndjson")
+    copy_file = os.path.join(workdir, "copy.ndjson")
+    yaml_file = os.path.join(workdir, "tree.yaml")
+    
+    assert run_main(['convert', 'general_tree_output.yaml', json_file])[0] == 0
+    assert run_main(['convert', json_file, ndjson_file])[0] == 0
+    assert run_main(['convert', ndjson_file, copy_file])[0] == 0
+    assert run_main(['convert', copy_file, yaml_file])[0] == 0
+    with open('general_tree_output.yaml') as original, open(yaml_file) as converted:
+        assert yaml.safe_load(original) == yaml.safe_load(converted)
+    print("YAML -> JSON -> NDJSON -> NDJSON -> YAML keeps the tree")
+    print()
+    
+    print("=" * 60)
+    print("TEST 2: Warnings Stay Out of Piped Output")
+    print("=" * 60)
+    
+    records = ('{"id": 0, "parent_id": null, "value": "root"}\n'
+               '{"id": 5, "parent_id": 9, "value": "orphan"}\n'
+               '{"id": 1, "parent_id": 0, "value": "child"}\n')
+    result = run_process(['convert', '-', '-', '--from', 'ndjson', '--to', 'json'], records)
+    assert result.returncode == 0
+    assert json.loads(result.stdout) == {'value': 'root', 'children': [{'value': 'child'}]}
+    assert "Skipping record 5: unknown parent 9" in result.stderr
+    print(f"stderr: {result.stderr.strip()}")
+    print()
+    
+    print("=" * 60)
+    print("TEST 3: Errors Exit Non-Zero Without Tracebacks")
+    print("=" * 60)
+    
+    missing = os.path.join(workdir, "missing.ndjson")
+    unwritable = os.path.join(workdir, "no_such_dir", "out.ndjson")
+    cases = [
+        ['convert', missing, copy_file],
+        ['convert', 'general_tree_output.yaml', unwritable],
+        ['convert', ndjson_file, unwritable],
+        ['convert', 'general_tree_output.yaml', '-'],
+    ]
+    for argv in cases:
+        result = run_process(argv)
+        assert result.returncode != 0, argv
+        assert "Traceback" not in result.stderr and result.stdout == "", result.stderr
+        print(f"exit {result.returncode}: {result.stderr.strip()}")
+    
+    try:
+        import msgpack
+    except ImportError:
+        code, _, err = run_main(['convert', json_file, os.path.join(workdir, "tree.msgpack")])
+        assert code == 1 and "not available" in err
+        print(f"exit {code}: {err.strip()}")
+    print()
+    
+    print("=" * 60)
+    print("TEST 4: Query")
+    print("=" * 60)
+    
+    assert run_main(['query', 'test.yaml', '--find', '7']) == (0, "LR\n", "")
+    assert run_main(['query', 'test.yaml', '--path', 'RR']) == (0, "18\n", "")
+    assert run_main(['query', 'test.yaml', '--range', '5', '15']) == (0, "5\n7\n10\n15\n", "")
+    assert run_main(['query', 'general_tree_output.yaml', '--find', 'Child 2.3'])[:2] == (0, "1,2\n")
+    assert run_main(['query', 'test.yaml', '--find', '99'])[0] == 1
+    assert run_main(['query', 'test.yaml', '--path', 'LLL'])[0] == 1
+    assert run_main(['query', missing, '--path', ''])[0] == 1
+    print("find / path / range results and exit codes match")
+    print()
+    
+    print("=" * 60)
+    print("TEST 5: Stats")
+    print("=" * 60)
+    
+    code, out, _ = run_main(['stats', 'test.yaml', '--json'])
+    stats = json.loads(out)
+    assert code == 0 and stats['kind'] == 'binary' and stats['size'] == 6
+    code, out, _ = run_main(['stats', 'general_tree_output.yaml', '--json'])
+    stats = json.loads(out)
+    assert code == 0 and stats['kind'] == 'general' and stats['height'] == 3
+    print(out.strip())
+    print()
+    
+    shutil.rmtree(workdir)
+    print("=" * 60)
+    print("CLI TESTS COMPLETED SUCCESSFULLY!")
+    print("=" * 60)
@@ -0,0 +1,158 @@
+"""
+Tests for tree cloning, subtree extraction and grafting
+Checks that copies are independent of the original for every node type, and
+that extracted subtrees can be grafted back with the same path addressing.
+"""
+
+from binary_tree_package import Node, build_tree_from_yaml
+from binary_tree_package.general_tree import GeneralNode, add_child_direct
+from binary_tree_package.compact_tree import CompactNode, compact_from_general, iter_compact_tree
+from binary_tree_package.hashcons import hash_cons, count_nodes
+from binary_tree_package.clone import *
+
+
+def binary_shape(root):
+    """Collect (value, has left, has right) triples in pre-order."""
+    shape = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if node is None:
+            continue
+        shape.append((node.value, node.left is not None, node.right is not None))
+        stack.append(node.right)
+        stack.append(node.left)
+    return shape
+
+
+def general_shape(root):
+    """Collect (value, child count) pairs in pre-order."""
+    shape = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        shape.append((node.value, len(node.children)))
+        stack.extend(reversed(node.children))
+    return shape
+
+
+def general_nodes(root):
+    """Collect the nodes of a general tree in pre-order."""
+    nodes = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        nodes.append(node)
+        stack.extend(reversed(node.children))
+    return nodes
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("TEST 1: Cloning Each Node Type")
+    print("=" * 60)
+    
+    binary = build_tree_from_yaml("test.yaml")
+    binary_copy = clone_tree(binary)
+    assert binary_shape(binary_copy) == binary_shape(binary)
+    binary_copy.value = "changed"
+    assert binary.value != "changed"
+    
+    general = GeneralNode("root")
+    first = add_child_direct(general, "first")
+    add_child_direct(first, ["mutable"])
+    add_child_direct(add_child_direct(first, "deep"), "deeper")
+    add_child_direct(general, "second")
+    
+    general_copy = clone_tree(general)
+    assert general_shape(general_copy) == general_shape(general)
+    original_ids = {id(node) for node in general_nodes(general)}
+    assert not original_ids & {id(node) for node in general_nodes(general_copy)}
+    # Values are shared by default and copied with copy_values=True
+    assert general_copy.children[0].children[0].value is first.children[0].value
+    deep_copy = clone_tree(general, copy_values=True)
+    assert deep_copy.children[0].children[0].value == ["mutable"]
+    assert deep_copy.children[0].children[0].value is not first.children[0].value
+    
+    compact = compact_from_general(general)
+    compact_copy = clone_tree(compact)
+    compact_nodes = list(iter_compact_tree(compact))
+    copy_nodes = list(iter_compact_tree(compact_copy))
+    assert [node.value for node in copy_nodes] == [node.value for node in compact_nodes]
+    assert not {id(node) for node in compact_nodes} & {id(node) for node in copy_nodes}
+    # The copy accepts new children at the end, like the original
+    compact_copy.first_child.add_child(CompactNode("appended"))
+    assert [child.value for child in compact_copy.first_child.children()] == [["mutable"], "deep", "appended"]
+    assert [child.value for child in compact.first_child.children()] == [["mutable"], "deep"]
+    
+    assert clone_tree(None) is None
+    print("Node, GeneralNode and CompactNode copies share no nodes")
+    print()
+    
+    print("=" * 60)
+    print("TEST 2: Deep and Shared Trees")
+    print("=" * 60)
+    
+    chain = GeneralNode(0)
+    current = chain
+    for value in range(1, 5000):
+        current = add_child_direct(current, value)
+    assert general_shape(clone_tree(chain)) == general_shape(chain)
+    
+    # Shared subtrees are copied once per occurrence
+    repeated = GeneralNode("root")
+    for _ in range(4):
+        add_child_direct(add_child_direct(repeated, "team"), "member")
+    shared = hash_cons(repeated)
+    assert count_nodes(shared) == (9, 3)
+    assert count_nodes(clone_tree(shared)) == (9, 9)
+    print("A 5000-deep chain and a shared tree are cloned without recursion")
+    print()
+    
+    print("=" * 60)
+    print("TEST 3: Extracting Subtrees")
+    print("=" * 60)
+    
+    extracted = extract_subtree(general, [0, 1])
+    assert general_shape(extracted) == [("deep", 1), ("deeper", 0)]
+    assert extracted is not first.children[1]
+    assert general_shape(extract_subtree(general, [])) == general_shape(general)
+    assert extract_subtree(general, [5]) is None
+    
+    left = extract_subtree(binary, "L")
+    assert binary_shape(left) == binary_shape(binary.left)
+    assert extract_subtree(binary, "LLLLLLLL") is None
+    assert extract_subtree(binary, "X") is None
+    print()
+    
+    print("=" * 60)
+    print("TEST 4: Grafting Subtrees")
+    print("=" * 60)
+    
+    assert graft_subtree(general, [1], extracted)
+    assert general.children[1].children[-1] is extracted
+    assert general_shape(general.children[1]) == [("second", 1), ("deep", 1), ("deeper", 0)]
+    assert not graft_subtree(general, [7], clone_tree(extracted))
+    
+    # Binary trees: the last direction is the position of the subtree
+    target = Node(10)
+    target.left = Node(5)
+    assert graft_subtree(target, "R", Node(15))
+    assert graft_subtree(target, "LR", extract_subtree(target, "R"))
+    assert binary_shape(target) == [
+        (10, True, True), (5, False, True), (15, False, False), (15, False, False)
+    ]
+    assert target.left.right is not target.right
+    assert graft_subtree(target, "R", Node(20))
+    assert target.right.value == 20
+    
+    assert not graft_subtree(target, "", Node(1))
+    assert not graft_subtree(target, "RRR", Node(1))
+    assert not graft_subtree(target, "L", GeneralNode(1))
+    assert not graft_subtree(general, [0], Node(1))
+    print("Grafts follow add_node_by_path / add_child_by_path addressing")
+    print()
+    
+    print("=" * 60)
+    print("CLONE TESTS COMPLETED SUCCESSFULLY!")
+    print("=" * 60)
@@ -0,0 +1,68 @@
+"""
+Tests for the compact first-child/next-sibling tree representation
+Checks conversion from and to GeneralNode, childless roots and wide trees.
+"""
+
+import time
+
+from binary_tree_package.general_tree import *
+from binary_tree_package.compact_tree import *
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("TEST 1: Round Trip Through GeneralNode")
+    print("=" * 60)
+    
+    root = GeneralNode("Root")
+    child1 = add_child_direct(root, "Child 1")
+    child2 = add_child_direct(root, "Child 2")
+    add_child_direct(child1, "Child 1.1")
+    add_child_direct(child1, "Child 1.2")
+    add_child_direct(child2, "Child 2.1")
+    
+    compact = compact_from_general(root)
+    values = [node.value for node in iter_compact_tree(compact)]
+    print(f"Pre-order: {values}")
+    assert values == ["Root", "Child 1", "Child 1.1", "Child 1.2", "Child 2", "Child 2.1"]
+    assert find_compact_node(compact, "Child 2.1").value == "Child 2.1"
+    
+    back = compact_to_general(compact)
+    assert [child.value for child in back.children] == ["Child 1", "Child 2"]
+    assert [child.value for child in back.children[0].children] == ["Child 1.1", "Child 1.2"]
+    assert compact_from_general(None) is None and compact_to_general(None) is None
+    print_compact_tree(compact)
+    print()
+    
+    print("=" * 60)
+    print("TEST 2: Childless Root")
+    print("=" * 60)
+    
+    single = CompactNode("Alone")
+    print_compact_tree(single)
+    assert list(iter_compact_tree(single)) == [single]
+    assert compact_to_general(single).children == []
+    print()
+    
+    print("=" * 60)
+    print("TEST 3: Appending to Converted and Wide Nodes")
+    print("=" * 60)
+    
+    # Nodes built by the converters have no cached tail yet
+    add_compact_child(compact, "Child 3")
+    add_compact_child(compact, "Child 4")
+    assert [child.value for child in compact.children()] == ["Child 1", "Child 2", "Child 3", "Child 4"]
+    
+    wide = CompactNode("Wide")
+    start = time.perf_counter()
+    for i in range(200000):
+        add_compact_child(wide, i)
+    elapsed = time.perf_counter() - start
+    values = [child.value for child in wide.children()]
+    assert values == list(range(200000))
+    print(f"Appended 200,000 children in {elapsed * 1000:.0f}ms")
+    assert elapsed < 5, "appending children is not O(1)"
+    print()
+    
+    print("=" * 60)
+    print("COMPACT TREE TESTS COMPLETED SUCCESSFULLY!")
+    print("=" * 60)
@@ -0,0 +1,88 @@
+"""
+Stress test for the thread-safe tree wrapper
+Readers check an invariant that only holds between complete write operations.
+"""
+
+import threading
+import time
+
+from binary_tree_package import Node, delete_node
+from binary_tree_package.concurrent_tree import ConcurrentTree
+from binary_tree_package.benchmarks import bench_concurrent, print_results
+
+
+def build_balanced_pairs(pairs):
+    """Build a right-leaning tree of values +k/-k whose values sum to zero."""
+    root = Node(0)
+    node = root
+    for k in range(1, pairs + 1):
+        node.right = Node(k)
+        node.right.right = Node(-k)
+        node = node.right.right
+    return root
+
+
+def writer(tree, first_value, rounds):
+    """Atomically add a +k/-k pair at the end of the right spine, then remove it."""
+    for k in range(first_value, first_value + rounds):
+        with tree.write() as handle:
+            node = handle.root
+            while node.right is not None:
+                node = node.right
+            node.right = Node(k)
+            # A reader seeing the tree here would find a non-zero sum
+            time.sleep(0)
+            node.right.right = Node(-k)
+        
+        with tree.write() as handle:
+            handle.root = delete_node(handle.root, k)
+            time.sleep(0)
+            handle.root = delete_node(handle.root, -k)
+
+
+def reader(tree, stop, errors, reads):
+    """Repeatedly check that the visible tree always sums to zero."""
+    while not stop.is_set():
+        values = tree.get_tree_range(float('-inf'), float('inf'))
+        if sum(values) != 0:
+            errors.append(values)
+        reads.append(len(values))
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("TEST 1: Readers Never See Torn Writes")
+    print("=" * 60)
+    
+    tree = ConcurrentTree(build_balanced_pairs(200))
+    stop = threading.Event()
+    errors = []
+    reads = []
+    
+    readers = [threading.Thread(target=reader, args=(tree, stop, errors, reads)) for _ in range(8)]
+    writers = [threading.Thread(target=writer, args=(tree, 1000 * (i + 1), 200)) for i in range(4)]
+    
+    for thread in readers + writers:
+        thread.start()
+    for thread in writers:
+        thread.join()
+    stop.set()
+    for thread in readers:
+        thread.join()
+    
+    print(f"Reads performed: {len(reads)}")
+    print(f"Write operations: {tree.version}")
+    print(f"Torn reads detected: {len(errors)}")
+    print(f"Final node count: {len(tree.get_tree_range(float('-inf'), float('inf')))}")
+    assert not errors, "readers observed a partially applied write"
+    assert tree.version == 4 * 200 * 2
+    print()
+    
+    print("=" * 60)
+    print("TEST 2: Throughput for Different Read/Write Ratios")
+    print("=" * 60)
+    print_results("Concurrent Tree Throughput (size=5000)", bench_concurrent(5000))
+    
+    print("=" * 60)
+    print("CONCURRENT TREE TESTS COMPLETED SUCCESSFULLY!")
+    print("=" * 60)
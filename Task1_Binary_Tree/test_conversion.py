@@ -0,0 +1,129 @@
+"""
+Tests for general <-> binary tree conversion
+Round-trips general trees through the left-child/right-sibling encoding and
+checks the path translation between the two addressing schemes.
+"""
+
+import random
+
+from binary_tree_package import Node, get_tree_range
+from binary_tree_package.general_tree import GeneralNode, add_child_direct
+from binary_tree_package.conversion import *
+
+
+def general_shape(root):
+    """Collect (value, child count) pairs in pre-order."""
+    shape = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        shape.append((node.value, len(node.children)))
+        stack.extend(reversed(node.children))
+    return shape
+
+
+def general_paths(root):
+    """Collect (child-index path, node) pairs for every node."""
+    paths = []
+    stack = [([], root)]
+    while stack:
+        path, node = stack.pop()
+        paths.append((path, node))
+        for index, child in enumerate(node.children):
+            stack.append((path + [index], child))
+    return paths
+
+
+def binary_node_at(root, path):
+    """Follow an L/R path from the root of a binary tree."""
+    current = root
+    for direction in path:
+        current = current.left if direction == 'L' else current.right
+    return current
+
+
+def random_general_tree(rng, size):
+    """Build a general tree of the given size with random parents."""
+    nodes = [GeneralNode(0)]
+    for value in range(1, size):
+        nodes.append(add_child_direct(rng.choice(nodes), value))
+    return nodes[0]
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("TEST 1: Left-Child/Right-Sibling Encoding")
+    print("=" * 60)
+    
+    root = GeneralNode("A")
+    b = add_child_direct(root, "B")
+    add_child_direct(root, "C")
+    add_child_direct(root, "D")
+    add_child_direct(b, "E")
+    
+    binary = general_to_binary(root)
+    assert binary.value == "A" and binary.right is None
+    assert binary.left.value == "B"
+    assert binary.left.left.value == "E"
+    assert binary.left.right.value == "C"
+    assert binary.left.right.right.value == "D"
+    assert binary.left.right.left is None
+    assert general_to_binary(None) is None
+    print("First child is the left link, next sibling the right link")
+    print()
+    
+    print("=" * 60)
+    print("TEST 2: Round Trip")
+    print("=" * 60)
+    
+    assert general_shape(binary_to_general(binary)) == general_shape(root)
+    
+    rng = random.Random(3)
+    for size in (1, 2, 10, 500):
+        tree = random_general_tree(rng, size)
+        converted = general_to_binary(tree)
+        assert sorted(get_tree_range(converted, 0, size)) == list(range(size))
+        assert general_shape(binary_to_general(converted)) == general_shape(tree)
+    
+    # A deep chain must not hit the recursion limit
+    chain = GeneralNode(0)
+    current = chain
+    for value in range(1, 5000):
+        current = add_child_direct(current, value)
+    assert general_shape(binary_to_general(general_to_binary(chain))) == general_shape(chain)
+    print("Random and 5000-deep trees convert back unchanged")
+    print()
+    
+    print("=" * 60)
+    print("TEST 3: Invalid Encodings")
+    print("=" * 60)
+    
+    sibling_root = Node("root")
+    sibling_root.right = Node("sibling")
+    assert binary_to_general(sibling_root) is None
+    assert binary_to_general(None) is None
+    print()
+    
+    print("=" * 60)
+    print("TEST 4: Path Translation")
+    print("=" * 60)
+    
+    assert general_path_to_lr([]) == ""
+    assert general_path_to_lr([0, 2]) == "LLRR"
+    assert lr_path_to_general("LLRR") == [0, 2]
+    assert lr_path_to_general("") == []
+    assert lr_path_to_general("R") is None
+    assert lr_path_to_general("LX") is None
+    
+    tree = random_general_tree(rng, 200)
+    converted = general_to_binary(tree)
+    for path, node in general_paths(tree):
+        lr_path = general_path_to_lr(path)
+        assert binary_node_at(converted, lr_path).value == node.value
+        assert lr_path_to_general(lr_path) == path
+    print("Every node is reached by its translated path")
+    print()
+    
+    print("=" * 60)
+    print("CONVERSION TESTS COMPLETED SUCCESSFULLY!")
+    print("=" * 60)
@@ -4,6 +4,7 @@ This demonstrates the n-ary tree implementation.
 """
 
 from binary_tree_package.general_tree import *
+from binary_tree_package.indexed_tree import IndexedGeneralTree
 
 if __name__ == "__main__":
     print("=" * 60)
@@ -141,6 +142,70 @@ if __name__ == "__main__":
             print(f"  - {child.value}")
     print()
     
+    # Test 7: Indexed tree lookups match find_node
+    print("=" * 60)
+    print("TEST 7: Indexed Tree Matches find_node")
+    print("=" * 60)
+    
+    dup_root = GeneralNode("root")
+    a = add_child_direct(dup_root, "a")
+    add_child_direct(a, 5)
+    add_child_direct(dup_root, 5)
+    indexed = IndexedGeneralTree(dup_root)
+    assert indexed.find_node(5) is find_node(dup_root, 5)
+    print(f"Duplicate value 5 resolves to the child of {indexed.parent_of(indexed.find_node(5)).value!r}")
+    
+    # Duplicates added or renamed later keep the find_node order
+    indexed.add_child_direct(dup_root.children[0], "x")
+    indexed.add_child_direct(dup_root, 5)
+    indexed.edit_general_node_value("x", 5)
+    assert indexed.find_node(5) is find_node(dup_root, 5)
+    assert indexed.find_all(5)[0] is find_node(dup_root, 5)
+    indexed.edit_general_node_value(5, 6)
+    assert indexed.find_node(5) is find_node(dup_root, 5)
+    assert indexed.find_node(6) is find_node(dup_root, 6)
+    print("Lookups match find_node after adding and editing nodes")
+    print()
+    
+    # Test 8: Batch and breadth-first search
+    print("=" * 60)
+    print("TEST 8: Batch and Bounded-Depth Search")
+    print("=" * 60)
+    
+    # "dup" appears deep in the first branch and shallow in the second
+    search_root = GeneralNode("root")
+    left = add_child_direct(search_root, "left")
+    left_mid = add_child_direct(left, "left-mid")
+    deep_dup = add_child_direct(left_mid, "dup")
+    shallow_dup = add_child_direct(search_root, "dup")
+    add_child_direct(shallow_dup, "leaf")
+    
+    # find_nodes returns the same (pre-order) matches as find_node
+    batch = find_nodes(search_root, ["dup", "leaf", "left-mid", "missing"])
+    assert set(batch) == {"dup", "leaf", "left-mid"}
+    for value, node in batch.items():
+        assert node is find_node(search_root, value)
+    assert batch["dup"] is deep_dup
+    assert find_nodes(search_root, []) == {}
+    assert find_nodes(None, ["dup"]) == {}
+    print(f"find_nodes found {sorted(batch)} and left out 'missing'")
+    
+    # find_node_bfs returns the shallowest match instead
+    assert find_node_bfs(search_root, "dup") is shallow_dup
+    assert find_node_bfs(search_root, "root") is search_root
+    assert find_node_bfs(search_root, "missing") is None
+    assert find_node_bfs(None, "dup") is None
+    print("find_node_bfs prefers the shallow 'dup' over the pre-order one")
+    
+    # max_depth bounds the search; the root is level 0
+    assert find_node_bfs(search_root, "dup", max_depth=0) is None
+    assert find_node_bfs(search_root, "dup", max_depth=1) is shallow_dup
+    assert find_node_bfs(search_root, "left-mid", max_depth=1) is None
+    assert find_node_bfs(search_root, "left-mid", max_depth=2) is left_mid
+    assert find_node_bfs(search_root, "root", max_depth=0) is search_root
+    print("max_depth excludes nodes deeper than the limit")
+    print()
+    
     print("=" * 60)
     print("BONUS FEATURE TESTS COMPLETED SUCCESSFULLY!")
     print("=" * 60)
@@ -0,0 +1,135 @@
+"""
+Tests for hash-consed general trees
+Checks that identical subtrees are shared, that sharing survives the YAML and
+JSON round trip, and that unshare gives back an independent tree.
+"""
+
+import os
+import shutil
+import tempfile
+
+from binary_tree_package.general_tree import GeneralNode, add_child_direct, build_general_tree_from_yaml
+from binary_tree_package.hashcons import *
+
+
+def general_shape(root):
+    """Collect (value, child count) pairs in pre-order."""
+    shape = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        shape.append((node.value, len(node.children)))
+        stack.extend(reversed(node.children))
+    return shape
+
+
+def build_repeated_tree():
+    """Build a tree whose three departments have identical staff subtrees."""
+    root = GeneralNode("company")
+    for name in ("sales", "support", "research"):
+        department = add_child_direct(root, name)
+        for _ in range(3):
+            team = add_child_direct(department, "team")
+            add_child_direct(team, "lead")
+            add_child_direct(team, "member")
+    return root
+
+
+if __name__ == "__main__":
+    workdir = tempfile.mkdtemp()
+    
+    try:
+        print("=" * 60)
+        print("TEST 1: Identical Subtrees Are Shared")
+        print("=" * 60)
+        
+        original = build_repeated_tree()
+        shape = general_shape(original)
+        shared = hash_cons(original)
+        
+        assert general_shape(shared) == shape
+        assert count_nodes(original) == (31, 31)
+        # company, three departments, one team, lead and member
+        assert count_nodes(shared) == (31, 7)
+        teams = [team for department in shared.children for team in department.children]
+        assert all(team is teams[0] for team in teams)
+        # Departments differ by value, so they stay separate
+        assert len({id(department) for department in shared.children}) == 3
+        # The input tree is not modified
+        assert general_shape(original) == shape
+        assert count_nodes(original) == (31, 31)
+        assert hash_cons(None) is None and count_nodes(None) == (0, 0)
+        print(f"31 logical nodes share {count_nodes(shared)[1]} objects")
+        print()
+        
+        print("=" * 60)
+        print("TEST 2: Values Must Match Exactly")
+        print("=" * 60)
+        
+        mixed = GeneralNode("root")
+        for value in (1, 1.0, True, 1):
+            add_child_direct(mixed, value)
+        add_child_direct(mixed, [1, 2])
+        add_child_direct(mixed, [1, 2])
+        mixed_shared = hash_cons(mixed)
+        children = mixed_shared.children
+        assert children[0] is children[3]
+        assert children[0] is not children[1] and children[0] is not children[2]
+        # Unhashable values are copied but never shared
+        assert children[4] is not children[5] and children[4].value == [1, 2]
+        print("1, 1.0 and True stay separate; unhashable values are not shared")
+        print()
+        
+        print("=" * 60)
+        print("TEST 3: Unshare Before Editing")
+        print("=" * 60)
+        
+        expanded = unshare(shared)
+        assert general_shape(expanded) == shape
+        assert count_nodes(expanded) == (31, 31)
+        expanded.children[0].children[0].children[0].value = "manager"
+        assert general_shape(shared) == shape
+        assert unshare(None) is None
+        print("Editing the expanded tree leaves the shared tree unchanged")
+        print()
+        
+        print("=" * 60)
+        print("TEST 4: Sharing Survives the File Round Trip")
+        print("=" * 60)
+        
+        yaml_path = os.path.join(workdir, "shared.yaml")
+        assert write_shared_general_tree_to_yaml(shared, yaml_path)
+        loaded = build_shared_general_tree_from_yaml(yaml_path)
+        assert general_shape(loaded) == shape
+        assert count_nodes(loaded) == (31, 7)
+        # Anchors and aliases expand when read as a plain general tree
+        plain = build_general_tree_from_yaml(yaml_path)
+        assert general_shape(plain) == shape and count_nodes(plain) == (31, 31)
+        
+        json_path = os.path.join(workdir, "shared.json")
+        assert write_shared_tree(shared, json_path)
+        loaded = read_shared_tree(json_path)
+        assert general_shape(loaded) == shape
+        assert count_nodes(loaded) == (31, 7)
+        print("YAML anchors and the JSON table both keep 7 distinct nodes")
+        print()
+        
+        print("=" * 60)
+        print("TEST 5: Sharing Report")
+        print("=" * 60)
+        
+        report = sharing_report(shared)
+        assert report['nodes'] == 31 and report['unique_nodes'] == 7
+        assert report['shared_bytes'] < report['tree_bytes']
+        assert report['shared_yaml_bytes'] < report['yaml_bytes']
+        assert report['shared_json_bytes'] < report['json_bytes']
+        print(f"Memory: {report['tree_bytes']} -> {report['shared_bytes']} bytes")
+        print(f"JSON: {report['json_bytes']} -> {report['shared_json_bytes']} bytes")
+        print()
+    
+    finally:
+        shutil.rmtree(workdir)
+    
+    print("=" * 60)
+    print("HASH-CONS TESTS COMPLETED SUCCESSFULLY!")
+    print("=" * 60)
@@ -0,0 +1,135 @@
+"""
+Tests for the ancestry index
+Compares lowest common ancestors, depths, distances and ancestor checks with
+a brute-force walk up the parent links.
+"""
+
+import random
+
+from binary_tree_package.general_tree import GeneralNode, add_child_direct, find_node
+from binary_tree_package.lca_index import *
+
+
+def random_tree(rng, size):
+    """Build a random general tree and return its nodes and parent links."""
+    nodes = [GeneralNode(0)]
+    parent = {id(nodes[0]): None}
+    for value in range(1, size):
+        chosen = rng.choice(nodes)
+        node = add_child_direct(chosen, value)
+        parent[id(node)] = chosen
+        nodes.append(node)
+    return nodes, parent
+
+
+def ancestors(node, parent):
+    """List a node and its ancestors, deepest first."""
+    chain = []
+    while node is not None:
+        chain.append(node)
+        node = parent[id(node)]
+    return chain
+
+
+def brute_force_lca(first, second, parent):
+    """Find the lowest common ancestor by comparing ancestor chains."""
+    second_ancestors = {id(node) for node in ancestors(second, parent)}
+    for node in ancestors(first, parent):
+        if id(node) in second_ancestors:
+            return node
+    return None
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("TEST 1: Small Tree")
+    print("=" * 60)
+    
+    root = GeneralNode("root")
+    a = add_child_direct(root, "a")
+    b = add_child_direct(root, "b")
+    a1 = add_child_direct(a, "a1")
+    a2 = add_child_direct(a, "a2")
+    a11 = add_child_direct(a1, "a11")
+    
+    index = AncestryIndex(root)
+    assert index.lca(a11, a2) is a
+    assert index.lca(a11, b) is root
+    assert index.lca(a1, a11) is a1
+    assert index.lca(b, b) is b
+    assert index.depth(root) == 0 and index.depth(a11) == 3
+    assert index.distance(a11, b) == 4
+    assert index.is_ancestor(a, a11) and index.is_ancestor(a11, a11)
+    assert not index.is_ancestor(a11, a) and not index.is_ancestor(b, a2)
+    assert index.find_node("a2") is a2
+    print(f"lca(a11, a2) = {index.lca(a11, a2).value}, distance(a11, b) = {index.distance(a11, b)}")
+    print()
+    
+    print("=" * 60)
+    print("TEST 2: Random Trees Against Brute Force")
+    print("=" * 60)
+    
+    rng = random.Random(5)
+    for size in (1, 2, 3, 50, 400):
+        nodes, parent = random_tree(rng, size)
+        index = AncestryIndex(nodes[0])
+        for _ in range(300):
+            first, second = rng.choice(nodes), rng.choice(nodes)
+            expected = brute_force_lca(first, second, parent)
+            assert index.lca(first, second) is expected
+            assert index.lca(second, first) is expected
+            depth = len(ancestors(first, parent)) - 1
+            second_depth = len(ancestors(second, parent)) - 1
+            common_depth = len(ancestors(expected, parent)) - 1
+            assert index.depth(first) == depth
+            assert index.distance(first, second) == depth + second_depth - 2 * common_depth
+            assert index.is_ancestor(first, second) == (expected is first)
+    print("LCA, depth, distance and is_ancestor match on 1500 random queries")
+    
+    # A deep chain must not hit the recursion limit
+    chain = [GeneralNode(0)]
+    for value in range(1, 5000):
+        chain.append(add_child_direct(chain[-1], value))
+    index = AncestryIndex(chain[0])
+    assert index.lca(chain[4999], chain[1234]) is chain[1234]
+    assert index.distance(chain[0], chain[4999]) == 4999
+    print("5000-deep chain indexed without recursion")
+    print()
+    
+    print("=" * 60)
+    print("TEST 3: Edits Rebuild the Index")
+    print("=" * 60)
+    
+    index = AncestryIndex(root)
+    assert index.lca(a11, b) is root
+    b1 = index.add_child_direct(b, "b1")
+    assert index.lca(b1, a11) is root and index.depth(b1) == 2
+    assert index.add_child_by_path([0, 1], "a21")
+    a21 = index.find_node("a21")
+    assert index.lca(a21, a11) is a
+    assert index.edit_general_node_value("a21", "renamed")
+    assert index.find_node("renamed") is a21 and index.find_node("a21") is None
+    
+    # Direct changes need invalidate()
+    direct = add_child_direct(a21, "direct")
+    index.invalidate()
+    assert index.lca(direct, a11) is a and index.depth(direct) == 4
+    assert find_node(root, "direct") is index.find_node("direct")
+    print("Queries see nodes added and renamed after the first build")
+    print()
+    
+    print("=" * 60)
+    print("TEST 4: Foreign Nodes")
+    print("=" * 60)
+    
+    try:
+        index.lca(root, GeneralNode("root"))
+        assert False, "foreign node should raise ValueError"
+    except ValueError as e:
+        print(f"Foreign node rejected: {e}")
+    assert AncestryIndex(None).find_node("root") is None
+    print()
+    
+    print("=" * 60)
+    print("LCA INDEX TESTS COMPLETED SUCCESSFULLY!")
+    print("=" * 60)
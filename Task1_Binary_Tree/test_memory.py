@@ -0,0 +1,91 @@
+"""
+Tests for memory footprint reporting
+Checks node counts and byte totals for every tree representation, including
+hash-consed trees with shared nodes, and the peak allocation helpers.
+"""
+
+from binary_tree_package import Node
+from binary_tree_package.general_tree import GeneralNode, add_child_direct
+from binary_tree_package.hashcons import hash_cons
+from binary_tree_package.memory import *
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("TEST 1: Report Totals")
+    print("=" * 60)
+    
+    root = GeneralNode(0)
+    for value in range(1, 100):
+        add_child_direct(root, value)
+    add_child_direct(root.children[0], 1000)
+    
+    report = memory_report(root)
+    assert report['nodes'] == 101
+    assert report['total_bytes'] == report['node_bytes'] + report['value_bytes'] + report['container_bytes']
+    assert report['bytes_per_node'] == report['total_bytes'] / 101
+    assert memory_report(None) == {
+        'nodes': 0, 'node_bytes': 0, 'value_bytes': 0, 'container_bytes': 0,
+        'total_bytes': 0, 'bytes_per_node': 0.0,
+    }
+    print(f"101 general nodes: {report['total_bytes']} bytes")
+    print()
+    
+    print("=" * 60)
+    print("TEST 2: Representations of the Same Tree")
+    print("=" * 60)
+    
+    reports = compare_representations(root)
+    assert set(reports) == {'GeneralNode', 'CompactNode', 'Node (left-child/right-sibling)'}
+    for name, representation in reports.items():
+        assert representation['nodes'] == 101, name
+        assert representation['value_bytes'] == report['value_bytes'], name
+        print(f"{name}: {representation['bytes_per_node']:.1f} bytes/node")
+    assert reports['CompactNode']['container_bytes'] == 0
+    assert reports['CompactNode']['total_bytes'] < reports['GeneralNode']['total_bytes']
+    
+    binary = Node(1)
+    binary.left = Node(2)
+    binary.right = Node(3)
+    assert memory_report(binary)['nodes'] == 3
+    print()
+    
+    print("=" * 60)
+    print("TEST 3: Shared Values and Nodes Are Counted Once")
+    print("=" * 60)
+    
+    shared_value = "x" * 1000
+    repeated = GeneralNode(shared_value)
+    for _ in range(10):
+        add_child_direct(repeated, shared_value)
+    assert memory_report(repeated)['value_bytes'] < 2 * len(shared_value)
+    
+    # Ten identical subtrees collapse to one after hash-consing
+    duplicated = GeneralNode("root")
+    for _ in range(10):
+        add_child_direct(add_child_direct(duplicated, "leaf"), "inner")
+    shared = hash_cons(duplicated)
+    assert memory_report(duplicated)['nodes'] == 21
+    assert memory_report(shared)['nodes'] == 3
+    print("A hash-consed tree with 21 logical nodes reports 3")
+    print()
+    
+    print("=" * 60)
+    print("TEST 4: Peak Allocation")
+    print("=" * 60)
+    
+    result, peak = measure_peak_allocation(lambda size: [0] * size, 100000)
+    assert len(result) == 100000
+    assert peak >= 100000 * 8
+    
+    build = yaml_build_peak("test.yaml")
+    assert build['peak_bytes'] > 0 and build['tree_bytes'] > 0
+    general_build = yaml_build_peak("general_tree_output.yaml", general=True)
+    assert general_build['tree_bytes'] > 0
+    print(f"test.yaml: peak {build['peak_bytes']} bytes, tree {build['tree_bytes']} bytes")
+    print(f"general tree YAML: tree {general_build['tree_bytes']} bytes")
+    print()
+    
+    print("=" * 60)
+    print("MEMORY TESTS COMPLETED SUCCESSFULLY!")
+    print("=" * 60)
@@ -0,0 +1,88 @@
+"""
+Tests for the pluggable serialization backends
+Round-trips binary, general and compact trees through every available format
+and checks format detection.
+"""
+
+import os
+import shutil
+import tempfile
+
+from binary_tree_package import build_tree_from_yaml, get_tree_range
+from binary_tree_package.general_tree import build_general_tree_from_yaml
+from binary_tree_package.compact_tree import iter_compact_tree
+from binary_tree_package.serialization import *
+
+
+def general_values(root):
+    """Collect general tree values in pre-order."""
+    values = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        values.append(node.value)
+        stack.extend(reversed(node.children))
+    return values
+
+
+if __name__ == "__main__":
+    workdir = tempfile.mkdtemp()
+    binary_root = build_tree_from_yaml("test.yaml")
+    general_root = build_general_tree_from_yaml("general_tree_output.yaml")
+    extensions = {'yaml': '.yaml', 'json': '.json', 'msgpack': '.msgpack'}
+    
+    print("=" * 60)
+    print("TEST 1: Round Trip Through Every Format")
+    print("=" * 60)
+    
+    for fmt in available_formats():
+        binary_file = os.path.join(workdir, "binary" + extensions[fmt])
+        general_file = os.path.join(workdir, "general" + extensions[fmt])
+        assert write_tree(binary_root, binary_file)
+        assert write_tree(general_root, general_file)
+        
+        assert get_tree_range(read_tree(binary_file), 0, 100) == [3, 5, 7, 10, 15, 18]
+        assert general_values(read_general_tree(general_file)) == general_values(general_root)
+        compact = read_compact_tree(general_file)
+        assert [node.value for node in iter_compact_tree(compact)] == general_values(general_root)
+        print(f"{fmt}: binary, general and compact trees round-trip")
+    print()
+    
+    print("=" * 60)
+    print("TEST 2: Format Detection")
+    print("=" * 60)
+    
+    assert detect_format("tree.yml") == 'yaml'
+    assert detect_format("tree.JSON") == 'json'
+    assert detect_format("tree.msgpack") == 'msgpack'
+    
+    # Files without a known extension are recognised from their first bytes
+    for fmt in available_formats():
+        unnamed = os.path.join(workdir, "unnamed_" + fmt)
+        shutil.copy(os.path.join(workdir, "general" + extensions[fmt]), unnamed)
+        assert detect_format(unnamed) == fmt, fmt
+        assert general_values(read_general_tree(unnamed)) == general_values(general_root)
+    
+    assert detect_format(os.path.join(workdir, "missing")) is None
+    assert read_tree(os.path.join(workdir, "missing.json")) is None
+    print("Extensions and contents detected")
+    print()
+    
+    print("=" * 60)
+    print("TEST 3: Custom Backend")
+    print("=" * 60)
+    
+    register_backend(SerializationBackend(
+        'repr', ['.repr'], lambda data: repr(data),
+        lambda raw: __import__('ast').literal_eval(raw.decode())))
+    repr_file = os.path.join(workdir, "tree.repr")
+    assert 'repr' in available_formats()
+    assert write_tree(general_root, repr_file)
+    assert general_values(read_general_tree(repr_file)) == general_values(general_root)
+    print("Registered backend is used for its extension")
+    print()
+    
+    shutil.rmtree(workdir)
+    print("=" * 60)
+    print("SERIALIZATION TESTS COMPLETED SUCCESSFULLY!")
+    print("=" * 60)
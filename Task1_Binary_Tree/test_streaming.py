@@ -0,0 +1,136 @@
+"""
+Tests for the NDJSON streaming format
+Round-trips general trees through NDJSON files and checks how bad records are
+reported and skipped.
+"""
+
+import io
+import os
+import shutil
+import tempfile
+from contextlib import redirect_stdout, redirect_stderr
+
+import yaml
+
+from binary_tree_package.general_tree import GeneralNode, add_child_direct, build_general_tree_from_yaml
+from binary_tree_package.streaming import *
+
+
+def general_shape(root):
+    """Collect (value, child count) pairs in pre-order."""
+    shape = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        shape.append((node.value, len(node.children)))
+        stack.extend(reversed(node.children))
+    return shape
+
+
+if __name__ == "__main__":
+    workdir = tempfile.mkdtemp()
+    
+    root = GeneralNode("root")
+    first = add_child_direct(root, "first")
+    add_child_direct(first, 1)
+    add_child_direct(first, 2.5)
+    second = add_child_direct(root, "second")
+    add_child_direct(add_child_direct(second, "nested"), True)
+    
+    try:
+        print("=" * 60)
+        print("TEST 1: Records Are Level Order, Parents First")
+        print("=" * 60)
+        
+        records = list(iter_general_tree_records(root))
+        assert [record['value'] for record in records] == ["root", "first", "second", 1, 2.5, "nested", True]
+        seen = set()
+        for record in records:
+            assert record['parent_id'] is None or record['parent_id'] in seen
+            seen.add(record['id'])
+        assert list(iter_general_tree_records(None)) == []
+        print(f"{len(records)} records, every parent before its children")
+        print()
+        
+        print("=" * 60)
+        print("TEST 2: NDJSON File Round Trip")
+        print("=" * 60)
+        
+        ndjson_path = os.path.join(workdir, "tree.ndjson")
+        assert write_general_tree_to_ndjson(root, ndjson_path)
+        with open(ndjson_path) as file:
+            assert len(file.read().splitlines()) == len(records)
+        loaded = build_general_tree_from_ndjson(ndjson_path)
+        assert general_shape(loaded) == general_shape(root)
+        print("Tree read back with the same values and structure")
+        print()
+        
+        print("=" * 60)
+        print("TEST 3: Bad Records Are Skipped and Reported on stderr")
+        print("=" * 60)
+        
+        stream = io.StringIO()
+        write_records(records, stream)
+        stream.write('\n')
+        stream.write('{"id":50,"parent_id":99,"value":"orphan"}\n')
+        stream.write('{"id":51,"parent_id":null,"value":"second root"}\n')
+        stream.seek(0)
+        
+        out, err = io.StringIO(), io.StringIO()
+        with redirect_stdout(out), redirect_stderr(err):
+            loaded = build_general_tree_from_records(read_records(stream))
+        assert general_shape(loaded) == general_shape(root)
+        assert "Skipping record 50: unknown parent 99" in err.getvalue()
+        assert "Skipping record 51: tree already has a root" in err.getvalue()
+        assert out.getvalue() == ""
+        print(err.getvalue().rstrip())
+        print()
+        
+        print("=" * 60)
+        print("TEST 4: Unreadable Files Return None")
+        print("=" * 60)
+        
+        broken_path = os.path.join(workdir, "broken.ndjson")
+        with open(broken_path, 'w') as file:
+            file.write('{"id":0,"parent_id":null,"value":"root"}\n{not json\n')
+        
+        err = io.StringIO()
+        with redirect_stderr(err):
+            assert build_general_tree_from_ndjson(broken_path) is None
+            assert build_general_tree_from_ndjson(os.path.join(workdir, "missing.ndjson")) is None
+        assert "Error parsing NDJSON file" in err.getvalue()
+        assert "not found" in err.getvalue()
+        print("Malformed and missing files are reported without a traceback")
+        print()
+        
+        print("=" * 60)
+        print("TEST 5: YAML <-> NDJSON Without GeneralNodes")
+        print("=" * 60)
+        
+        yaml_path = os.path.join(workdir, "tree.yaml")
+        converted_path = os.path.join(workdir, "converted.ndjson")
+        assert ndjson_to_yaml(ndjson_path, yaml_path)
+        assert general_shape(build_general_tree_from_yaml(yaml_path)) == general_shape(root)
+        assert yaml_to_ndjson(yaml_path, converted_path)
+        with open(ndjson_path) as original, open(converted_path) as converted:
+            assert original.read() == converted.read()
+        
+        # Unknown parents are skipped by the YAML conversion as well
+        with open(broken_path, 'w') as file:
+            file.write('{"id":0,"parent_id":null,"value":"root"}\n')
+            file.write('{"id":1,"parent_id":7,"value":"orphan"}\n')
+        err = io.StringIO()
+        with redirect_stderr(err):
+            assert ndjson_to_yaml(broken_path, yaml_path)
+        with open(yaml_path) as file:
+            assert yaml.safe_load(file) == {'value': 'root'}
+        assert "unknown parent 7" in err.getvalue()
+        print("Conversions round trip and skip orphan records")
+        print()
+    
+    finally:
+        shutil.rmtree(workdir)
+    
+    print("=" * 60)
+    print("STREAMING TESTS COMPLETED SUCCESSFULLY!")
+    print("=" * 60)
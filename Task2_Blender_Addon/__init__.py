@@ -20,7 +20,24 @@ bl_info = {
 import bpy
 import bmesh
 import math
-from mathutils import Vector
+import time
+import numpy as np
+from bpy.app.handlers import persistent
+
+from .core.broad_phase import connected_components, sweep_and_prune
+from .core.cube_geometry import cube_geometry
+from .core.face_matching import find_common_faces_arrays
+from .core.mesh_buffers import MeshBufferCache
+from .core.mesh_merge import MeshArrays, merge_material_slots, merge_mesh_arrays
+from .core.placement import plan_cube_locations
+from .core.scene_index import SceneIndex
+
+
+# Maximum number of cubes per generate call (the screening task's limit)
+CUBE_LIMIT = 20
+
+# Maximum with the "Large Arrays" option enabled
+LARGE_CUBE_LIMIT = 100000
 
 
 # ============================================================================
@@ -56,116 +73,719 @@ def get_optimal_grid_dimensions(n):
     return (rows, cols)
 
 
-def check_collision(location, existing_cubes, cube_size=1.0, spacing=0.1):
+def is_scene_cube(obj):
+    """Check whether an object is a cube (a mesh object using a Cube mesh)."""
+    return obj.type == 'MESH' and obj.data is not None and obj.data.name.startswith('Cube')
+
+
+def get_all_scene_cubes(scene=None):
+    """Get all cube objects in the scene (from mesh objects)."""
+    if scene is None:
+        scene = bpy.context.scene
+    return [obj for obj in scene.objects if is_scene_cube(obj)]
+
+
+def find_common_faces(mesh1, mesh2, tolerance=0.0001, cache=None):
     """
-    Check if a cube at the given location would collide with existing cubes.
+    Find faces that are common between two meshes (overlapping faces).
+    
+    Faces are common when their world-space centres are closer than the
+    tolerance and their normals are opposite. Candidate pairs come from a
+    hash of quantised face centres (see core/face_matching.py).
     
     Args:
-        location: Vector location to check
-        existing_cubes: List of existing cube objects
-        cube_size: Size of the cube
-        spacing: Minimum spacing between cubes
+        mesh1: First mesh object
+        mesh2: Second mesh object
+        tolerance: Distance tolerance for considering faces as overlapping
+        cache: MeshBufferCache to read the meshes through (optional)
     
     Returns:
-        bool: True if collision detected, False otherwise
+        tuple: (common_faces_mesh1_indices, common_faces_mesh2_indices)
     """
-    min_distance = cube_size + spacing
+    if cache is None:
+        cache = MeshBufferCache()
+    buffers1 = cache.get(mesh1.data)
+    buffers2 = cache.get(mesh2.data)
     
-    for cube in existing_cubes:
-        distance = (Vector(cube.location) - location).length
-        if distance < min_distance:
-            return True
+    return find_common_faces_arrays(np.array(mesh1.matrix_world),
+                                    buffers1.polygon_centers, buffers1.polygon_normals,
+                                    np.array(mesh2.matrix_world),
+                                    buffers2.polygon_centers, buffers2.polygon_normals,
+                                    tolerance)
+
+
+def write_mesh_arrays(mesh, arrays):
+    """
+    Fill an empty mesh datablock from MeshArrays in one call.
+    
+    Args:
+        mesh: New, empty mesh datablock
+        arrays: MeshArrays with the geometry, face materials, smooth flags
+                and UV maps
+    """
+    mesh.from_pydata(arrays.vertices, [], arrays.faces())
+    if arrays.face_count:
+        mesh.polygons.foreach_set("material_index", arrays.face_materials.astype(np.int32))
+        mesh.polygons.foreach_set("use_smooth", arrays.face_smooth)
+        # The first map created becomes the active one
+        for name, uvs in arrays.uv_layers.items():
+            uv_layer = mesh.uv_layers.new(name=name)
+            uv_layer.data.foreach_set("uv", uvs.astype(np.float32).ravel())
+    mesh.update()
+
+
+def iter_cube_objects(collection, locations, cube_size=1.0, shared_mesh=False,
+                      chunk_size=500):
+    """
+    Create one cube object per location through the data API, in chunks.
     
-    return False
+    The cube geometry is written once into a template mesh and copied for
+    every cube (or shared by all cubes as linked duplicates), and each chunk
+    of objects is linked to the collection in one pass, so no operator (and
+    no scene update) runs per cube.
+    
+    Args:
+        collection: Collection to link the cubes to
+        locations: (N, 3) array of cube centres
+        cube_size: Edge length of the cubes
+        shared_mesh: Use one mesh datablock for all cubes
+        chunk_size: Number of cubes created per chunk
+    
+    Yields:
+        list: The objects of each chunk, named Cube_1 ... Cube_N overall
+    """
+    if len(locations) == 0:
+        return
+    
+    template = bpy.data.meshes.new("Cube")
+    write_mesh_arrays(template, cube_geometry(cube_size))
+    
+    locations = np.asarray(locations).tolist()
+    link = collection.objects.link
+    for first in range(0, len(locations), chunk_size):
+        objects = []
+        for i in range(first, min(first + chunk_size, len(locations))):
+            mesh = template if i == 0 or shared_mesh else template.copy()
+            obj = bpy.data.objects.new(f"Cube_{i + 1}", mesh)
+            obj.location = locations[i]
+            objects.append(obj)
+        
+        for obj in objects:
+            link(obj)
+        yield objects
 
 
-def find_safe_location(row, col, cube_size, spacing, existing_cubes, max_attempts=100):
+def create_cube_objects(collection, locations, cube_size=1.0, shared_mesh=False):
     """
-    Find a safe location for a cube, avoiding collisions.
+    Create one cube object per location through the data API.
     
     Args:
-        row: Target row
-        col: Target column
-        cube_size: Size of the cube
-        spacing: Spacing between cubes
-        existing_cubes: List of existing cubes
-        max_attempts: Maximum attempts to find safe location
+        collection: Collection to link the cubes to
+        locations: (N, 3) array of cube centres
+        cube_size: Edge length of the cubes
+        shared_mesh: Use one mesh datablock for all cubes
     
     Returns:
-        Vector: Safe location or None if not found
+        list: The new objects, named Cube_1 ... Cube_N
     """
-    base_x = col * (cube_size + spacing)
-    base_y = row * (cube_size + spacing)
-    base_location = Vector((base_x, base_y, 0))
+    return [obj for chunk in iter_cube_objects(collection, locations, cube_size, shared_mesh)
+            for obj in chunk]
+
+
+def merge_objects(objects, tolerance=0.0001, cache=None):
+    """
+    Merge mesh objects into the first one without entering edit mode.
+    
+    The meshes are welded and their interior faces removed in NumPy
+    (core/mesh_merge.py), and the result is written back once into a new
+    mesh, so meshes shared with linked duplicates are never modified. The
+    new mesh gets the material slots of all objects (each material once),
+    their smooth flags and UV maps. The other objects are deleted.
+    
+    Args:
+        objects: Mesh objects to merge (the first one receives the result)
+        tolerance: Distance for merging vertices
+        cache: MeshBufferCache to read the meshes through (optional)
+    
+    Returns:
+        tuple: (merged object, welded vertex count, removed face count)
+    """
+    if cache is None:
+        cache = MeshBufferCache()
+    
+    # Slots are keyed by material pointer; None stands for an empty slot
+    materials = {}
+    slot_lists = []
+    for obj in objects:
+        keys = []
+        for material in obj.data.materials:
+            key = material.as_pointer() if material is not None else None
+            materials[key] = material
+            keys.append(key)
+        slot_lists.append(keys or [None])
+    slots, remaps = merge_material_slots(slot_lists)
+    
+    parts = []
+    for obj, remap in zip(objects, remaps):
+        buffers = cache.get(obj.data)
+        # Out-of-range indices use the last slot, as Blender draws them
+        face_materials = remap[np.clip(buffers.face_materials, 0, len(remap) - 1)]
+        parts.append(MeshArrays(buffers.world_vertices(np.array(obj.matrix_world)),
+                                buffers.loop_starts, buffers.loop_totals,
+                                buffers.loop_vertices, face_materials=face_materials,
+                                face_smooth=buffers.face_smooth,
+                                uv_layers=buffers.uv_layers))
+    merged, welded, removed = merge_mesh_arrays(parts, tolerance)
     
-    # Try the base location first
-    if not check_collision(base_location, existing_cubes, cube_size, spacing):
-        return base_location
+    # Store the result in the first object's local space, like a join
+    target = objects[0]
+    merged = merged.transformed(np.linalg.inv(np.array(target.matrix_world)))
     
-    # Try spiral pattern outward
-    for attempt in range(1, max_attempts):
-        offset = attempt * spacing
-        for angle in range(0, 360, 45):
-            rad = math.radians(angle)
-            test_location = Vector((
-                base_x + offset * math.cos(rad),
-                base_y + offset * math.sin(rad),
-                0
-            ))
-            if not check_collision(test_location, existing_cubes, cube_size, spacing):
-                return test_location
+    old_mesh = target.data
+    mesh = bpy.data.meshes.new(old_mesh.name)
+    write_mesh_arrays(mesh, merged)
+    if slots != [None]:
+        for key in slots:
+            mesh.materials.append(materials.get(key))
+    target.data = mesh
     
-    return None
+    # Linked duplicates share meshes: free each old mesh once, when unused
+    forget_scene_objects(objects[1:])
+    old_meshes = {old_mesh.as_pointer(): old_mesh}
+    for obj in objects[1:]:
+        old_meshes.setdefault(obj.data.as_pointer(), obj.data)
+        bpy.data.objects.remove(obj, do_unlink=True)
+    for data in old_meshes.values():
+        if data.users == 0:
+            # Caches are keyed by pointer, which a new mesh may reuse
+            cache.invalidate(data)
+            scene_mesh_cache.invalidate(data)
+            bpy.data.meshes.remove(data)
+    
+    return target, welded, removed
 
 
-def get_all_scene_cubes():
-    """Get all cube objects in the scene (from mesh objects)."""
-    return [obj for obj in bpy.context.scene.objects 
-            if obj.type == 'MESH' and obj.data.name.startswith('Cube')]
+def make_instances_real(context, objects):
+    """
+    Replace instancers among objects with real objects.
+    
+    Collection instances and vertex/face instancers are turned into one
+    object per instance with duplicates_make_real. Linked duplicates are
+    already real objects and are returned as they are. The instancers
+    themselves are left out of the returned objects (a mesh instancer's own
+    geometry is not merged), so callers can report them.
+    
+    Args:
+        context: Blender context
+        objects: Objects to check
+    
+    Returns:
+        tuple: (objects, instancers) - the objects that are not instancers
+               followed by the new objects, and the instancers left out
+    """
+    instancers = [obj for obj in objects if obj.is_instancer]
+    if not instancers:
+        return list(objects), []
+    
+    others = [obj for obj in objects if not obj.is_instancer]
+    bpy.ops.object.select_all(action='DESELECT')
+    for obj in instancers:
+        obj.select_set(True)
+    context.view_layer.objects.active = instancers[0]
+    bpy.ops.object.duplicates_make_real()
+    
+    made_real = [obj for obj in context.selected_objects if obj not in instancers]
+    return others + made_real, instancers
+
+
+def format_names(names, limit=10):
+    """Join object names for a report, shortening long lists."""
+    if len(names) <= limit:
+        return ", ".join(names)
+    return f"{', '.join(names[:limit])} and {len(names) - limit} more"
+
+
+# ============================================================================
+# SCENE CUBE INDEX
+# ============================================================================
 
+# World-space bounds of the scene's cubes, kept up to date by the depsgraph
+# handler below so generating cubes does not rescan the scene
+scene_cube_index = SceneIndex()
 
-def find_common_faces(mesh1, mesh2, tolerance=0.0001):
+# Mesh data of indexed cubes; entries are dropped when their geometry changes
+scene_mesh_cache = MeshBufferCache()
+
+
+def sync_scene_cube_index(scene):
     """
-    Find faces that are common between two meshes (overlapping faces).
+    Rebuild the scene cube index if it is dirty or belongs to another scene.
     
     Args:
-        mesh1: First mesh object
-        mesh2: Second mesh object
-        tolerance: Distance tolerance for considering faces as overlapping
+        scene: The scene to index
     
     Returns:
-        tuple: (common_faces_mesh1_indices, common_faces_mesh2_indices)
+        SceneIndex: The up-to-date index
+    """
+    index = scene_cube_index
+    if index.dirty or index.owner != scene.as_pointer():
+        objects = list(scene.objects)
+        cubes = [obj for obj in objects if is_scene_cube(obj)]
+        scene_mesh_cache.clear()
+        box_min, box_max = scene_mesh_cache.world_bounds(cubes)
+        index.rebuild([obj.as_pointer() for obj in cubes], box_min, box_max,
+                      owner=scene.as_pointer(),
+                      scene_keys=[obj.as_pointer() for obj in objects])
+    return index
+
+
+def index_scene_objects(scene, objects):
     """
-    # Convert mesh data to world space
-    mesh1_faces = []
-    for face in mesh1.data.polygons:
-        center = mesh1.matrix_world @ face.center
-        normal = mesh1.matrix_world.to_3x3() @ face.normal
-        mesh1_faces.append((center, normal, face.index))
-    
-    mesh2_faces = []
-    for face in mesh2.data.polygons:
-        center = mesh2.matrix_world @ face.center
-        normal = mesh2.matrix_world.to_3x3() @ face.normal
-        mesh2_faces.append((center, normal, face.index))
-    
-    common_mesh1 = []
-    common_mesh2 = []
-    
-    # Check for overlapping faces
-    for i, (center1, normal1, idx1) in enumerate(mesh1_faces):
-        for j, (center2, normal2, idx2) in enumerate(mesh2_faces):
-            # Check if centers are close
-            distance = (center1 - center2).length
-            
-            # Check if normals are opposite (faces pointing at each other)
-            normal_dot = normal1.dot(normal2)
-            
-            if distance < tolerance and normal_dot < -0.9:  # Opposite normals
-                common_mesh1.append(idx1)
-                common_mesh2.append(idx2)
-    
-    return (list(set(common_mesh1)), list(set(common_mesh2)))
+    Update the index entries of objects that were added, moved or edited.
+    
+    Cubes are inserted or moved, other objects are removed from the index.
+    Nothing happens while the index is waiting for a rebuild.
+    
+    Args:
+        scene: The scene the objects belong to
+        objects: Original (not evaluated) objects
+    """
+    index = scene_cube_index
+    if index.dirty or index.owner != scene.as_pointer():
+        return
+    
+    cubes = [obj for obj in objects if is_scene_cube(obj)]
+    index.discard([obj.as_pointer() for obj in objects if not is_scene_cube(obj)])
+    if cubes:
+        box_min, box_max = scene_mesh_cache.world_bounds(cubes)
+        index.update([obj.as_pointer() for obj in cubes], box_min, box_max)
+    index.scene_keys.update(obj.as_pointer() for obj in objects)
+
+
+def index_created_cubes(scene, cubes, locations, cube_size):
+    """
+    Add cubes that were just created to the index.
+    
+    New objects have no evaluated world matrix until the next depsgraph
+    update, so their bounds are taken from the locations they were created at.
+    
+    Args:
+        scene: The scene the cubes were linked to
+        cubes: The new cube objects
+        locations: (N, 3) array of their centres
+        cube_size: Edge length of the cubes
+    """
+    index = scene_cube_index
+    if index.dirty or index.owner != scene.as_pointer() or not cubes:
+        return
+    
+    keys = [obj.as_pointer() for obj in cubes]
+    locations = np.asarray(locations, dtype=np.float64).reshape(-1, 3)
+    index.update(keys, locations - cube_size / 2, locations + cube_size / 2)
+    index.scene_keys.update(keys)
+
+
+def forget_scene_objects(objects):
+    """
+    Drop objects that are about to be deleted from the index.
+    
+    Args:
+        objects: Objects that will be removed from the scene
+    """
+    keys = [obj.as_pointer() for obj in objects]
+    scene_cube_index.discard(keys)
+    scene_cube_index.scene_keys.difference_update(keys)
+
+
+def reconcile_scene_objects(scene, changed):
+    """
+    Find objects added to or deleted from the scene since the last update.
+    
+    Deleted objects are dropped from the index, added objects are put into
+    changed so they are indexed with the other updated objects. This walks
+    the scene once, so it only runs for structural updates.
+    
+    Args:
+        scene: The indexed scene
+        changed: Dictionary of pointer -> object to be indexed, extended in place
+    """
+    index = scene_cube_index
+    objects = {obj.as_pointer(): obj for obj in scene.objects}
+    index.discard(index.scene_keys - objects.keys())
+    for key in objects.keys() - index.scene_keys:
+        changed.setdefault(key, objects[key])
+    index.scene_keys = set(objects)
+
+
+@persistent
+def on_depsgraph_update(scene, depsgraph):
+    """Apply object changes to the scene cube index."""
+    index = scene_cube_index
+    if index.dirty or index.owner != scene.as_pointer():
+        return
+    
+    changed = {}
+    structural = False
+    object_entries = False
+    for update in depsgraph.updates:
+        if isinstance(update.id, bpy.types.Collection):
+            # Objects were linked to or unlinked from a collection
+            structural = True
+            continue
+        if not isinstance(update.id, bpy.types.Object):
+            continue
+        object_entries = True
+        obj = update.id.original
+        if update.is_updated_geometry:
+            if obj.type == 'MESH' and obj.data is not None:
+                scene_mesh_cache.invalidate(obj.data)
+            changed[obj.as_pointer()] = obj
+        elif update.is_updated_transform:
+            changed[obj.as_pointer()] = obj
+    
+    # Deleted objects have no entry of their own, only their type is tagged
+    if not object_entries and depsgraph.id_type_updated('OBJECT'):
+        structural = True
+    
+    # Transform and geometry edits never walk the scene, only structural
+    # changes do; running jobs record the objects they add and remove
+    if structural and not bpy.context.window_manager.fossee_job.running:
+        reconcile_scene_objects(scene, changed)
+    
+    if changed:
+        index_scene_objects(scene, list(changed.values()))
+
+
+@persistent
+def on_index_invalidated(*args):
+    """Drop the scene cube index after undo, redo or loading a file."""
+    scene_cube_index.clear()
+    scene_mesh_cache.clear()
+
+
+index_handlers = (
+    (bpy.app.handlers.depsgraph_update_post, on_depsgraph_update),
+    (bpy.app.handlers.undo_post, on_index_invalidated),
+    (bpy.app.handlers.redo_post, on_index_invalidated),
+    (bpy.app.handlers.load_post, on_index_invalidated),
+)
+
+
+# ============================================================================
+# CHUNKED JOBS
+# ============================================================================
+
+class JobCancelled(Exception):
+    """Thrown into a running job when the user cancels it."""
+
+
+def run_job(job):
+    """
+    Run a job generator to completion.
+    
+    Args:
+        job: Generator yielding (fraction done, status text) and returning
+             the operator result
+    
+    Returns:
+        set: The operator result ({'FINISHED'} or {'CANCELLED'})
+    """
+    try:
+        while True:
+            next(job)
+    except StopIteration as stop:
+        return stop.value
+
+
+def generate_cubes_job(operator, context):
+    """
+    Generate the cube array, yielding progress between chunks of cubes.
+    
+    When cancelled, the cubes created so far are kept and the job finishes
+    normally, so the partial array is one undo step.
+    
+    Args:
+        operator: Operator to report to
+        context: Blender context
+    
+    Returns:
+        set: The operator result
+    """
+    props = context.scene.fossee_props
+    n = props.cube_count
+    
+    # Validate input
+    if n <= 0:
+        operator.report({'ERROR'}, "Number must be greater than 0")
+        return {'CANCELLED'}
+    
+    limit = LARGE_CUBE_LIMIT if props.large_arrays else CUBE_LIMIT
+    if n > limit:
+        operator.report({'ERROR'}, "The number is out of range")
+        return {'CANCELLED'}
+    
+    # Calculate grid dimensions
+    rows, cols = get_optimal_grid_dimensions(n)
+    
+    # Create collection if needed
+    collection_name = "FOSSEE_Cubes"
+    if collection_name not in bpy.data.collections:
+        collection = bpy.data.collections.new(collection_name)
+        context.scene.collection.children.link(collection)
+    else:
+        collection = bpy.data.collections[collection_name]
+    
+    cube_size = 1.0
+    spacing = 0.2
+    
+    # Plan all locations at once, skipping slots blocked by existing cubes
+    box_min = box_max = None
+    if props.avoid_overlap:
+        box_min, box_max = sync_scene_cube_index(context.scene).bounds()
+    locations = plan_cube_locations(n, cols, cube_size, spacing, box_min, box_max)
+    
+    if len(locations) < n:
+        operator.report({'WARNING'}, 
+                        f"Could not place {n - len(locations)} cube(s) without collision, skipping")
+    
+    # Generate cubes chunk by chunk
+    cubes = []
+    cancelled = False
+    chunks = iter_cube_objects(collection, locations, cube_size,
+                               shared_mesh=props.instance_mode == 'LINKED')
+    for chunk in chunks:
+        # Index each chunk now, so the index stays current between timer ticks
+        first = len(cubes)
+        cubes.extend(chunk)
+        index_created_cubes(context.scene, chunk, locations[first:len(cubes)], cube_size)
+        try:
+            yield len(cubes) / len(locations), f"Creating cubes: {len(cubes)}/{len(locations)}"
+        except JobCancelled:
+            cancelled = True
+            break
+    cubes_created = len(cubes)
+    
+    if cubes:
+        bpy.ops.object.select_all(action='DESELECT')
+        cubes[-1].select_set(True)
+        context.view_layer.objects.active = cubes[-1]
+    
+    if cancelled:
+        operator.report({'WARNING'}, 
+                        f"Cancelled: created {cubes_created} of {len(locations)} cubes")
+    else:
+        operator.report({'INFO'}, 
+                        f"Created {cubes_created} cubes in {rows}x{cols} array")
+    return {'FINISHED'}
+
+
+def merge_meshes_job(operator, context):
+    """
+    Merge the selected meshes, yielding progress between pairs and groups.
+    
+    Cancelling while common faces are searched leaves the scene unchanged.
+    Cancelling while groups are merged keeps the groups merged so far, as
+    one undo step, and reports the rest as not merged.
+    
+    Args:
+        operator: Operator to report to
+        context: Blender context
+    
+    Returns:
+        set: The operator result
+    """
+    # Mesh data is only up to date in object mode
+    if context.mode != 'OBJECT' and context.active_object is not None:
+        bpy.ops.object.mode_set(mode='OBJECT')
+    
+    selected, instancers = make_instances_real(context, list(context.selected_objects))
+    selected = [obj for obj in selected if obj.type == 'MESH']
+    # The geometry of mesh instancers is kept as it is and reported
+    skipped = [obj.name for obj in instancers if obj.type == 'MESH']
+    
+    # Making instances real already changed the scene: finish to keep it undoable
+    cancel_result = {'FINISHED'} if instancers else {'CANCELLED'}
+    
+    if len(selected) < 2:
+        operator.report({'ERROR'}, "Select at least 2 mesh objects to merge")
+        return cancel_result
+    
+    tolerance = 0.0001
+    cache = MeshBufferCache()
+    
+    # Broad phase: only pairs whose bounding boxes touch can share faces
+    box_min, box_max = cache.world_bounds(selected)
+    candidate_pairs = sweep_and_prune(box_min, box_max, margin=tolerance)
+    
+    # Narrow phase: keep the pairs that really have common faces
+    touching_pairs = []
+    for done, (i, j) in enumerate(candidate_pairs, 1):
+        common1, common2 = find_common_faces(selected[i], selected[j], tolerance, cache)
+        if common1 and common2:
+            touching_pairs.append((i, j))
+        try:
+            yield 0.5 * done / len(candidate_pairs), \
+                f"Finding common faces: {done}/{len(candidate_pairs)} pairs"
+        except JobCancelled:
+            operator.report({'WARNING'}, "Merge cancelled")
+            return cancel_result
+    
+    components = connected_components(len(selected), touching_pairs)
+    groups = [[selected[i] for i in component] for component in components
+              if len(component) > 1]
+    unmerged = [selected[component[0]].name for component in components
+                if len(component) == 1]
+    
+    if not groups:
+        operator.report({'ERROR'}, 
+                        "Selected meshes do not have common faces. "
+                        "Meshes must be touching to merge.")
+        return cancel_result
+    
+    # Merge each group of connected meshes into its own object
+    merged_objects = []
+    merged_count = 0
+    for done, group in enumerate(groups, 1):
+        merged_obj, _, _ = merge_objects(group, tolerance, cache)
+        merged_objects.append(merged_obj)
+        merged_count += len(group)
+        try:
+            yield 0.5 + 0.5 * done / len(groups), f"Merging groups: {done}/{len(groups)}"
+        except JobCancelled:
+            for remaining in groups[done:]:
+                unmerged.extend(obj.name for obj in remaining)
+            break
+    
+    bpy.ops.object.select_all(action='DESELECT')
+    for obj in merged_objects:
+        obj.select_set(True)
+    context.view_layer.objects.active = merged_objects[0]
+    
+    message = f"Merged {merged_count} meshes into {len(merged_objects)} object(s)"
+    if skipped:
+        message += f"; instancers not merged: {format_names(skipped)}"
+    if len(merged_objects) < len(groups):
+        operator.report({'WARNING'}, 
+                        f"Cancelled: {message}; not merged: {format_names(unmerged)}")
+    elif unmerged:
+        operator.report({'WARNING'}, 
+                        f"{message}; not merged (no common faces): {format_names(unmerged)}")
+    else:
+        operator.report({'WARNING'} if skipped else {'INFO'}, message)
+    return {'FINISHED'}
+
+
+class ChunkedJobOperator:
+    """
+    Mixin running an operator's job in time-budgeted chunks from a timer.
+    
+    Subclasses implement job(context), a generator from the jobs above.
+    Invoked from the UI, the job runs a slice of at most time_budget seconds
+    per timer tick, progress is shown in the panel and Esc cancels. The
+    whole run is one undo step. execute() runs the job in one go (scripts,
+    redo panel).
+    """
+    
+    time_budget = 0.05
+    
+    @classmethod
+    def poll(cls, context):
+        return not context.window_manager.fossee_job.running
+    
+    def execute(self, context):
+        return run_job(self.job(context))
+    
+    def invoke(self, context, event):
+        self._job = self.job(context)
+        self._timer = None
+        context.window_manager.fossee_job.running = True
+        
+        # Run the first slice now: validation errors finish immediately
+        result = self._step(context)
+        if result is not None:
+            return self._finish(context, result)
+        
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.01, window=context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+    
+    def modal(self, context, event):
+        if event.type == 'ESC' and event.value == 'PRESS':
+            try:
+                result = self._job.throw(JobCancelled())
+            except StopIteration as stop:
+                result = stop.value
+            except JobCancelled:
+                result = {'CANCELLED'}
+            except Exception:
+                self._fail(context)
+                raise
+            else:
+                # The job ignored the cancel request: let it finish normally
+                self._update_progress(context, result)
+                return {'RUNNING_MODAL'}
+            return self._finish(context, result)
+        
+        if event.type != 'TIMER':
+            # Keep viewport navigation available, block everything else
+            if event.type in {'MIDDLEMOUSE', 'WHEELUPMOUSE', 'WHEELDOWNMOUSE', 'TRACKPADPAN',
+                              'TRACKPADZOOM'}:
+                return {'PASS_THROUGH'}
+            return {'RUNNING_MODAL'}
+        
+        result = self._step(context)
+        if result is not None:
+            return self._finish(context, result)
+        return {'RUNNING_MODAL'}
+    
+    def _step(self, context):
+        """Advance the job for one time budget; return its result once it ends."""
+        deadline = time.perf_counter() + self.time_budget
+        progress = None
+        try:
+            while time.perf_counter() < deadline:
+                progress = next(self._job)
+        except StopIteration as stop:
+            return stop.value
+        except Exception:
+            self._fail(context)
+            raise
+        if progress is not None:
+            self._update_progress(context, progress)
+        return None
+    
+    def _update_progress(self, context, progress):
+        """Show the job's progress in the panel."""
+        fraction, text = progress
+        state = context.window_manager.fossee_job
+        state.progress = 100.0 * fraction
+        state.label = text
+        for area in context.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+    
+    def _finish(self, context, result):
+        """Remove the timer and clear the progress display."""
+        self.cancel(context)
+        return result
+    
+    def _fail(self, context):
+        """Clean up after the job raised, so the operators can run again."""
+        self._finish(context, {'CANCELLED'})
+        self.report({'ERROR'}, f"{self.bl_label} failed, see the system console")
+    
+    def cancel(self, context):
+        if self._timer is not None:
+            context.window_manager.event_timer_remove(self._timer)
+            self._timer = None
+        state = context.window_manager.fossee_job
+        state.running = False
+        state.progress = 0.0
+        state.label = ""
+        for area in context.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
 
 
 # ============================================================================
@@ -179,74 +799,17 @@ class FOSSEE_OT_GenerateCubes(bpy.types.Operator):
     bl_options = {'REGISTER', 'UNDO'}
     
     def execute(self, context):
-        props = context.scene.fossee_props
-        n = props.cube_count
-        
-        # Validate input
-        if n <= 0:
-            self.report({'ERROR'}, "Number must be greater than 0")
-            return {'CANCELLED'}
-        
-        if n > 20:
-            self.report({'ERROR'}, "The number is out of range")
-            return {'CANCELLED'}
-        
-        # Calculate grid dimensions
-        rows, cols = get_optimal_grid_dimensions(n)
-        
-        # Get existing cubes if collision avoidance is enabled
-        existing_cubes = get_all_scene_cubes() if props.avoid_overlap else []
-        
-        # Create collection if needed
-        collection_name = "FOSSEE_Cubes"
-        if collection_name not in bpy.data.collections:
-            collection = bpy.data.collections.new(collection_name)
-            context.scene.collection.children.link(collection)
-        else:
-            collection = bpy.data.collections[collection_name]
-        
-        cube_size = 1.0
-        spacing = 0.2
-        cubes_created = 0
-        
-        # Generate cubes
-        for i in range(n):
-            row = i // cols
-            col = i % cols
-            
-            # Find safe location
-            if props.avoid_overlap and existing_cubes:
-                location = find_safe_location(row, col, cube_size, spacing, existing_cubes)
-                if location is None:
-                    self.report({'WARNING'}, 
-                              f"Could not place cube {i+1} without collision, skipping")
-                    continue
-            else:
-                location = Vector((
-                    col * (cube_size + spacing),
-                    row * (cube_size + spacing),
-                    0
-                ))
-            
-            # Create cube
-            bpy.ops.mesh.primitive_cube_add(size=cube_size, location=location)
-            cube = context.active_object
-            cube.name = f"Cube_{cubes_created + 1}"
-            
-            # Move to collection
-            for coll in cube.users_collection:
-                coll.objects.unlink(cube)
-            collection.objects.link(cube)
-            
-            # Add to existing cubes list
-            if props.avoid_overlap:
-                existing_cubes.append(cube)
-            
-            cubes_created += 1
-        
-        self.report({'INFO'}, 
-                   f"Created {cubes_created} cubes in {rows}x{cols} array")
-        return {'FINISHED'}
+        return run_job(generate_cubes_job(self, context))
+
+
+class FOSSEE_OT_GenerateCubesModal(ChunkedJobOperator, bpy.types.Operator):
+    """Generate the cube array in steps, with progress; press Esc to cancel"""
+    bl_idname = "fossee.generate_cubes_modal"
+    bl_label = "Generate in Steps"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    def job(self, context):
+        return generate_cubes_job(self, context)
 
 
 class FOSSEE_OT_DeleteSelected(bpy.types.Operator):
@@ -276,63 +839,17 @@ class FOSSEE_OT_MergeMeshes(bpy.types.Operator):
     bl_options = {'REGISTER', 'UNDO'}
     
     def execute(self, context):
-        selected = [obj for obj in context.selected_objects if obj.type == 'MESH']
-        
-        if len(selected) < 2:
-            self.report({'ERROR'}, "Select at least 2 mesh objects to merge")
-            return {'CANCELLED'}
-        
-        # Check for common faces between all pairs
-        merge_candidates = []
-        for i in range(len(selected)):
-            for j in range(i + 1, len(selected)):
-                mesh1 = selected[i]
-                mesh2 = selected[j]
-                
-                common1, common2 = find_common_faces(mesh1, mesh2)
-                
-                if common1 and common2:
-                    merge_candidates.append((mesh1, mesh2, common1, common2))
-        
-        if not merge_candidates:
-            self.report({'ERROR'}, 
-                       "Selected meshes do not have common faces. "
-                       "Meshes must be touching to merge.")
-            return {'CANCELLED'}
-        
-        # Perform merge
-        # Deselect all
-        bpy.ops.object.select_all(action='DESELECT')
-        
-        # Select all meshes to merge
-        for obj in selected:
-            obj.select_set(True)
-        
-        # Set active object
-        context.view_layer.objects.active = selected[0]
-        
-        # Join objects
-        bpy.ops.object.join()
-        merged_obj = context.active_object
-        
-        # Enter edit mode to clean up
-        bpy.ops.object.mode_set(mode='EDIT')
-        
-        # Remove doubles (merge overlapping vertices)
-        bpy.ops.mesh.select_all(action='SELECT')
-        bpy.ops.mesh.remove_doubles(threshold=0.0001)
-        
-        # Delete internal faces
-        bpy.ops.mesh.select_all(action='DESELECT')
-        bpy.ops.mesh.select_interior_faces()
-        bpy.ops.mesh.delete(type='FACE')
-        
-        # Back to object mode
-        bpy.ops.object.mode_set(mode='OBJECT')
-        
-        self.report({'INFO'}, 
-                   f"Merged {len(selected)} meshes successfully")
-        return {'FINISHED'}
+        return run_job(merge_meshes_job(self, context))
+
+
+class FOSSEE_OT_MergeMeshesModal(ChunkedJobOperator, bpy.types.Operator):
+    """Merge selected meshes in steps, with progress; press Esc to cancel"""
+    bl_idname = "fossee.merge_meshes_modal"
+    bl_label = "Merge in Steps"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    def job(self, context):
+        return merge_meshes_job(self, context)
 
 
 # ============================================================================
@@ -344,10 +861,27 @@ class FOSSEEProperties(bpy.types.PropertyGroup):
     
     cube_count: bpy.props.IntProperty(
         name="Number of Cubes",
-        description="Number of cubes to generate (max 20)",
+        description="Number of cubes to generate (max 20, or 100000 with Large Arrays)",
         default=4,
         min=1,
-        max=50  # Allow > 20 to trigger error message
+        max=LARGE_CUBE_LIMIT + 1,  # Allow > limit to trigger error message
+        soft_max=50
+    )
+    
+    instance_mode: bpy.props.EnumProperty(
+        name="Cube Meshes",
+        description="How generated cubes store their geometry",
+        items=[
+            ('COPIES', "Separate Meshes", "Every cube gets its own copy of the cube mesh"),
+            ('LINKED', "Linked Duplicates", "All cubes share one cube mesh (less memory, smaller files)"),
+        ],
+        default='COPIES'
+    )
+    
+    large_arrays: bpy.props.BoolProperty(
+        name="Large Arrays",
+        description=f"Raise the cube limit from {CUBE_LIMIT} to {LARGE_CUBE_LIMIT}",
+        default=False
     )
     
     avoid_overlap: bpy.props.BoolProperty(
@@ -357,6 +891,28 @@ class FOSSEEProperties(bpy.types.PropertyGroup):
     )
 
 
+class FOSSEEJobState(bpy.types.PropertyGroup):
+    """Progress of the running chunked operator (stored on the window manager)"""
+    
+    running: bpy.props.BoolProperty(
+        name="Running",
+        default=False
+    )
+    
+    progress: bpy.props.FloatProperty(
+        name="Progress",
+        subtype='PERCENTAGE',
+        min=0.0,
+        max=100.0,
+        default=0.0
+    )
+    
+    label: bpy.props.StringProperty(
+        name="Status",
+        default=""
+    )
+
+
 # ============================================================================
 # UI PANEL
 # ============================================================================
@@ -379,8 +935,11 @@ class FOSSEE_PT_MainPanel(bpy.types.Panel):
         
         box.prop(props, "cube_count")
         box.prop(props, "avoid_overlap")
+        box.prop(props, "large_arrays")
+        box.prop(props, "instance_mode")
         
         box.operator("fossee.generate_cubes", icon='ADD')
+        box.operator("fossee.generate_cubes_modal", icon='TIME')
         box.operator("fossee.delete_selected", icon='TRASH')
         
         # Feature Set 2
@@ -389,6 +948,17 @@ class FOSSEE_PT_MainPanel(bpy.types.Panel):
         
         box.label(text="Select 2+ meshes with common faces")
         box.operator("fossee.merge_meshes", icon='MODIFIER')
+        box.operator("fossee.merge_meshes_modal", icon='TIME')
+        
+        # Progress of a running "in Steps" operator
+        job = context.window_manager.fossee_job
+        if job.running:
+            box = layout.box()
+            box.label(text=job.label or "Working...", icon='SORTTIME')
+            row = box.row()
+            row.enabled = False
+            row.prop(job, "progress", text="", slider=True)
+            box.label(text="Press Esc to cancel")
 
 
 # ============================================================================
@@ -397,9 +967,12 @@ class FOSSEE_PT_MainPanel(bpy.types.Panel):
 
 classes = (
     FOSSEEProperties,
+    FOSSEEJobState,
     FOSSEE_OT_GenerateCubes,
+    FOSSEE_OT_GenerateCubesModal,
     FOSSEE_OT_DeleteSelected,
     FOSSEE_OT_MergeMeshes,
+    FOSSEE_OT_MergeMeshesModal,
     FOSSEE_PT_MainPanel,
 )
 
@@ -410,16 +983,28 @@ def register():
         bpy.utils.register_class(cls)
     
     bpy.types.Scene.fossee_props = bpy.props.PointerProperty(type=FOSSEEProperties)
+    bpy.types.WindowManager.fossee_job = bpy.props.PointerProperty(type=FOSSEEJobState)
+    
+    for handlers, handler in index_handlers:
+        if handler not in handlers:
+            handlers.append(handler)
     
     print("FOSSEE Cube Array Addon registered successfully")
 
 
 def unregister():
     """Unregister addon classes and properties"""
+    for handlers, handler in index_handlers:
+        if handler in handlers:
+            handlers.remove(handler)
+    scene_cube_index.clear()
+    scene_mesh_cache.clear()
+    
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
     
     del bpy.types.Scene.fossee_props
+    del bpy.types.WindowManager.fossee_job
     
     print("FOSSEE Cube Array Addon unregistered")
 
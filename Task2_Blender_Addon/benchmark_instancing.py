@@ -0,0 +1,105 @@
+"""
+Memory and creation-time measurements for the cube mesh modes (needs Blender).
+
+For each cube count, generates the array once with separate meshes and once
+with linked duplicates in an empty scene, and reports:
+- creation time of create_cube_objects
+- mesh datablocks and stored vertices / loops
+- growth of the process's resident memory (Linux only)
+- size of the saved .blend file
+
+Run from this folder:
+    blender --background --factory-startup --python benchmark_instancing.py -- 1000 10000
+"""
+
+import importlib.util
+import os
+import sys
+import tempfile
+import time
+
+import bpy
+
+ADDON_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def load_addon():
+    """Import the addon package from this folder without installing it."""
+    spec = importlib.util.spec_from_file_location(
+        "fossee_cube_tools", os.path.join(ADDON_DIR, "__init__.py"),
+        submodule_search_locations=[ADDON_DIR])
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def resident_memory_mb():
+    """Get the current resident memory of this process in MB (Linux only), or None."""
+    try:
+        with open("/proc/self/statm") as statm:
+            pages = int(statm.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+
+def reset_scene():
+    """Remove all objects, meshes and collections."""
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj, do_unlink=True)
+    for mesh in list(bpy.data.meshes):
+        bpy.data.meshes.remove(mesh)
+    for collection in list(bpy.data.collections):
+        bpy.data.collections.remove(collection)
+
+
+def measure(addon, n, shared_mesh):
+    """Generate n cubes in an empty scene and collect the measurements."""
+    reset_scene()
+    collection = bpy.data.collections.new("FOSSEE_Cubes")
+    bpy.context.scene.collection.children.link(collection)
+    
+    _, cols = addon.get_optimal_grid_dimensions(n)
+    locations = addon.plan_cube_locations(n, cols, 1.0, 0.2)
+    
+    memory_before = resident_memory_mb()
+    start = time.perf_counter()
+    addon.create_cube_objects(collection, locations, 1.0, shared_mesh=shared_mesh)
+    bpy.context.view_layer.update()
+    elapsed = time.perf_counter() - start
+    memory_after = resident_memory_mb()
+    
+    path = os.path.join(tempfile.gettempdir(), f"fossee_cubes_{n}_{int(shared_mesh)}.blend")
+    bpy.ops.wm.save_as_mainfile(filepath=path, copy=True)
+    file_size = os.path.getsize(path)
+    os.remove(path)
+    
+    return {
+        "time": elapsed,
+        "meshes": len(bpy.data.meshes),
+        "vertices": sum(len(mesh.vertices) for mesh in bpy.data.meshes),
+        "loops": sum(len(mesh.loops) for mesh in bpy.data.meshes),
+        "memory": None if memory_before is None else memory_after - memory_before,
+        "file_size": file_size,
+    }
+
+
+if __name__ == "__main__":
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    sizes = [int(arg) for arg in argv] or [1000, 10000]
+    addon = load_addon()
+    
+    print("=" * 84)
+    print(f"Blender {bpy.app.version_string}")
+    print("=" * 84)
+    print(f"{'cubes':>7} {'mode':>18} {'time':>9} {'meshes':>7} {'vertices':>9} "
+          f"{'loops':>9} {'RSS +MB':>9} {'.blend':>10}")
+    for n in sizes:
+        for shared_mesh, label in ((True, "linked duplicates"), (False, "separate meshes")):
+            result = measure(addon, n, shared_mesh)
+            memory = "n/a" if result["memory"] is None else f"{result['memory']:.1f}"
+            print(f"{n:>7} {label:>18} {result['time'] * 1000:>7.0f}ms {result['meshes']:>7} "
+                  f"{result['vertices']:>9} {result['loops']:>9} {memory:>9} "
+                  f"{result['file_size'] / 1024:>8.0f}KB")
+    reset_scene()
@@ -0,0 +1,172 @@
+"""
+Placement benchmark for the FOSSEE Cube Array addon (runs without Blender).
+
+Compares the occupancy-grid planner (core/placement.py) with the spiral
+search loop of find_safe_location, on synthetic scenes of randomly placed
+unit cubes. The legacy loop is reproduced here with plain tuples instead of
+mathutils.Vector, once with the original linear scan and once with the
+spatial hash index.
+
+Run from this folder: python benchmark_placement.py
+"""
+
+import math
+import random
+import time
+
+import numpy as np
+
+from core.placement import SLOT_EPSILON, occupancy_grid, plan_cube_locations
+from core.spatial_hash import SpatialHash
+
+CUBE_SIZE = 1.0
+SPACING = 0.2
+
+
+def get_optimal_grid_dimensions(n):
+    """Same as the addon's helper (copied to avoid importing bpy)."""
+    if n <= 0:
+        return (0, 0)
+    sqrt_n = int(math.sqrt(n))
+    for cols in range(sqrt_n, n + 1):
+        if n % cols == 0:
+            return (n // cols, cols)
+    cols = sqrt_n + 1
+    return (math.ceil(n / cols), cols)
+
+
+class LinearIndex:
+    """The original collision check: compare with every existing cube."""
+    
+    def __init__(self, locations):
+        self.locations = list(locations)
+    
+    def any_within(self, point, radius):
+        for location in self.locations:
+            if math.sqrt(sum((a - b) ** 2 for a, b in zip(location, point))) < radius:
+                return True
+        return False
+    
+    def insert(self, key, location, box_min=None, box_max=None):
+        self.locations.append(location)
+
+
+def find_safe_location(row, col, cube_size, spacing, index, max_attempts=100):
+    """The addon's spiral search, using plain tuples."""
+    base_x = col * (cube_size + spacing)
+    base_y = row * (cube_size + spacing)
+    min_distance = cube_size + spacing
+    
+    if not index.any_within((base_x, base_y, 0.0), min_distance):
+        return (base_x, base_y, 0.0)
+    
+    for attempt in range(1, max_attempts):
+        offset = attempt * spacing
+        for angle in range(0, 360, 45):
+            rad = math.radians(angle)
+            location = (base_x + offset * math.cos(rad), base_y + offset * math.sin(rad), 0.0)
+            if not index.any_within(location, min_distance):
+                return location
+    return None
+
+
+def legacy_placement(n, index):
+    """Place n cubes one by one with the spiral search."""
+    rows, cols = get_optimal_grid_dimensions(n)
+    placed = []
+    for i in range(n):
+        location = find_safe_location(i // cols, i % cols, CUBE_SIZE, SPACING, index)
+        if location is None:
+            continue
+        index.insert(len(placed), location)
+        placed.append(location)
+    return placed
+
+
+def make_scene(obstacles, extent, seed=0):
+    """Scatter unit cubes over [0, extent] x [0, extent]."""
+    rng = random.Random(seed)
+    centres = [(rng.uniform(0, extent), rng.uniform(0, extent), 0.0) for _ in range(obstacles)]
+    half = CUBE_SIZE / 2
+    box_min = np.array([[c - half for c in centre] for centre in centres])
+    box_max = np.array([[c + half for c in centre] for centre in centres])
+    return centres, box_min, box_max
+
+
+def time_call(func):
+    """Run func once and return (result, seconds)."""
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def check_no_overlap(locations, box_min, box_max):
+    """Verify planned cubes keep SPACING away from every obstacle box (within SLOT_EPSILON)."""
+    reach = CUBE_SIZE / 2 + SPACING - SLOT_EPSILON * (CUBE_SIZE + SPACING)
+    for x, y, z in locations:
+        inside = ((box_min[:, 0] < x + reach) & (x - reach < box_max[:, 0]) &
+                  (box_min[:, 1] < y + reach) & (y - reach < box_max[:, 1]) &
+                  (box_min[:, 2] < z + reach) & (z - reach < box_max[:, 2]))
+        assert not inside.any(), f"cube at {(x, y, z)} overlaps an obstacle"
+
+
+if __name__ == "__main__":
+    print("=" * 72)
+    print("TEST 1: Planned Cubes Avoid Obstacle Bounding Boxes")
+    print("=" * 72)
+    centres, box_min, box_max = make_scene(300, 30)
+    _, cols = get_optimal_grid_dimensions(400)
+    locations = plan_cube_locations(400, cols, CUBE_SIZE, SPACING, box_min, box_max)
+    check_no_overlap(locations, box_min, box_max)
+    print(f"Placed {len(locations)} cubes around 300 obstacles without overlap")
+    blocked = occupancy_grid(20, 20, CUBE_SIZE, SPACING, box_min, box_max)
+    print(f"{blocked.sum()} of 400 slots in a 20x20 window are blocked")
+    print()
+    
+    print("=" * 72)
+    print("TEST 2: Float32 Bounds of a Previous Batch")
+    print("=" * 72)
+    # Blender stores transforms as float32; the next batch must start one
+    # spacing after the previous one instead of leaving an empty row
+    first_batch = plan_cube_locations(4, 2, CUBE_SIZE, SPACING)
+    box_min = (first_batch - CUBE_SIZE / 2).astype(np.float32).astype(np.float64)
+    box_max = (first_batch + CUBE_SIZE / 2).astype(np.float32).astype(np.float64)
+    second_batch = plan_cube_locations(4, 2, CUBE_SIZE, SPACING, box_min, box_max)
+    check_no_overlap(second_batch, box_min, box_max)
+    pitch = CUBE_SIZE + SPACING
+    assert np.allclose(second_batch[:, 1], [2 * pitch, 2 * pitch, 3 * pitch, 3 * pitch])
+    print(f"Second batch rows start at y = {second_batch[0, 1]:.1f}")
+    print()
+    
+    print("=" * 72)
+    print("TEST 3: Planner vs find_safe_location Loop")
+    print("=" * 72)
+    print(f"{'cubes':>7} {'obstacles':>10} {'linear scan':>13} {'spatial hash':>13} {'planner':>10}")
+    for n, obstacles in [(20, 20), (200, 200), (1000, 1000), (10000, 10000), (50000, 50000)]:
+        rows, cols = get_optimal_grid_dimensions(n)
+        extent = max(rows, cols) * (CUBE_SIZE + SPACING)
+        centres, box_min, box_max = make_scene(obstacles, extent)
+        
+        _, planner_time = time_call(
+            lambda: plan_cube_locations(n, cols, CUBE_SIZE, SPACING, box_min, box_max))
+        
+        # The per-cube loops grow much faster than the planner; skip them at large N
+        if n <= 200:
+            _, linear_time = time_call(lambda: legacy_placement(n, LinearIndex(centres)))
+            linear = f"{linear_time * 1000:.1f}ms"
+        else:
+            linear = "(skipped)"
+        
+        if n <= 1000:
+            def hashed():
+                index = SpatialHash(CUBE_SIZE + SPACING)
+                for i, centre in enumerate(centres):
+                    index.insert(('obstacle', i), centre)
+                return legacy_placement(n, index)
+            _, hash_time = time_call(hashed)
+            hashed_text = f"{hash_time * 1000:.1f}ms"
+        else:
+            hashed_text = "(skipped)"
+        
+        print(f"{n:>7} {obstacles:>10} {linear:>13} {hashed_text:>13} {planner_time * 1000:>8.1f}ms")
+    print()
@@ -0,0 +1,8 @@
+"""
+Core geometry helpers for the FOSSEE Cube Array addon.
+
+Nothing in this package imports bpy, so it can be imported, tested and
+benchmarked outside Blender (add the addon folder to sys.path and
+`import core`). The addon's operators convert Blender data into plain
+tuples / arrays and call these helpers.
+"""
@@ -0,0 +1,115 @@
+"""
+Broad phase for mesh merging.
+
+Sweep-and-prune on world-space axis-aligned bounding boxes (AABBs) finds the
+object pairs that can possibly touch, so the exact common-face test only
+runs on those pairs. A union-find structure then groups objects connected
+through shared faces into components that are merged separately.
+
+Requires NumPy (bundled with Blender).
+"""
+
+import numpy as np
+
+
+def sweep_and_prune(box_min, box_max, margin=0.0):
+    """
+    Find all pairs of boxes that overlap or touch.
+    
+    Boxes are sorted by their minimum along the axis where they are most
+    spread out; each box is only compared with the boxes that start before
+    it ends along that axis, and those candidates are then checked on all
+    axes. Boxes closer than margin count as touching.
+    
+    Args:
+        box_min: (K, 3) array of box minimum corners
+        box_max: (K, 3) array of box maximum corners
+        margin: Gap still considered touching (e.g., the merge tolerance)
+    
+    Returns:
+        numpy.ndarray: (P, 2) array of index pairs (i, j) with i < j
+    """
+    box_min = np.asarray(box_min, dtype=np.float64).reshape(-1, 3)
+    box_max = np.asarray(box_max, dtype=np.float64).reshape(-1, 3)
+    if len(box_min) < 2:
+        return np.zeros((0, 2), dtype=np.int64)
+    
+    axis = int(np.argmax(box_min.var(axis=0)))
+    order = np.argsort(box_min[:, axis], kind='stable')
+    start = box_min[order, axis]
+    
+    # Boxes order[pos + 1:stop] start before box order[pos] ends along the axis
+    stop = np.searchsorted(start, box_max[order, axis] + margin, side='right')
+    counts = np.maximum(stop - np.arange(len(order)) - 1, 0)
+    
+    first = np.repeat(np.arange(len(order)), counts)
+    run = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    second = first + 1 + run
+    first, second = order[first], order[second]
+    
+    touching = np.all((box_min[first] <= box_max[second] + margin) &
+                      (box_min[second] <= box_max[first] + margin), axis=1)
+    pairs = np.stack([first[touching], second[touching]], axis=1)
+    return np.sort(pairs, axis=1)
+
+
+class UnionFind:
+    """Disjoint sets over the integers 0 .. count - 1."""
+    
+    def __init__(self, count):
+        self.parent = list(range(count))
+        self.size = [1] * count
+    
+    def find(self, item):
+        """Get the representative of an item's set (with path halving)."""
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+    
+    def union(self, a, b):
+        """
+        Join the sets containing a and b.
+        
+        Returns:
+            bool: True if the sets were separate
+        """
+        root_a = self.find(a)
+        root_b = self.find(b)
+        if root_a == root_b:
+            return False
+        if self.size[root_a] < self.size[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        self.size[root_a] += self.size[root_b]
+        return True
+    
+    def components(self):
+        """
+        Get all sets.
+        
+        Returns:
+            list: Lists of items, each sorted, in order of their smallest item
+        """
+        groups = {}
+        for item in range(len(self.parent)):
+            groups.setdefault(self.find(item), []).append(item)
+        return list(groups.values())
+
+
+def connected_components(count, pairs):
+    """
+    Group items connected through pairs.
+    
+    Args:
+        count: Number of items
+        pairs: Iterable of (i, j) index pairs
+    
+    Returns:
+        list: Lists of item indices; items without pairs form single-item lists
+    """
+    sets = UnionFind(count)
+    for i, j in pairs:
+        sets.union(int(i), int(j))
+    return sets.components()
@@ -0,0 +1,40 @@
+"""
+Cube geometry as flat arrays.
+
+Builds the vertices, faces and UVs of an axis-aligned cube with NumPy. The
+addon writes it once into a template mesh through the data API
+(from_pydata) and copies that mesh per cube, instead of calling
+bpy.ops.mesh.primitive_cube_add once per cube. Every cube stays a separate
+object with its own mesh, so they are not built as one combined mesh.
+
+Requires NumPy (bundled with Blender).
+"""
+
+import numpy as np
+
+from .mesh_merge import MeshArrays
+
+# Corners of a cube with edge length 1 centred at the origin
+CUBE_CORNERS = np.array([[x, y, z] for x in (-0.5, 0.5) for y in (-0.5, 0.5)
+                         for z in (-0.5, 0.5)])
+
+# Quads wound counter-clockwise seen from outside (normals point outwards)
+CUBE_FACES = np.array([[0, 1, 3, 2], [4, 6, 7, 5], [0, 4, 5, 1],
+                       [2, 3, 7, 6], [0, 2, 6, 4], [1, 5, 7, 3]])
+
+# Every face is mapped to the whole UV square
+CUBE_FACE_UVS = np.array([[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0]])
+
+
+def cube_geometry(size=1.0):
+    """
+    Build one cube centred at the origin.
+    
+    Args:
+        size: Edge length of the cube
+    
+    Returns:
+        MeshArrays: 8 vertices, 6 quads and a UV per loop
+    """
+    return MeshArrays(CUBE_CORNERS * size, 4 * np.arange(6), np.full(6, 4),
+                      CUBE_FACES.ravel(), np.tile(CUBE_FACE_UVS, (6, 1)))
@@ -0,0 +1,158 @@
+"""
+Vectorised common-face detection.
+
+Two faces are common when their world-space centres are closer than a
+tolerance and their world-space normals point in opposite directions
+(dot product below -0.9). This is the same rule as the addon's original
+pairwise loop, but candidate pairs come from a hash of quantised face
+centres, so the cost is O(F1 + F2) instead of O(F1 x F2).
+
+Requires NumPy (bundled with Blender).
+"""
+
+import numpy as np
+
+# Large odd constants for mixing the three cell coordinates into one key
+_HASH_X = np.int64(73856093)
+_HASH_Y = np.int64(19349663)
+_HASH_Z = np.int64(83492791)
+
+NORMAL_DOT_LIMIT = -0.9
+
+
+def to_world(matrix_world, centers, normals):
+    """
+    Transform object-space face centres and normals to world space.
+    
+    Normals are multiplied by the upper 3x3 of the matrix without
+    renormalising, like matrix_world.to_3x3() @ face.normal.
+    
+    Args:
+        matrix_world: 4x4 object matrix (anything numpy.asarray accepts)
+        centers: (F, 3) array of face centres
+        normals: (F, 3) array of face normals
+    
+    Returns:
+        tuple: (world_centers, world_normals) arrays of shape (F, 3)
+    """
+    matrix = np.asarray(matrix_world, dtype=np.float64).reshape(4, 4)
+    rotation = matrix[:3, :3]
+    centers = np.asarray(centers, dtype=np.float64).reshape(-1, 3)
+    normals = np.asarray(normals, dtype=np.float64).reshape(-1, 3)
+    return centers @ rotation.T + matrix[:3, 3], normals @ rotation.T
+
+
+def _cell_keys(cells):
+    """Hash (N, 3) integer cell coordinates into int64 keys (collisions are allowed)."""
+    with np.errstate(over='ignore'):
+        return (cells[:, 0] * _HASH_X) ^ (cells[:, 1] * _HASH_Y) ^ (cells[:, 2] * _HASH_Z)
+
+
+def candidate_pairs(centers1, centers2, tolerance):
+    """
+    Find every pair of points that may be closer than tolerance.
+    
+    Points are hashed into cells of size 2 * tolerance. A point closer than
+    tolerance to a query point lies in the query's own cell or in the
+    neighbouring cell on the nearer side along each axis, so 8 cells are
+    looked up per query point.
+    
+    Args:
+        centers1: (F1, 3) array of query points
+        centers2: (F2, 3) array of indexed points
+        tolerance: Search distance
+    
+    Returns:
+        tuple: (indices1, indices2) arrays; may contain extra pairs (hash
+               collisions and points up to 2 * tolerance * sqrt(3) apart)
+    """
+    empty = np.zeros(0, dtype=np.int64)
+    if len(centers1) == 0 or len(centers2) == 0:
+        return empty, empty
+    
+    size = 2.0 * tolerance
+    keys2 = _cell_keys(np.floor(centers2 / size).astype(np.int64))
+    order = np.argsort(keys2, kind='stable')
+    sorted_keys = keys2[order]
+    
+    scaled = centers1 / size
+    cells1 = np.floor(scaled).astype(np.int64)
+    # -1 or +1 per axis: the neighbouring cell on the side nearer to the point
+    side = np.where(scaled - cells1 < 0.5, -1, 1)
+    
+    found1 = []
+    found2 = []
+    for dx in (0, 1):
+        for dy in (0, 1):
+            for dz in (0, 1):
+                shift = side * np.array([dx, dy, dz])
+                keys = _cell_keys(cells1 + shift)
+                start = np.searchsorted(sorted_keys, keys, side='left')
+                stop = np.searchsorted(sorted_keys, keys, side='right')
+                counts = stop - start
+                if not counts.any():
+                    continue
+                
+                query = np.repeat(np.arange(len(centers1)), counts)
+                # Position of each pair within its query's run of matches
+                run = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+                found1.append(query)
+                found2.append(order[np.repeat(start, counts) + run])
+    
+    if not found1:
+        return empty, empty
+    return np.concatenate(found1), np.concatenate(found2)
+
+
+def match_faces(centers1, normals1, centers2, normals2, tolerance=0.0001):
+    """
+    Find common faces between two meshes given world-space face data.
+    
+    Args:
+        centers1: (F1, 3) world-space face centres of the first mesh
+        normals1: (F1, 3) world-space face normals of the first mesh
+        centers2: (F2, 3) world-space face centres of the second mesh
+        normals2: (F2, 3) world-space face normals of the second mesh
+        tolerance: Distance tolerance for considering faces as overlapping
+    
+    Returns:
+        tuple: (common_faces_mesh1_indices, common_faces_mesh2_indices) as
+               sorted lists of unique face indices
+    """
+    centers1 = np.asarray(centers1, dtype=np.float64).reshape(-1, 3)
+    centers2 = np.asarray(centers2, dtype=np.float64).reshape(-1, 3)
+    normals1 = np.asarray(normals1, dtype=np.float64).reshape(-1, 3)
+    normals2 = np.asarray(normals2, dtype=np.float64).reshape(-1, 3)
+    
+    first, second = candidate_pairs(centers1, centers2, tolerance)
+    
+    distance = np.linalg.norm(centers1[first] - centers2[second], axis=1)
+    normal_dot = np.einsum('ij,ij->i', normals1[first], normals2[second])
+    common = (distance < tolerance) & (normal_dot < NORMAL_DOT_LIMIT)
+    
+    return (np.unique(first[common]).tolist(), np.unique(second[common]).tolist())
+
+
+def find_common_faces_arrays(matrix1, centers1, normals1, matrix2, centers2, normals2,
+                             tolerance=0.0001):
+    """
+    Find common faces from object-space face data and object matrices.
+    
+    This is the plain-array form of the addon's find_common_faces and can be
+    called without Blender.
+    
+    Args:
+        matrix1: 4x4 world matrix of the first object
+        centers1: (F1, 3) object-space face centres of the first mesh
+        normals1: (F1, 3) object-space face normals of the first mesh
+        matrix2: 4x4 world matrix of the second object
+        centers2: (F2, 3) object-space face centres of the second mesh
+        normals2: (F2, 3) object-space face normals of the second mesh
+        tolerance: Distance tolerance for considering faces as overlapping
+    
+    Returns:
+        tuple: (common_faces_mesh1_indices, common_faces_mesh2_indices)
+    """
+    world_centers1, world_normals1 = to_world(matrix1, centers1, normals1)
+    world_centers2, world_normals2 = to_world(matrix2, centers2, normals2)
+    return match_faces(world_centers1, world_normals1, world_centers2, world_normals2, tolerance)
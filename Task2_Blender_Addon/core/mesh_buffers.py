@@ -0,0 +1,228 @@
+"""
+Bulk mesh data extraction into NumPy arrays.
+
+Blender collections (mesh.vertices, mesh.polygons, mesh.loops) can copy an
+attribute of every element into a flat buffer with foreach_get, which is far
+faster than reading element.co / face.center one Python object at a time.
+MeshBuffers does those reads once per mesh datablock and MeshBufferCache
+shares them between the collision, common-face and merge code.
+
+Nothing here imports bpy: any object whose collections provide foreach_get
+and __len__ works, which keeps the module usable outside Blender.
+
+Requires NumPy (bundled with Blender).
+"""
+
+import numpy as np
+
+
+def read_attribute(collection, attribute, width=1, dtype=np.float32):
+    """
+    Copy one attribute of every element of a collection into a NumPy array.
+    
+    Args:
+        collection: Collection with foreach_get (e.g., mesh.vertices)
+        attribute: Attribute name (e.g., "co")
+        width: Number of values per element (3 for vectors)
+        dtype: Array type matching the attribute (float32, int32 or bool)
+    
+    Returns:
+        numpy.ndarray: (len(collection), width) array, or (len(collection),)
+                       when width is 1
+    """
+    count = len(collection)
+    buffer = np.empty(count * width, dtype=dtype)
+    if count:
+        collection.foreach_get(attribute, buffer)
+    return buffer.reshape(-1, width) if width > 1 else buffer
+
+
+def read_matrices(objects):
+    """
+    Stack the world matrices of objects into one array.
+    
+    Args:
+        objects: Sequence of objects with a matrix_world attribute
+    
+    Returns:
+        numpy.ndarray: (len(objects), 4, 4) array of row-major matrices
+    """
+    if not objects:
+        return np.zeros((0, 4, 4))
+    return np.array([obj.matrix_world for obj in objects], dtype=np.float64).reshape(-1, 4, 4)
+
+
+def transform_bounds(matrices, local_min, local_max):
+    """
+    Get world-space axis-aligned bounding boxes of transformed local boxes.
+    
+    The 8 corners of each local box are transformed and their extent is
+    taken, like computing the bounds of obj.bound_box in world space.
+    
+    Args:
+        matrices: (K, 4, 4) world matrices
+        local_min: (K, 3) local bounding box minimum corners
+        local_max: (K, 3) local bounding box maximum corners
+    
+    Returns:
+        tuple: (box_min, box_max) arrays of shape (K, 3)
+    """
+    matrices = np.asarray(matrices, dtype=np.float64).reshape(-1, 4, 4)
+    local_min = np.asarray(local_min, dtype=np.float64).reshape(-1, 3)
+    local_max = np.asarray(local_max, dtype=np.float64).reshape(-1, 3)
+    
+    # (K, 8, 3) corners: bit 0 picks x, bit 1 picks y, bit 2 picks z
+    select = ((np.arange(8)[:, None] >> np.arange(3)) & 1).astype(bool)
+    corners = np.where(select[None], local_max[:, None, :], local_min[:, None, :])
+    
+    world = np.einsum('kij,kcj->kci', matrices[:, :3, :3], corners) + matrices[:, None, :3, 3]
+    return world.min(axis=1), world.max(axis=1)
+
+
+class MeshBuffers:
+    """
+    Geometry of one mesh datablock as NumPy arrays.
+    
+    Attributes:
+        vertices: (V, 3) float32 vertex coordinates
+        polygon_centers: (F, 3) float32 face centres
+        polygon_normals: (F, 3) float32 face normals
+        loop_starts: (F,) int32 index of each face's first loop
+        loop_totals: (F,) int32 number of loops (corners) of each face
+        loop_vertices: (L,) int32 vertex index of each loop
+        face_materials: (F,) int32 material slot index of each face
+        face_smooth: (F,) bool, True for smooth-shaded faces
+        uv_layers: Dict of UV map name -> (L, 2) float32 UVs, active map first
+        bounds_min: (3,) local bounding box minimum (zeros for an empty mesh)
+        bounds_max: (3,) local bounding box maximum (zeros for an empty mesh)
+    """
+    
+    def __init__(self, mesh):
+        """
+        Read the geometry of a mesh with foreach_get.
+        
+        Args:
+            mesh: Mesh datablock (object.data)
+        """
+        self.vertices = read_attribute(mesh.vertices, "co", 3)
+        self.polygon_centers = read_attribute(mesh.polygons, "center", 3)
+        self.polygon_normals = read_attribute(mesh.polygons, "normal", 3)
+        self.loop_starts = read_attribute(mesh.polygons, "loop_start", dtype=np.int32)
+        self.loop_totals = read_attribute(mesh.polygons, "loop_total", dtype=np.int32)
+        self.loop_vertices = read_attribute(mesh.loops, "vertex_index", dtype=np.int32)
+        self.face_materials = read_attribute(mesh.polygons, "material_index", dtype=np.int32)
+        self.face_smooth = read_attribute(mesh.polygons, "use_smooth", dtype=bool)
+        uv_layers = getattr(mesh, "uv_layers", None)
+        layers = list(uv_layers) if uv_layers is not None else []
+        active = getattr(uv_layers, "active", None)
+        if active is not None:
+            # Stable sort: the active map first, the others in their order
+            layers.sort(key=lambda layer: layer.name != active.name)
+        self.uv_layers = {layer.name: read_attribute(layer.data, "uv", 2) for layer in layers}
+        self.signature = mesh_signature(mesh)
+        
+        if len(self.vertices):
+            self.bounds_min = self.vertices.min(axis=0)
+            self.bounds_max = self.vertices.max(axis=0)
+        else:
+            self.bounds_min = np.zeros(3, dtype=np.float32)
+            self.bounds_max = np.zeros(3, dtype=np.float32)
+    
+    def face_vertices(self, index):
+        """Get the vertex indices of one face, in loop order."""
+        start = self.loop_starts[index]
+        return self.loop_vertices[start:start + self.loop_totals[index]]
+    
+    def world_vertices(self, matrix_world):
+        """
+        Transform the vertices to world space.
+        
+        Args:
+            matrix_world: 4x4 object matrix
+        
+        Returns:
+            numpy.ndarray: (V, 3) float64 world-space coordinates
+        """
+        matrix = np.asarray(matrix_world, dtype=np.float64).reshape(4, 4)
+        return self.vertices @ matrix[:3, :3].T + matrix[:3, 3]
+    
+    def world_bounds(self, matrix_world):
+        """
+        Get the world-space axis-aligned bounding box of the mesh.
+        
+        Args:
+            matrix_world: 4x4 object matrix
+        
+        Returns:
+            tuple: (box_min, box_max) arrays of shape (3,)
+        """
+        box_min, box_max = transform_bounds(matrix_world, self.bounds_min, self.bounds_max)
+        return box_min[0], box_max[0]
+
+
+def mesh_signature(mesh):
+    """Get the element counts used to detect topology changes of a mesh."""
+    return (len(mesh.vertices), len(mesh.polygons), len(mesh.loops))
+
+
+class MeshBufferCache:
+    """
+    MeshBuffers per mesh datablock, so each mesh is read only once.
+    
+    A cached entry is re-read when the mesh's vertex, face or loop count
+    changes. Moving vertices without changing the counts is not detected,
+    so keep a cache for one operation or call invalidate() after edits.
+    """
+    
+    def __init__(self):
+        self._buffers = {}
+    
+    def __len__(self):
+        return len(self._buffers)
+    
+    @staticmethod
+    def _key(mesh):
+        """Get a key identifying a mesh datablock."""
+        return mesh.as_pointer() if hasattr(mesh, "as_pointer") else id(mesh)
+    
+    def get(self, mesh):
+        """
+        Get the buffers of a mesh, reading them if needed.
+        
+        Args:
+            mesh: Mesh datablock (object.data)
+        
+        Returns:
+            MeshBuffers: The cached or newly read buffers
+        """
+        key = self._key(mesh)
+        buffers = self._buffers.get(key)
+        if buffers is None or buffers.signature != mesh_signature(mesh):
+            buffers = self._buffers[key] = MeshBuffers(mesh)
+        return buffers
+    
+    def invalidate(self, mesh):
+        """Drop the cached buffers of a mesh."""
+        self._buffers.pop(self._key(mesh), None)
+    
+    def clear(self):
+        """Drop all cached buffers."""
+        self._buffers.clear()
+    
+    def world_bounds(self, objects):
+        """
+        Get the world-space bounding boxes of mesh objects.
+        
+        Args:
+            objects: Sequence of mesh objects
+        
+        Returns:
+            tuple: (box_min, box_max) arrays of shape (len(objects), 3)
+        """
+        if not objects:
+            return np.zeros((0, 3)), np.zeros((0, 3))
+        
+        buffers = [self.get(obj.data) for obj in objects]
+        local_min = np.array([b.bounds_min for b in buffers])
+        local_max = np.array([b.bounds_max for b in buffers])
+        return transform_bounds(read_matrices(objects), local_min, local_max)
@@ -0,0 +1,289 @@
+"""
+Array-based mesh merge engine.
+
+Replaces the edit-mode remove_doubles / select_interior_faces / delete
+sequence with three NumPy steps that run without Blender:
+
+1. Weld: vertices closer than a tolerance are found with a hash of quantised
+   positions and merged.
+2. Interior faces: after welding, faces that use the same vertices as
+   another face with the opposite normal (the two sides of a shared wall)
+   are dropped.
+3. Compact: vertices no longer used by any face are removed.
+
+The result is returned as flat arrays ready to be written back to a mesh in
+one call (Mesh.from_pydata or foreach_set).
+
+Requires NumPy (bundled with Blender).
+"""
+
+import numpy as np
+
+from .face_matching import candidate_pairs
+
+# Name given to UVs passed as loop_uvs
+DEFAULT_UV_NAME = "UVMap"
+
+
+class MeshArrays:
+    """
+    Polygon mesh stored as flat arrays, in the layout Blender uses.
+    
+    Attributes:
+        vertices: (V, 3) vertex coordinates
+        loop_starts: (F,) index of each face's first loop
+        loop_totals: (F,) number of loops (corners) of each face
+        loop_vertices: (L,) vertex index of each loop
+        face_materials: (F,) material slot index of each face
+        face_smooth: (F,) True for smooth-shaded faces
+        uv_layers: Dict of UV map name -> (L, 2) UV coordinate of each loop,
+                   active map first
+    """
+    
+    def __init__(self, vertices, loop_starts, loop_totals, loop_vertices, loop_uvs=None,
+                 face_materials=None, face_smooth=None, uv_layers=None):
+        self.vertices = np.asarray(vertices, dtype=np.float64).reshape(-1, 3)
+        self.loop_starts = np.asarray(loop_starts, dtype=np.int64).ravel()
+        self.loop_totals = np.asarray(loop_totals, dtype=np.int64).ravel()
+        self.loop_vertices = np.asarray(loop_vertices, dtype=np.int64).ravel()
+        faces = len(self.loop_starts)
+        self.face_materials = np.zeros(faces, dtype=np.int64) if face_materials is None \
+            else np.asarray(face_materials, dtype=np.int64).ravel()
+        self.face_smooth = np.zeros(faces, dtype=bool) if face_smooth is None \
+            else np.asarray(face_smooth, dtype=bool).ravel()
+        if uv_layers is None:
+            uv_layers = {} if loop_uvs is None else {DEFAULT_UV_NAME: loop_uvs}
+        self.uv_layers = {name: np.asarray(uvs).reshape(-1, 2) for name, uvs in uv_layers.items()}
+    
+    @classmethod
+    def from_faces(cls, vertices, faces, loop_uvs=None):
+        """
+        Build mesh arrays from a list of faces.
+        
+        Args:
+            vertices: (V, 3) vertex coordinates
+            faces: List of faces, each a list of vertex indices
+            loop_uvs: (L, 2) UV per loop, in face order (optional)
+        
+        Returns:
+            MeshArrays: The mesh
+        """
+        totals = np.array([len(face) for face in faces], dtype=np.int64)
+        starts = np.cumsum(totals) - totals
+        loops = np.array([index for face in faces for index in face], dtype=np.int64)
+        return cls(vertices, starts, totals, loops, loop_uvs)
+    
+    @property
+    def face_count(self):
+        return len(self.loop_starts)
+    
+    @property
+    def loop_uvs(self):
+        """UVs of the active (first) UV map, or None."""
+        return next(iter(self.uv_layers.values()), None)
+    
+    def faces(self):
+        """Get the faces as lists of vertex indices (the from_pydata layout)."""
+        return [face.tolist() for face in np.split(self.loop_vertices, self.loop_starts[1:])] \
+            if self.face_count else []
+    
+    def transformed(self, matrix):
+        """
+        Get a copy with the vertices transformed by a 4x4 matrix.
+        
+        Args:
+            matrix: 4x4 transformation matrix
+        
+        Returns:
+            MeshArrays: The transformed mesh (face arrays are shared)
+        """
+        matrix = np.asarray(matrix, dtype=np.float64).reshape(4, 4)
+        vertices = self.vertices @ matrix[:3, :3].T + matrix[:3, 3]
+        return MeshArrays(vertices, self.loop_starts, self.loop_totals, self.loop_vertices,
+                          face_materials=self.face_materials, face_smooth=self.face_smooth,
+                          uv_layers=self.uv_layers)
+
+
+def _loop_indices(starts, totals):
+    """Get the loop indices of the faces given by starts and totals, face by face."""
+    run = np.arange(totals.sum()) - np.repeat(np.cumsum(totals) - totals, totals)
+    return np.repeat(starts, totals) + run
+
+
+def weld_vertices(vertices, tolerance=0.0001):
+    """
+    Merge vertices closer than the tolerance.
+    
+    Vertices connected through chains of close pairs form one cluster and
+    are replaced by the cluster's first vertex.
+    
+    Args:
+        vertices: (V, 3) vertex coordinates
+        tolerance: Merge distance
+    
+    Returns:
+        tuple: (welded_vertices, remap) where remap[i] is the new index of
+               vertex i
+    """
+    vertices = np.asarray(vertices, dtype=np.float64).reshape(-1, 3)
+    first, second = candidate_pairs(vertices, vertices, tolerance)
+    close = (first < second) & \
+        (np.linalg.norm(vertices[first] - vertices[second], axis=1) < tolerance)
+    first, second = first[close], second[close]
+    
+    # Propagate the smallest index through each cluster
+    labels = np.arange(len(vertices))
+    while len(first):
+        updated = labels.copy()
+        np.minimum.at(updated, first, labels[second])
+        np.minimum.at(updated, second, labels[first])
+        updated = updated[updated]
+        if np.array_equal(updated, labels):
+            break
+        labels = updated
+    
+    keep, remap = np.unique(labels, return_inverse=True)
+    return vertices[keep], remap.ravel()
+
+
+def face_normals(vertices, loop_starts, loop_totals, loop_vertices):
+    """
+    Compute face normals with Newell's method (not normalised).
+    
+    Args:
+        vertices: (V, 3) vertex coordinates
+        loop_starts: (F,) index of each face's first loop
+        loop_totals: (F,) number of loops of each face
+        loop_vertices: (L,) vertex index of each loop
+    
+    Returns:
+        numpy.ndarray: (F, 3) normals, with length twice the face area
+    """
+    normals = np.zeros((len(loop_starts), 3))
+    for size in np.unique(loop_totals):
+        faces = np.flatnonzero(loop_totals == size)
+        corners = vertices[loop_vertices[loop_starts[faces, None] + np.arange(size)]]
+        normals[faces] = np.cross(corners, np.roll(corners, -1, axis=1)).sum(axis=1)
+    return normals
+
+
+def interior_face_mask(vertices, loop_starts, loop_totals, loop_vertices):
+    """
+    Find faces that lie between two meshes after welding.
+    
+    A face is interior when another face uses the same set of vertices with
+    the opposite normal. Faces are matched by a canonical key (their sorted
+    vertex indices), so the cost is one sort instead of a pairwise search.
+    
+    Args:
+        vertices: (V, 3) vertex coordinates
+        loop_starts: (F,) index of each face's first loop
+        loop_totals: (F,) number of loops of each face
+        loop_vertices: (L,) vertex index of each loop
+    
+    Returns:
+        numpy.ndarray: (F,) boolean array, True for interior faces
+    """
+    interior = np.zeros(len(loop_starts), dtype=bool)
+    normals = None
+    
+    for size in np.unique(loop_totals):
+        faces = np.flatnonzero(loop_totals == size)
+        keys = np.sort(loop_vertices[loop_starts[faces, None] + np.arange(size)], axis=1)
+        _, group, counts = np.unique(keys, axis=0, return_inverse=True, return_counts=True)
+        group = group.ravel()
+        shared = counts[group] > 1
+        if not shared.any():
+            continue
+        
+        if normals is None:
+            normals = face_normals(vertices, loop_starts, loop_totals, loop_vertices)
+        group_normals = normals[faces]
+        
+        # Compare every face with the first face of its group
+        first = np.empty(len(counts), dtype=np.int64)
+        first[group[::-1]] = np.arange(len(faces))[::-1]
+        dots = np.einsum('ij,ij->i', group_normals, group_normals[first[group]])
+        lowest = np.full(len(counts), np.inf)
+        np.minimum.at(lowest, group, dots)
+        
+        interior[faces] = shared & (lowest[group] < 0)
+    
+    return interior
+
+
+def merge_mesh_arrays(parts, tolerance=0.0001):
+    """
+    Merge meshes into one: weld vertices, drop interior faces, compact.
+    
+    All parts must be in the same space (usually world space). Material
+    indices must already refer to one shared slot list (see
+    merge_material_slots). UV maps are matched by name; a part without a map
+    that another part has gets zero UVs in it, as with Blender's join.
+    
+    Args:
+        parts: Sequence of MeshArrays
+        tolerance: Distance for welding vertices
+    
+    Returns:
+        tuple: (merged MeshArrays, welded vertex count, removed face count)
+    """
+    vertex_offsets = np.cumsum([0] + [len(part.vertices) for part in parts])
+    loop_offsets = np.cumsum([0] + [len(part.loop_vertices) for part in parts])
+    
+    vertices = np.concatenate([part.vertices for part in parts] + [np.zeros((0, 3))])
+    loop_starts = np.concatenate([part.loop_starts + offset
+                                  for part, offset in zip(parts, loop_offsets)] + [[]])
+    loop_totals = np.concatenate([part.loop_totals for part in parts] + [[]])
+    loop_vertices = np.concatenate([part.loop_vertices + offset
+                                    for part, offset in zip(parts, vertex_offsets)] + [[]])
+    loop_starts, loop_totals, loop_vertices = (loop_starts.astype(np.int64),
+                                               loop_totals.astype(np.int64),
+                                               loop_vertices.astype(np.int64))
+    face_materials = np.concatenate([part.face_materials for part in parts]
+                                    + [np.zeros(0, dtype=np.int64)])
+    face_smooth = np.concatenate([part.face_smooth for part in parts] + [np.zeros(0, dtype=bool)])
+    uv_names = list(dict.fromkeys(name for part in parts for name in part.uv_layers))
+    uv_layers = {name: np.concatenate([part.uv_layers.get(name, np.zeros((len(part.loop_vertices), 2)))
+                                       for part in parts])
+                 for name in uv_names}
+    
+    # Step 1: weld
+    welded, remap = weld_vertices(vertices, tolerance)
+    loop_vertices = remap[loop_vertices]
+    
+    # Step 2: drop interior faces and their loops
+    interior = interior_face_mask(welded, loop_starts, loop_totals, loop_vertices)
+    kept_totals = loop_totals[~interior]
+    kept_loops = _loop_indices(loop_starts[~interior], kept_totals)
+    loop_vertices = loop_vertices[kept_loops]
+    uv_layers = {name: uvs[kept_loops] for name, uvs in uv_layers.items()}
+    
+    # Step 3: remove vertices that no face uses any more
+    used, loop_vertices = np.unique(loop_vertices, return_inverse=True)
+    
+    merged = MeshArrays(welded[used], np.cumsum(kept_totals) - kept_totals, kept_totals,
+                        loop_vertices.ravel(), face_materials=face_materials[~interior],
+                        face_smooth=face_smooth[~interior], uv_layers=uv_layers)
+    return merged, len(vertices) - len(welded), int(interior.sum())
+
+
+def merge_material_slots(slot_lists):
+    """
+    Combine the material slots of several meshes into one slot list.
+    
+    Args:
+        slot_lists: Per mesh, the list of its slot keys (any hashable, e.g.
+                    material pointers; None for an empty slot)
+    
+    Returns:
+        tuple: (slots, remaps) where slots is the combined key list in order
+               of first use, and remaps[i] is an int array mapping slot
+               indices of mesh i to combined indices
+    """
+    combined = {}
+    remaps = []
+    for slots in slot_lists:
+        remaps.append(np.array([combined.setdefault(key, len(combined)) for key in slots],
+                               dtype=np.int64))
+    return list(combined), remaps
@@ -0,0 +1,154 @@
+"""
+Persistent index of scene objects and their world-space bounds.
+
+The addon keeps one SceneIndex of the cubes in the scene and updates it from
+Blender's depsgraph handlers: objects that moved or changed are re-inserted,
+objects added to or deleted from the scene are found by comparing the scene
+with scene_keys, and undo or file load mark the index dirty so it is rebuilt
+the next time it is needed. Generating cubes
+then reads the bounds from the index instead of rescanning the scene.
+
+Requires NumPy (bundled with Blender).
+"""
+
+import numpy as np
+
+
+class SceneIndex:
+    """
+    World-space bounding boxes of tracked objects, keyed by object.
+    
+    The placement planner reads every box at once, so boxes are kept as rows
+    of two (N, 3) arrays with a key -> row map; updates write the rows in
+    place and removals move the last row into the gap.
+    
+    Attributes:
+        dirty: True when the index must be rebuilt before use
+        owner: Key of the scene the index was built for
+        scene_keys: Keys of all scene objects (tracked or not) at the last
+                    rebuild or update, used to notice added and deleted objects
+    """
+    
+    def __init__(self):
+        self._rows = {}
+        self._keys = []
+        self._min = np.zeros((0, 3))
+        self._max = np.zeros((0, 3))
+        self._arrays = None
+        self.dirty = True
+        self.owner = None
+        self.scene_keys = set()
+    
+    def __len__(self):
+        return len(self._keys)
+    
+    def __contains__(self, key):
+        return key in self._rows
+    
+    def mark_dirty(self):
+        """Request a full rebuild before the next use."""
+        self.dirty = True
+        self._arrays = None
+    
+    def clear(self):
+        """Drop all entries and mark the index dirty."""
+        self._rows = {}
+        self._keys = []
+        self.owner = None
+        self.scene_keys = set()
+        self.mark_dirty()
+    
+    def rebuild(self, keys, box_min, box_max, owner=None, scene_keys=None):
+        """
+        Replace all entries.
+        
+        Args:
+            keys: Object keys
+            box_min: (N, 3) array of bounding box minimum corners
+            box_max: (N, 3) array of bounding box maximum corners
+            owner: Key of the scene the entries belong to
+            scene_keys: Keys of all objects in the scene
+        """
+        self._rows = {}
+        self._keys = []
+        self.update(keys, box_min, box_max)
+        self.owner = owner
+        self.scene_keys = set(scene_keys) if scene_keys is not None else set(keys)
+        self.dirty = False
+    
+    def _reserve(self, count, used):
+        """Grow the row arrays to hold at least count rows, keeping the first used rows."""
+        capacity = len(self._min)
+        if count <= capacity:
+            return
+        capacity = max(count, 2 * capacity, 16)
+        for name in ('_min', '_max'):
+            grown = np.zeros((capacity, 3))
+            grown[:used] = getattr(self, name)[:used]
+            setattr(self, name, grown)
+    
+    def update(self, keys, box_min, box_max):
+        """
+        Insert or move objects.
+        
+        Args:
+            keys: Object keys
+            box_min: (N, 3) array of bounding box minimum corners
+            box_max: (N, 3) array of bounding box maximum corners
+        """
+        box_min = np.asarray(box_min, dtype=np.float64).reshape(-1, 3)
+        box_max = np.asarray(box_max, dtype=np.float64).reshape(-1, 3)
+        
+        used = len(self._keys)
+        rows = []
+        for key in keys:
+            row = self._rows.get(key)
+            if row is None:
+                row = self._rows[key] = len(self._keys)
+                self._keys.append(key)
+            rows.append(row)
+        if not rows:
+            return
+        
+        self._reserve(len(self._keys), used)
+        self._min[rows] = box_min
+        self._max[rows] = box_max
+        self._arrays = None
+    
+    def discard(self, keys):
+        """
+        Remove objects that are no longer tracked (unknown keys are ignored).
+        
+        Args:
+            keys: Object keys
+        """
+        for key in keys:
+            row = self._rows.pop(key, None)
+            if row is None:
+                continue
+            last = len(self._keys) - 1
+            if row != last:
+                moved = self._keys[last]
+                self._keys[row] = moved
+                self._rows[moved] = row
+                self._min[row] = self._min[last]
+                self._max[row] = self._max[last]
+            self._keys.pop()
+            self._arrays = None
+    
+    def keys(self):
+        """Get the keys of all tracked objects, in row order."""
+        return list(self._keys)
+    
+    def bounds(self):
+        """
+        Get the bounds of all tracked objects.
+        
+        Returns:
+            tuple: (box_min, box_max) arrays of shape (N, 3), in the order of
+                   keys(); they are copies and stay valid after later updates
+        """
+        if self._arrays is None:
+            count = len(self._keys)
+            self._arrays = (self._min[:count].copy(), self._max[:count].copy())
+        return self._arrays
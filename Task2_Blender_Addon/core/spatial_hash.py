@@ -0,0 +1,230 @@
+"""
+Uniform-grid spatial hash for collision queries.
+
+Objects are stored by their location and their axis-aligned bounding box
+(AABB). Queries only visit the grid cells near the query point or box, so a
+collision check costs O(nearby objects) instead of O(all objects).
+"""
+
+import math
+
+
+class SpatialHash:
+    """
+    Uniform grid of object locations and bounding boxes.
+    
+    Each object is stored twice: its location in the single cell containing
+    it (for distance queries) and its bounding box in every cell the box
+    overlaps (for box queries). Boxes covering more than max_cells_per_box
+    cells are kept in a separate list that every box query checks.
+    """
+    
+    def __init__(self, cell_size, max_cells_per_box=64):
+        """
+        Create an empty spatial hash.
+        
+        Args:
+            cell_size: Edge length of a grid cell; the typical query radius
+                       is a good choice
+            max_cells_per_box: Boxes spanning more cells than this are not
+                               rasterised into the grid
+        """
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        
+        self.cell_size = float(cell_size)
+        self.max_cells_per_box = max_cells_per_box
+        self._points = {}
+        self._boxes = {}
+        self._large_boxes = []
+        self._items = {}
+    
+    def __len__(self):
+        return len(self._items)
+    
+    def __contains__(self, key):
+        return key in self._items
+    
+    def _cell(self, point):
+        """Get the integer cell coordinates containing a point."""
+        size = self.cell_size
+        return (math.floor(point[0] / size),
+                math.floor(point[1] / size),
+                math.floor(point[2] / size))
+    
+    def _cell_range(self, box_min, box_max):
+        """Get the inclusive cell coordinate ranges covered by a box."""
+        low = self._cell(box_min)
+        high = self._cell(box_max)
+        return [range(low[axis], high[axis] + 1) for axis in range(3)]
+    
+    def insert(self, key, location, box_min=None, box_max=None):
+        """
+        Add an object to the index.
+        
+        Args:
+            key: Hashable identifier (e.g., the object name)
+            location: (x, y, z) location of the object
+            box_min: (x, y, z) minimum corner of the world-space AABB
+                     (defaults to the location)
+            box_max: (x, y, z) maximum corner of the world-space AABB
+                     (defaults to the location)
+        """
+        if key in self._items:
+            self.remove(key)
+        
+        location = tuple(float(c) for c in location)
+        box_min = location if box_min is None else tuple(float(c) for c in box_min)
+        box_max = location if box_max is None else tuple(float(c) for c in box_max)
+        
+        self._points.setdefault(self._cell(location), []).append(key)
+        
+        xs, ys, zs = self._cell_range(box_min, box_max)
+        cells = [(x, y, z) for x in xs for y in ys for z in zs] \
+            if len(xs) * len(ys) * len(zs) <= self.max_cells_per_box else None
+        if cells is None:
+            self._large_boxes.append(key)
+        else:
+            for cell in cells:
+                self._boxes.setdefault(cell, []).append(key)
+        
+        self._items[key] = (location, box_min, box_max, cells)
+    
+    def remove(self, key):
+        """
+        Remove an object from the index.
+        
+        Args:
+            key: Identifier used when the object was inserted
+        
+        Returns:
+            bool: True if the object was found and removed
+        """
+        item = self._items.pop(key, None)
+        if item is None:
+            return False
+        
+        location, box_min, box_max, cells = item
+        self._discard(self._points, self._cell(location), key)
+        if cells is None:
+            self._large_boxes.remove(key)
+        else:
+            for cell in cells:
+                self._discard(self._boxes, cell, key)
+        return True
+    
+    @staticmethod
+    def _discard(grid, cell, key):
+        """Remove a key from a grid cell, dropping the cell when it becomes empty."""
+        bucket = grid.get(cell)
+        if bucket is not None:
+            bucket.remove(key)
+            if not bucket:
+                del grid[cell]
+    
+    def keys(self):
+        """Get the keys of all stored objects, in insertion order."""
+        return list(self._items)
+    
+    def location(self, key):
+        """Get the stored location of an object."""
+        return self._items[key][0]
+    
+    def bounds(self, key):
+        """Get the stored (box_min, box_max) of an object."""
+        item = self._items[key]
+        return item[1], item[2]
+    
+    def _iter_radius(self, point, radius):
+        """Yield keys of objects whose location is strictly closer than radius to a point."""
+        px, py, pz = point
+        xs, ys, zs = self._cell_range((px - radius, py - radius, pz - radius),
+                                      (px + radius, py + radius, pz + radius))
+        
+        for x in xs:
+            for y in ys:
+                for z in zs:
+                    for key in self._points.get((x, y, z), ()):
+                        lx, ly, lz = self._items[key][0]
+                        if math.sqrt((lx - px) ** 2 + (ly - py) ** 2 + (lz - pz) ** 2) < radius:
+                            yield key
+    
+    def query_radius(self, point, radius):
+        """
+        Find objects whose location is strictly closer than radius to a point.
+        
+        Args:
+            point: (x, y, z) query point
+            radius: Search radius
+        
+        Returns:
+            list: Keys of the matching objects
+        """
+        return list(self._iter_radius(point, radius))
+    
+    def any_within(self, point, radius):
+        """
+        Check whether any object location is strictly closer than radius to a point.
+        
+        Stops at the first match.
+        
+        Args:
+            point: (x, y, z) query point
+            radius: Search radius
+        
+        Returns:
+            bool: True if at least one object is within the radius
+        """
+        for _ in self._iter_radius(point, radius):
+            return True
+        return False
+    
+    def query_box(self, box_min, box_max):
+        """
+        Find objects whose bounding box overlaps a box.
+        
+        Boxes that only touch (share a face, edge or corner) do not overlap.
+        
+        Args:
+            box_min: (x, y, z) minimum corner of the query box
+            box_max: (x, y, z) maximum corner of the query box
+        
+        Returns:
+            list: Keys of the overlapping objects
+        """
+        xs, ys, zs = self._cell_range(box_min, box_max)
+        candidates = set(self._large_boxes)
+        
+        if len(xs) * len(ys) * len(zs) > len(self._items):
+            # Query box is huge compared to the scene: check everything
+            candidates.update(self._items)
+        else:
+            for x in xs:
+                for y in ys:
+                    for z in zs:
+                        candidates.update(self._boxes.get((x, y, z), ()))
+        
+        return [key for key in candidates if self._box_overlaps(key, box_min, box_max)]
+    
+    def _box_overlaps(self, key, box_min, box_max):
+        """Check whether a stored object's box overlaps a box."""
+        _, other_min, other_max, _ = self._items[key]
+        return all(other_min[axis] < box_max[axis] and box_min[axis] < other_max[axis]
+                   for axis in range(3))
+
+
+def build_spatial_hash(items, cell_size):
+    """
+    Build a spatial hash from (key, location, box_min, box_max) tuples in one pass.
+    
+    Args:
+        items: Iterable of (key, location, box_min, box_max)
+        cell_size: Edge length of a grid cell
+    
+    Returns:
+        SpatialHash: The populated index
+    """
+    index = SpatialHash(cell_size)
+    for key, location, box_min, box_max in items:
+        index.insert(key, location, box_min, box_max)
+    return index
@@ -0,0 +1,150 @@
+"""
+Tests for the mesh merge broad phase (runs without Blender).
+
+Compares sweep_and_prune with an all-pairs bounding box check and the
+union-find grouping with a graph search, on random boxes, touching cube
+grids and boxes lined up on a single axis.
+
+Run from the addon folder: python tests/test_broad_phase.py
+or with pytest from the repository root: python -m pytest
+"""
+
+import os
+import sys
+
+import numpy as np
+
+# core/ is imported on its own; importing the addon package would need bpy
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.broad_phase import UnionFind, connected_components, sweep_and_prune
+
+
+def all_pairs(box_min, box_max, margin=0.0):
+    """Every pair (i, j), i < j, of boxes that overlap or are closer than margin."""
+    pairs = set()
+    for i in range(len(box_min)):
+        for j in range(i + 1, len(box_min)):
+            if np.all((box_min[i] <= box_max[j] + margin) & (box_min[j] <= box_max[i] + margin)):
+                pairs.add((i, j))
+    return pairs
+
+
+def graph_components(count, pairs):
+    """Connected components by depth-first search, each sorted, sorted by first item."""
+    neighbours = [[] for _ in range(count)]
+    for i, j in pairs:
+        neighbours[i].append(j)
+        neighbours[j].append(i)
+    seen = [False] * count
+    components = []
+    for start in range(count):
+        if seen[start]:
+            continue
+        seen[start] = True
+        stack, component = [start], []
+        while stack:
+            item = stack.pop()
+            component.append(item)
+            for other in neighbours[item]:
+                if not seen[other]:
+                    seen[other] = True
+                    stack.append(other)
+        components.append(sorted(component))
+    return components
+
+
+def as_pair_set(pairs):
+    """Convert a (P, 2) pair array to a set, checking order and uniqueness."""
+    assert pairs.shape[1] == 2
+    assert (pairs[:, 0] < pairs[:, 1]).all()
+    result = set(map(tuple, pairs.tolist()))
+    assert len(result) == len(pairs), "duplicate pairs"
+    return result
+
+
+def test_random_boxes_match_all_pairs():
+    print("=" * 60)
+    print("TEST: sweep_and_prune matches an all-pairs check")
+    print("=" * 60)
+    
+    rng = np.random.default_rng(11)
+    total = 0
+    for count in (0, 1, 2, 5, 40, 250):
+        for margin in (0.0, 0.05):
+            low = rng.uniform(-5.0, 5.0, (count, 3))
+            high = low + rng.uniform(0.0, 1.5, (count, 3))
+            pairs = as_pair_set(sweep_and_prune(low, high, margin))
+            assert pairs == all_pairs(low, high, margin)
+            total += len(pairs)
+    print(f"  {total} overlapping pairs over 12 random scenes")
+
+
+def test_touching_grid_and_degenerate_axes():
+    print("=" * 60)
+    print("TEST: touching cubes and boxes with equal coordinates")
+    print("=" * 60)
+    
+    # 4 x 3 x 2 grid of unit cubes that share faces, edges and corners
+    centres = np.array([[x, y, z] for x in range(4) for y in range(3) for z in range(2)], dtype=float)
+    low, high = centres - 0.5, centres + 0.5
+    pairs = as_pair_set(sweep_and_prune(low, high))
+    assert pairs == all_pairs(low, high)
+    # Every cube touches every neighbour in its 3 x 3 x 3 block
+    assert len(pairs) == sum(
+        1 for i in range(len(centres)) for j in range(i + 1, len(centres))
+        if np.abs(centres[i] - centres[j]).max() <= 1.0
+    )
+    
+    # A small gap only counts within the margin
+    gap_low = np.array([[0.0, 0.0, 0.0], [1.001, 0.0, 0.0]])
+    gap_high = gap_low + 1.0
+    assert len(sweep_and_prune(gap_low, gap_high)) == 0
+    assert as_pair_set(sweep_and_prune(gap_low, gap_high, margin=0.01)) == {(0, 1)}
+    
+    # All boxes share the same minimum on every axis (no spread to sort by)
+    stacked_low = np.zeros((6, 3))
+    stacked_high = np.ones((6, 3)) * np.arange(1, 7)[:, None]
+    assert as_pair_set(sweep_and_prune(stacked_low, stacked_high)) == all_pairs(stacked_low, stacked_high)
+    
+    # Boxes in a row along one axis but separated on another
+    row_low = np.array([[x * 0.5, (x % 2) * 3.0, 0.0] for x in range(10)])
+    row_high = row_low + 1.0
+    assert as_pair_set(sweep_and_prune(row_low, row_high)) == all_pairs(row_low, row_high)
+    print(f"  {len(pairs)} touching pairs in a 24-cube grid")
+
+
+def test_components_match_graph_search():
+    print("=" * 60)
+    print("TEST: union-find components match a graph search")
+    print("=" * 60)
+    
+    rng = np.random.default_rng(12)
+    for count in (1, 10, 200):
+        low = rng.uniform(-8.0, 8.0, (count, 3))
+        high = low + rng.uniform(0.2, 1.5, (count, 3))
+        pairs = sweep_and_prune(low, high)
+        components = connected_components(count, pairs)
+        assert sorted(components) == graph_components(count, all_pairs(low, high))
+        assert sorted(item for component in components for item in component) == list(range(count))
+    
+    assert connected_components(3, []) == [[0], [1], [2]]
+    assert connected_components(0, []) == []
+    
+    # A long chain joined in both directions ends up as one set
+    chain = [(i, i + 1) for i in range(0, 1000, 2)] + [(i, i + 1) for i in range(1, 999, 2)]
+    assert connected_components(1000, chain) == [list(range(1000))]
+    
+    sets = UnionFind(4)
+    assert sets.union(0, 1) and sets.union(2, 3) and sets.union(1, 3)
+    assert not sets.union(0, 2)
+    assert sets.find(0) == sets.find(3)
+    print("  random scenes, a 1000-item chain and repeated unions")
+
+
+if __name__ == "__main__":
+    test_random_boxes_match_all_pairs()
+    test_touching_grid_and_degenerate_axes()
+    test_components_match_graph_search()
+    print()
+    print("All broad phase tests passed")
@@ -0,0 +1,69 @@
+"""
+Tests for the cube geometry builder (runs without Blender).
+
+Run from the addon folder: python tests/test_cube_geometry.py
+or with pytest from the repository root: python -m pytest
+"""
+
+import os
+import sys
+
+import numpy as np
+
+# core/ is imported on its own; importing the addon package would need bpy
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.cube_geometry import cube_geometry
+from core.mesh_merge import face_normals, merge_mesh_arrays
+
+
+def test_single_cube():
+    """One cube has 8 corners, 6 outward quads and a UV per loop."""
+    print("=" * 60)
+    print("TEST 1: Single Cube")
+    print("=" * 60)
+    cube = cube_geometry(2.0)
+    assert cube.vertices.shape == (8, 3) and cube.face_count == 6
+    assert np.allclose(cube.vertices.min(axis=0), -1) and np.allclose(cube.vertices.max(axis=0), 1)
+    assert cube.loop_uvs.shape == (24, 2)
+    
+    normals = face_normals(cube.vertices, cube.loop_starts, cube.loop_totals, cube.loop_vertices)
+    centres = np.array([cube.vertices[face].mean(axis=0) for face in cube.faces()])
+    assert (np.einsum('ij,ij->i', normals, centres) > 0).all()
+    assert len({tuple(sorted(face)) for face in cube.faces()}) == 6
+    print("✓ 8 vertices, 6 outward faces, 24 UVs\n")
+
+
+def test_copies_share_topology():
+    """Cubes of any size share one face layout, as the template copies do."""
+    print("=" * 60)
+    print("TEST 2: Sizes Share the Face Layout")
+    print("=" * 60)
+    unit = cube_geometry(1.0)
+    large = cube_geometry(2.5)
+    assert np.allclose(large.vertices, unit.vertices * 2.5)
+    assert (large.loop_vertices == unit.loop_vertices).all()
+    assert np.allclose(large.loop_uvs, unit.loop_uvs)
+    print("✓ Only the vertex positions scale\n")
+
+
+def test_touching_cubes_merge():
+    """A touching row of generated cubes merges into one box."""
+    print("=" * 60)
+    print("TEST 3: Generated Cubes Merge")
+    print("=" * 60)
+    parts = []
+    for x in range(4):
+        matrix = np.eye(4)
+        matrix[0, 3] = x
+        parts.append(cube_geometry().transformed(matrix))
+    merged, _, removed = merge_mesh_arrays(parts)
+    assert merged.face_count == 18 and removed == 6 and len(merged.vertices) == 20
+    print("✓ 4x1x1 box\n")
+
+
+if __name__ == "__main__":
+    test_single_cube()
+    test_copies_share_topology()
+    test_touching_cubes_merge()
+    print("All cube geometry tests passed")
@@ -0,0 +1,157 @@
+"""
+Tests for vectorised common-face detection (runs without Blender).
+
+Compares find_common_faces_arrays with the addon's original O(F1 x F2) loop
+over every face pair, on transformed cubes and on random face clouds where
+many centres lie near the hash cell boundaries.
+
+Run from the addon folder: python tests/test_face_matching.py
+or with pytest from the repository root: python -m pytest
+"""
+
+import math
+import os
+import sys
+
+import numpy as np
+
+# core/ is imported on its own; importing the addon package would need bpy
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.cube_geometry import CUBE_CORNERS, CUBE_FACES
+from core.face_matching import NORMAL_DOT_LIMIT, candidate_pairs, find_common_faces_arrays
+
+
+def cube_faces(size=1.0):
+    """Object-space face centres and unit normals of a cube."""
+    corners = CUBE_CORNERS * size
+    centers = corners[CUBE_FACES].mean(axis=1)
+    normals = centers / np.linalg.norm(centers, axis=1, keepdims=True)
+    return centers, normals
+
+
+def matrix(location=(0.0, 0.0, 0.0), angle=0.0, scale=1.0):
+    """4x4 world matrix rotating about Z, scaling uniformly and translating."""
+    cos, sin = math.cos(angle), math.sin(angle)
+    result = np.eye(4)
+    result[:3, :3] = np.array([[cos, -sin, 0.0], [sin, cos, 0.0], [0.0, 0.0, 1.0]]) * scale
+    result[:3, 3] = location
+    return result
+
+
+def brute_force_common_faces(matrix1, centers1, normals1, matrix2, centers2, normals2,
+                             tolerance=0.0001):
+    """The original pairwise loop: every face of the first mesh against every face of the second."""
+    rotation1, rotation2 = matrix1[:3, :3], matrix2[:3, :3]
+    common1, common2 = set(), set()
+    for i, (center1, normal1) in enumerate(zip(centers1, normals1)):
+        world_center1 = rotation1 @ center1 + matrix1[:3, 3]
+        world_normal1 = rotation1 @ normal1
+        for j, (center2, normal2) in enumerate(zip(centers2, normals2)):
+            world_center2 = rotation2 @ center2 + matrix2[:3, 3]
+            world_normal2 = rotation2 @ normal2
+            if (np.linalg.norm(world_center1 - world_center2) < tolerance
+                    and world_normal1 @ world_normal2 < NORMAL_DOT_LIMIT):
+                common1.add(i)
+                common2.add(j)
+    return sorted(common1), sorted(common2)
+
+
+def check_against_brute_force(matrix1, centers1, normals1, matrix2, centers2, normals2,
+                              tolerance=0.0001):
+    """Assert that the vectorised and pairwise results agree, and return them."""
+    expected = brute_force_common_faces(matrix1, centers1, normals1,
+                                        matrix2, centers2, normals2, tolerance)
+    found = find_common_faces_arrays(matrix1, centers1, normals1,
+                                     matrix2, centers2, normals2, tolerance)
+    assert found == expected, f"expected {expected}, got {found}"
+    return found
+
+
+def test_adjacent_cubes():
+    print("=" * 60)
+    print("TEST: cubes sharing one face")
+    print("=" * 60)
+    
+    centers, normals = cube_faces()
+    cases = [
+        (matrix(), matrix((1.0, 0.0, 0.0)), 1),
+        (matrix(), matrix((0.0, -1.0, 0.0)), 1),
+        (matrix(), matrix((0.0, 0.0, 1.0)), 1),
+        # Rotated about the shared face normal: the faces still coincide
+        (matrix(), matrix((0.0, 0.0, 1.0), angle=math.pi / 2), 1),
+        (matrix((3.0, 2.0, 0.0), angle=0.7), matrix((3.0 + math.cos(0.7), 2.0 + math.sin(0.7), 0.0),
+                                                     angle=0.7), 1),
+        # Scaled objects meet where their scaled faces meet
+        (matrix(scale=2.0), matrix((1.5, 0.0, 0.0)), 1),
+        # Gap, diagonal neighbour and overlap: no common faces
+        (matrix(), matrix((1.01, 0.0, 0.0)), 0),
+        (matrix(), matrix((1.0, 1.0, 0.0)), 0),
+        (matrix(), matrix(), 0),
+    ]
+    for matrix1, matrix2, count in cases:
+        found = check_against_brute_force(matrix1, centers, normals, matrix2, centers, normals)
+        assert len(found[0]) == len(found[1]) == count
+    print(f"  {len(cases)} cube pairs")
+
+
+def test_random_face_clouds():
+    print("=" * 60)
+    print("TEST: random faces near the tolerance and cell boundaries")
+    print("=" * 60)
+    
+    rng = np.random.default_rng(7)
+    for tolerance in (0.0001, 0.05, 0.3):
+        for _ in range(20):
+            count1, count2 = rng.integers(0, 60, size=2)
+            centers1 = rng.uniform(-1.0, 1.0, (count1, 3))
+            # Half of the second mesh's faces sit just inside or outside the
+            # tolerance of a face of the first mesh, facing it
+            near = min(count1, count2 // 2)
+            offsets = rng.normal(size=(near, 3))
+            offsets *= (tolerance * rng.uniform(0.5, 1.5, (near, 1))
+                        / np.linalg.norm(offsets, axis=1, keepdims=True))
+            centers2 = np.concatenate([centers1[:near] + offsets,
+                                       rng.uniform(-1.0, 1.0, (count2 - near, 3))])
+            normals1 = rng.normal(size=(count1, 3))
+            normals1 /= np.linalg.norm(normals1, axis=1, keepdims=True)
+            normals2 = rng.normal(size=(count2, 3))
+            normals2[:near] = -normals1[:near] + rng.normal(scale=0.3, size=(near, 3))
+            normals2 /= np.linalg.norm(normals2, axis=1, keepdims=True)
+            
+            check_against_brute_force(np.eye(4), centers1, normals1,
+                                      matrix((0.2, -0.1, 0.0)), centers2 - (0.2, -0.1, 0.0),
+                                      normals2, tolerance)
+    print("  60 random mesh pairs over 3 tolerances")
+
+
+def test_candidate_pairs_cover_all_close_points():
+    print("=" * 60)
+    print("TEST: candidate_pairs never misses a close pair")
+    print("=" * 60)
+    
+    rng = np.random.default_rng(8)
+    tolerance = 0.1
+    # Points on a lattice of the cell size, nudged across the boundaries
+    lattice = np.stack(np.meshgrid(*[np.arange(-3, 3) * 2 * tolerance] * 3), axis=-1).reshape(-1, 3)
+    points1 = lattice + rng.uniform(-0.01, 0.01, lattice.shape)
+    points2 = np.concatenate([points1 + rng.uniform(-0.06, 0.06, points1.shape),
+                              rng.uniform(-0.6, 0.6, (300, 3))])
+    
+    first, second = candidate_pairs(points1, points2, tolerance)
+    candidates = set(zip(first.tolist(), second.tolist()))
+    assert len(candidates) == len(first), "duplicate candidate pairs"
+    
+    distances = np.linalg.norm(points1[:, None, :] - points2[None, :, :], axis=2)
+    close = set(zip(*np.nonzero(distances < tolerance)))
+    assert close <= candidates
+    assert candidate_pairs(np.zeros((0, 3)), points2, tolerance)[0].size == 0
+    print(f"  {len(close)} close pairs among {len(candidates)} candidates")
+
+
+if __name__ == "__main__":
+    test_adjacent_cubes()
+    test_random_face_clouds()
+    test_candidate_pairs_cover_all_close_points()
+    print()
+    print("All face matching tests passed")
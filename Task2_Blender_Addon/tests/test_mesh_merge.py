@@ -0,0 +1,236 @@
+"""
+Tests for the array-based mesh merge engine (runs without Blender).
+
+Builds synthetic grids of unit cubes and checks welding, interior face
+removal and compaction against counts worked out by hand.
+
+Run from the addon folder: python tests/test_mesh_merge.py
+or with pytest from the repository root: python -m pytest
+"""
+
+import os
+import sys
+
+import numpy as np
+
+# core/ is imported on its own; importing the addon package would need bpy
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.cube_geometry import cube_geometry
+from core.mesh_merge import (MeshArrays, merge_material_slots, merge_mesh_arrays, weld_vertices,
+                             face_normals)
+
+
+def cube(center, size=1.0):
+    """Build one cube as MeshArrays, with a UV per loop."""
+    matrix = np.eye(4)
+    matrix[:3, 3] = center
+    return cube_geometry(size).transformed(matrix)
+
+
+def cube_grid(nx, ny, nz, pitch=1.0):
+    """Build an nx x ny x nz grid of cubes, one part per cube."""
+    return [cube((x * pitch, y * pitch, z * pitch))
+            for x in range(nx) for y in range(ny) for z in range(nz)]
+
+
+def count_edges(mesh):
+    """Count unique undirected edges of a mesh."""
+    edges = set()
+    for face in mesh.faces():
+        for a, b in zip(face, face[1:] + face[:1]):
+            edges.add((min(a, b), max(a, b)))
+    return len(edges)
+
+
+def check_outward(mesh):
+    """Verify every face normal points away from the mesh centre."""
+    normals = face_normals(mesh.vertices, mesh.loop_starts, mesh.loop_totals, mesh.loop_vertices)
+    centre = mesh.vertices.mean(axis=0)
+    face_centres = np.array([mesh.vertices[face].mean(axis=0) for face in mesh.faces()])
+    assert (np.einsum('ij,ij->i', normals, face_centres - centre) > 0).all(), \
+        "a face points inwards"
+
+
+def test_two_cubes():
+    """Two cubes sharing one face become a 2x1x1 box."""
+    print("=" * 60)
+    print("TEST 1: Two Adjacent Cubes")
+    print("=" * 60)
+    merged, welded, removed = merge_mesh_arrays(cube_grid(2, 1, 1))
+    print(f"Vertices: {len(merged.vertices)}, faces: {merged.face_count}, "
+          f"welded: {welded}, removed: {removed}")
+    assert len(merged.vertices) == 12
+    assert merged.face_count == 10
+    assert welded == 4 and removed == 2
+    assert len(merged.vertices) - count_edges(merged) + merged.face_count == 2
+    check_outward(merged)
+    print("✓ Shared face removed, shared vertices welded\n")
+
+
+def test_cube_grid():
+    """A 3x3x3 grid keeps only its outer surface."""
+    print("=" * 60)
+    print("TEST 2: 3x3x3 Cube Grid")
+    print("=" * 60)
+    merged, welded, removed = merge_mesh_arrays(cube_grid(3, 3, 3))
+    print(f"Vertices: {len(merged.vertices)}, faces: {merged.face_count}, "
+          f"edges: {count_edges(merged)}")
+    # 6 sides of 3x3 quads; the 8 inner grid points are removed
+    assert merged.face_count == 54
+    assert len(merged.vertices) == 4 ** 3 - 2 ** 3
+    assert removed == 27 * 6 - 54
+    assert len(merged.vertices) - count_edges(merged) + merged.face_count == 2
+    check_outward(merged)
+    print("✓ Only the outer surface remains\n")
+
+
+def test_separate_cubes():
+    """Cubes with a gap between them are left untouched."""
+    print("=" * 60)
+    print("TEST 3: Separated Cubes")
+    print("=" * 60)
+    merged, welded, removed = merge_mesh_arrays(cube_grid(3, 1, 1, pitch=1.2))
+    print(f"Vertices: {len(merged.vertices)}, faces: {merged.face_count}")
+    assert (len(merged.vertices), merged.face_count, welded, removed) == (24, 18, 0, 0)
+    print("✓ Nothing welded or removed\n")
+
+
+def test_tolerance():
+    """Vertices within the tolerance weld; farther ones do not."""
+    print("=" * 60)
+    print("TEST 4: Weld Tolerance")
+    print("=" * 60)
+    rng = np.random.default_rng(0)
+    parts = cube_grid(4, 4, 1)
+    for part in parts:
+        part.vertices += rng.uniform(-1e-5, 1e-5, part.vertices.shape)
+    merged, _, _ = merge_mesh_arrays(parts, tolerance=0.0001)
+    print(f"Jittered 4x4 grid: {len(merged.vertices)} vertices, {merged.face_count} faces")
+    assert merged.face_count == 2 * 16 + 4 * 4
+    
+    points = np.array([[0, 0, 0], [0.00005, 0, 0], [0.00015, 0, 0], [1, 0, 0]])
+    welded, remap = weld_vertices(points, tolerance=0.0001)
+    print(f"Chain of close points welds to {len(welded)} vertices: remap {remap.tolist()}")
+    assert remap.tolist() == [0, 0, 0, 1]
+    welded, remap = weld_vertices(points[[0, 3]], tolerance=0.0001)
+    assert len(welded) == 2
+    print("✓ Tolerance respected\n")
+
+
+def test_transformed_parts():
+    """Rotated and moved parts merge in world space."""
+    print("=" * 60)
+    print("TEST 5: Transformed Parts")
+    print("=" * 60)
+    angle = np.radians(30)
+    rotation = np.eye(4)
+    rotation[:2, :2] = [[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]]
+    rotation[:3, 3] = [10, -3, 2]
+    parts = [part.transformed(rotation) for part in cube_grid(2, 2, 1)]
+    merged, _, removed = merge_mesh_arrays(parts)
+    print(f"Vertices: {len(merged.vertices)}, faces: {merged.face_count}")
+    assert merged.face_count == 16 and removed == 8
+    check_outward(merged)
+    print("✓ Same result after rotation\n")
+
+
+def test_uvs():
+    """UVs follow the kept loops, in every UV map."""
+    print("=" * 60)
+    print("TEST 6: UV Coordinates")
+    print("=" * 60)
+    merged, _, _ = merge_mesh_arrays(cube_grid(2, 1, 1))
+    assert merged.loop_uvs is not None
+    assert len(merged.loop_uvs) == len(merged.loop_vertices) == 40
+    assert (merged.loop_uvs.reshape(-1, 4, 2) == [[0, 0], [1, 0], [1, 1], [0, 1]]).all()
+    
+    # A second map on one part only: matched by name, zeros for the other part
+    parts = cube_grid(2, 1, 1)
+    parts[1].uv_layers["Detail"] = np.full((24, 2), 0.5)
+    merged, _, _ = merge_mesh_arrays(parts)
+    assert list(merged.uv_layers) == ["UVMap", "Detail"]
+    detail = merged.uv_layers["Detail"].reshape(-1, 4, 2)
+    # 5 faces of each cube remain, the first cube's come first
+    assert (detail[:5] == 0).all() and (detail[5:] == 0.5).all()
+    
+    parts = cube_grid(2, 1, 1)
+    for part in parts:
+        part.uv_layers = {}
+    merged, _, _ = merge_mesh_arrays(parts)
+    assert merged.loop_uvs is None and merged.uv_layers == {}
+    print("✓ UVs kept per loop in every map\n")
+
+
+def test_materials_and_smooth():
+    """Material indices and smooth flags follow the kept faces."""
+    print("=" * 60)
+    print("TEST 7: Materials and Smooth Shading")
+    print("=" * 60)
+    parts = cube_grid(3, 1, 1)
+    for index, part in enumerate(parts):
+        part.face_materials = np.full(part.face_count, index)
+        part.face_smooth = np.arange(part.face_count) % 2 == index % 2
+    merged, _, removed = merge_mesh_arrays(parts)
+    assert removed == 4 and merged.face_count == 14
+    assert sorted(np.bincount(merged.face_materials).tolist()) == [4, 5, 5]
+    
+    # Each kept face keeps its own flag: compare by face centre
+    centres = np.array([merged.vertices[face].mean(axis=0) for face in merged.faces()])
+    checked = 0
+    for part in parts:
+        part_centres = np.array([part.vertices[face].mean(axis=0) for face in part.faces()])
+        for centre, material, smooth in zip(part_centres, part.face_materials, part.face_smooth):
+            found = np.flatnonzero(np.linalg.norm(centres - centre, axis=1) < 1e-9)
+            if len(found) == 1:
+                assert merged.face_materials[found[0]] == material
+                assert merged.face_smooth[found[0]] == smooth
+                checked += 1
+    assert checked == merged.face_count
+    
+    # Slot lists are combined with each material once, in order of first use
+    slots, remaps = merge_material_slots([["red", "blue"], ["blue", None], ["green", "red"]])
+    assert slots == ["red", "blue", None, "green"]
+    assert [remap.tolist() for remap in remaps] == [[0, 1], [1, 2], [3, 0]]
+    print("✓ Material slots and smooth flags kept per face\n")
+
+
+def test_same_orientation_kept():
+    """Duplicate faces with the same normal are not interior faces."""
+    print("=" * 60)
+    print("TEST 8: Duplicate Faces With Equal Normals")
+    print("=" * 60)
+    square = [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]]
+    parts = [MeshArrays.from_faces(square, [[0, 1, 2, 3]]) for _ in range(2)]
+    merged, welded, removed = merge_mesh_arrays(parts)
+    print(f"Faces: {merged.face_count}, welded: {welded}, removed: {removed}")
+    assert merged.face_count == 2 and removed == 0
+    
+    flipped = MeshArrays.from_faces(square, [[3, 2, 1, 0]])
+    merged, _, removed = merge_mesh_arrays([parts[0], flipped])
+    assert merged.face_count == 0 and removed == 2 and len(merged.vertices) == 0
+    print("✓ Only opposite faces are removed\n")
+
+
+def test_empty():
+    """Merging nothing gives an empty mesh."""
+    print("=" * 60)
+    print("TEST 9: Empty Input")
+    print("=" * 60)
+    merged, welded, removed = merge_mesh_arrays([])
+    assert (len(merged.vertices), merged.face_count, welded, removed) == (0, 0, 0, 0)
+    assert merged.faces() == []
+    print("✓ Empty mesh\n")
+
+
+if __name__ == "__main__":
+    test_two_cubes()
+    test_cube_grid()
+    test_separate_cubes()
+    test_tolerance()
+    test_transformed_parts()
+    test_uvs()
+    test_materials_and_smooth()
+    test_same_orientation_kept()
+    test_empty()
+    print("All mesh merge tests passed")
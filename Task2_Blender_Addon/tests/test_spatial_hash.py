@@ -0,0 +1,206 @@
+"""
+Tests for the uniform-grid spatial hash and the scene index (runs without Blender).
+
+Compares radius and box queries with brute-force scans over random points
+and boxes, including negative coordinates, cell boundaries and boxes too
+large to rasterise into the grid.
+
+Run from the addon folder: python tests/test_spatial_hash.py
+or with pytest from the repository root: python -m pytest
+"""
+
+import math
+import os
+import random
+import sys
+
+import numpy as np
+
+# core/ is imported on its own; importing the addon package would need bpy
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.spatial_hash import SpatialHash, build_spatial_hash
+from core.scene_index import SceneIndex
+
+
+def random_items(rng, count, spread=10.0, max_extent=1.5):
+    """Build (key, location, box_min, box_max) tuples around the origin."""
+    items = []
+    for key in range(count):
+        location = tuple(rng.uniform(-spread, spread) for _ in range(3))
+        extent = tuple(rng.uniform(0.0, max_extent) for _ in range(3))
+        box_min = tuple(c - e for c, e in zip(location, extent))
+        box_max = tuple(c + e for c, e in zip(location, extent))
+        items.append((key, location, box_min, box_max))
+    return items
+
+
+def brute_radius(items, point, radius):
+    """Keys whose location is strictly closer than radius, by checking all items."""
+    return {key for key, location, _, _ in items if math.dist(location, point) < radius}
+
+
+def brute_box(items, box_min, box_max):
+    """Keys whose box overlaps the query box, by checking all items."""
+    return {key for key, _, low, high in items
+            if all(low[axis] < box_max[axis] and box_min[axis] < high[axis] for axis in range(3))}
+
+
+def test_radius_queries_match_brute_force():
+    print("=" * 60)
+    print("TEST: query_radius and any_within match a linear scan")
+    print("=" * 60)
+    
+    rng = random.Random(1)
+    items = random_items(rng, 400)
+    for cell_size in (0.5, 1.2, 7.0):
+        index = build_spatial_hash(items, cell_size)
+        for _ in range(300):
+            point = tuple(rng.uniform(-12, 12) for _ in range(3))
+            radius = rng.choice((0.3, 1.2, 2.5, 6.0))
+            expected = brute_radius(items, point, radius)
+            found = index.query_radius(point, radius)
+            assert len(found) == len(set(found)), "duplicate keys returned"
+            assert set(found) == expected
+            assert index.any_within(point, radius) == bool(expected)
+    print("  900 random queries over 3 cell sizes")
+
+
+def test_radius_is_strict():
+    print("=" * 60)
+    print("TEST: objects exactly at the radius do not count")
+    print("=" * 60)
+    
+    index = SpatialHash(1.0)
+    index.insert("a", (1.2, 0.0, 0.0))
+    index.insert("b", (-1.2, 0.0, 0.0))
+    assert not index.any_within((0.0, 0.0, 0.0), 1.2)
+    assert index.query_radius((0.0, 0.0, 0.0), 1.2) == []
+    assert sorted(index.query_radius((0.0, 0.0, 0.0), 1.2001)) == ["a", "b"]
+    # Locations on cell boundaries, in negative cells
+    index.insert("c", (-2.0, -2.0, -2.0))
+    assert index.query_radius((-2.0, -2.0, -1.5), 0.6) == ["c"]
+
+
+def test_box_queries_match_brute_force():
+    print("=" * 60)
+    print("TEST: query_box matches a linear scan")
+    print("=" * 60)
+    
+    rng = random.Random(2)
+    items = random_items(rng, 300)
+    # A few boxes spanning the whole scene, kept outside the grid
+    for key in range(300, 305):
+        items.append((key, (0.0, 0.0, 0.0), (-50.0, -1.0, -1.0), (50.0, 1.0, 1.0)))
+    
+    index = SpatialHash(1.0, max_cells_per_box=64)
+    for key, location, box_min, box_max in items:
+        index.insert(key, location, box_min, box_max)
+    
+    for _ in range(300):
+        centre = [rng.uniform(-12, 12) for _ in range(3)]
+        extent = [rng.choice((0.1, 1.0, 4.0, 30.0)) for _ in range(3)]
+        box_min = tuple(c - e for c, e in zip(centre, extent))
+        box_max = tuple(c + e for c, e in zip(centre, extent))
+        found = index.query_box(box_min, box_max)
+        assert len(found) == len(set(found)), "duplicate keys returned"
+        assert set(found) == brute_box(items, box_min, box_max)
+    
+    # Touching boxes do not overlap
+    touching = SpatialHash(1.0)
+    touching.insert("unit", (0.5, 0.5, 0.5), (0.0, 0.0, 0.0), (1.0, 1.0, 1.0))
+    assert touching.query_box((1.0, 0.0, 0.0), (2.0, 1.0, 1.0)) == []
+    assert touching.query_box((0.99, 0.0, 0.0), (2.0, 1.0, 1.0)) == ["unit"]
+    print("  300 random box queries, including boxes kept outside the grid")
+
+
+def test_insert_remove_and_move():
+    print("=" * 60)
+    print("TEST: moving and removing objects keeps queries exact")
+    print("=" * 60)
+    
+    rng = random.Random(3)
+    items = {key: item for key, *item in random_items(rng, 200)}
+    index = SpatialHash(1.0)
+    for key, (location, box_min, box_max) in items.items():
+        index.insert(key, location, box_min, box_max)
+    
+    for step in range(400):
+        key = rng.randrange(200)
+        if key in items and step % 3 == 0:
+            assert index.remove(key)
+            del items[key]
+            assert key not in index
+        else:
+            # Re-inserting an existing key moves it
+            _, location, box_min, box_max = random_items(rng, 1)[0]
+            index.insert(key, location, box_min, box_max)
+            items[key] = (location, box_min, box_max)
+    assert not index.remove(-1)
+    assert len(index) == len(items)
+    assert set(index.keys()) == set(items)
+    
+    flat = [(key, *item) for key, item in items.items()]
+    for _ in range(100):
+        point = tuple(rng.uniform(-12, 12) for _ in range(3))
+        assert set(index.query_radius(point, 2.0)) == brute_radius(flat, point, 2.0)
+        box_max = tuple(c + 3.0 for c in point)
+        assert set(index.query_box(point, box_max)) == brute_box(flat, point, box_max)
+    
+    # Emptied cells are dropped
+    for key in list(items):
+        index.remove(key)
+    assert len(index) == 0
+    assert not index._points and not index._boxes and not index._large_boxes
+    print(f"  400 moves and removals, {len(flat)} objects left before clearing")
+
+
+def test_scene_index_rows():
+    print("=" * 60)
+    print("TEST: scene index keeps bounds in sync with its keys")
+    print("=" * 60)
+    
+    rng = np.random.default_rng(4)
+    index = SceneIndex()
+    assert index.dirty
+    low = rng.uniform(-10, 10, (50, 3))
+    index.rebuild(list(range(50)), low, low + 1.0, owner="scene")
+    assert not index.dirty and len(index) == 50
+    
+    expected = {key: (low[key], low[key] + 1.0) for key in range(50)}
+    index.discard([0, 7, 49, 123])
+    for key in (0, 7, 49):
+        del expected[key]
+    moved = rng.uniform(-10, 10, (3, 3))
+    index.update([10, 60, 61], moved, moved + 2.0)
+    for key, row in zip([10, 60, 61], moved):
+        expected[key] = (row, row + 2.0)
+    
+    # Bounds returned earlier are not changed by later updates
+    box_min, box_max = index.bounds()
+    index.update([10], [[100.0, 100.0, 100.0]], [[101.0, 101.0, 101.0]])
+    assert not (box_min == 100.0).any()
+    expected[10] = (np.full(3, 100.0), np.full(3, 101.0))
+    
+    box_min, box_max = index.bounds()
+    keys = index.keys()
+    assert sorted(keys) == sorted(expected) and len(index) == len(expected)
+    assert 7 not in index and 61 in index
+    for key, row_min, row_max in zip(keys, box_min, box_max):
+        assert np.allclose(row_min, expected[key][0])
+        assert np.allclose(row_max, expected[key][1])
+    
+    index.clear()
+    assert index.dirty and len(index) == 0
+    assert index.bounds()[0].shape == (0, 3)
+    print(f"  {len(keys)} rows after removals, moves and inserts")
+
+
+if __name__ == "__main__":
+    test_radius_queries_match_brute_force()
+    test_radius_is_strict()
+    test_box_queries_match_brute_force()
+    test_insert_remove_and_move()
+    test_scene_index_rows()
+    print()
+    print("All spatial hash tests passed")